@@ -0,0 +1,104 @@
+"""Measure recall@k and latency of the ANN job indexes against exact scoring.
+
+Runs against a built embedding store, or a synthetic clustered catalog when no
+store is given, so index parameters can be tuned before the real catalog grows.
+
+Usage:
+  python Scripts/ann_recall_benchmark.py --synthetic 200000
+  python Scripts/ann_recall_benchmark.py --embeddings LLM/job_embeddings --k 20 --nprobe 4 8 16
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from old_LLM.ann_index import ExactIndex, HNSWIndex, IVFIndex, hnswlib  # noqa: E402
+from old_LLM.job_embeddings import JobEmbeddingStore  # noqa: E402
+
+
+def synthetic_store(n: int, dim: int, clusters: int, seed: int) -> JobEmbeddingStore:
+    """Clustered unit vectors — closer to real job embeddings than uniform noise."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    matrix = centers[rng.integers(0, clusters, size=n)] + 0.6 * rng.normal(size=(n, dim)).astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return JobEmbeddingStore(ids=list(range(n)), hashes=[""] * n, matrix=matrix, model="synthetic")
+
+
+def sample_queries(store: JobEmbeddingStore, count: int, seed: int) -> np.ndarray:
+    """Perturbed catalog rows, so queries land near real jobs like profiles do."""
+    rng = np.random.default_rng(seed + 1)
+    rows = np.asarray(store.matrix[rng.choice(len(store), size=count, replace=False)], dtype=np.float32)
+    rows = rows + 0.5 * rng.normal(size=rows.shape).astype(np.float32)
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def evaluate(index, queries: np.ndarray, truth: List[set], k: int) -> Dict[str, float]:
+    latencies = []
+    hits = 0
+    for query, expected in zip(queries, truth):
+        start = time.perf_counter()
+        result = index.top_k(query, k)
+        latencies.append(time.perf_counter() - start)
+        hits += len(expected & {job_id for job_id, _ in result})
+    lat_ms = np.array(latencies) * 1000.0
+    return {
+        "recall_at_k": round(hits / (k * len(queries)), 4),
+        "p50_ms": round(float(np.percentile(lat_ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(lat_ms, 95)), 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--embeddings", default=None, help="Embedding store directory (default: synthetic)")
+    parser.add_argument("--synthetic", type=int, default=100_000, help="Synthetic catalog size")
+    parser.add_argument("--dim", type=int, default=384, help="Synthetic embedding dimension")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    args = parser.parse_args()
+
+    if args.embeddings:
+        store = JobEmbeddingStore.load(args.embeddings)
+    else:
+        store = synthetic_store(args.synthetic, args.dim, clusters=max(8, args.synthetic // 500), seed=args.seed)
+    queries = sample_queries(store, min(args.queries, len(store)), args.seed)
+
+    exact = ExactIndex(store)
+    truth = [{job_id for job_id, _ in exact.top_k(q, args.k)} for q in queries]
+    results = {"n": len(store), "dim": store.dim, "k": args.k, "exact": evaluate(exact, queries, truth, args.k)}
+
+    start = time.perf_counter()
+    ivf = IVFIndex.build(store, seed=args.seed)
+    results["ivf_build_s"] = round(time.perf_counter() - start, 2)
+    for nprobe in args.nprobe:
+        ivf.nprobe = nprobe
+        results[f"ivf_nprobe_{nprobe}"] = evaluate(ivf, queries, truth, args.k)
+
+    if hnswlib is not None:
+        start = time.perf_counter()
+        hnsw = HNSWIndex.build(store)
+        results["hnsw_build_s"] = round(time.perf_counter() - start, 2)
+        results["hnsw"] = evaluate(hnsw, queries, truth, args.k)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""Accuracy-vs-memory report for quantized job embedding formats.
+
+Scores the same queries against float32, float16 and int8 (per-row scale)
+copies of the job matrix and compares each ranking with the float32 baseline.
+Each format's memory and exact-scoring latency are reported relative to
+float32 (mb_vs_float32, latency_vs_float32), so the tradeoff is explicit.
+
+Usage:
+  python Scripts/embedding_quantization_report.py --synthetic 100000
+  python Scripts/embedding_quantization_report.py --embeddings LLM/job_embeddings --k 20
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from old_LLM.ann_index import ExactIndex  # noqa: E402
+from old_LLM.job_embeddings import JobEmbeddingStore, quantize_int8  # noqa: E402
+from Scripts.ann_recall_benchmark import sample_queries, synthetic_store  # noqa: E402
+
+
+def quantized_copy(store: JobEmbeddingStore, dtype: str) -> JobEmbeddingStore:
+    matrix = np.asarray(store.matrix, dtype=np.float32)
+    scales = None
+    if dtype == "float16":
+        matrix = matrix.astype(np.float16)
+    elif dtype == "int8":
+        matrix, scales = quantize_int8(matrix)
+    return JobEmbeddingStore(ids=store.ids, hashes=store.hashes, matrix=matrix, model=store.model, scales=scales)
+
+
+def compare(store: JobEmbeddingStore, baseline: JobEmbeddingStore, queries: np.ndarray, k: int) -> Dict[str, float]:
+    exact, base = ExactIndex(store), ExactIndex(baseline)
+    overlap = top1 = 0
+    score_err = []
+    latencies = []
+    for query in queries:
+        expected = base.top_k(query, k)
+        start = time.perf_counter()
+        result = exact.top_k(query, k)
+        latencies.append(time.perf_counter() - start)
+        overlap += len({job_id for job_id, _ in expected} & {job_id for job_id, _ in result})
+        top1 += result[0][0] == expected[0][0]
+        score_err.append(np.abs(store.scores(query) - baseline.scores(query)).max())
+
+    nbytes = store.matrix.nbytes + (store.scales.nbytes if store.scales is not None else 0)
+    lat_ms = np.array(latencies) * 1000.0
+    return {
+        "mb": round(nbytes / 2**20, 2),
+        "recall_at_k": round(overlap / (k * len(queries)), 4),
+        "top1_agreement": round(top1 / len(queries), 4),
+        "max_abs_score_error": round(float(np.max(score_err)), 5),
+        "p50_ms": round(float(np.percentile(lat_ms, 50)), 3),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--embeddings", default=None, help="Embedding store directory (default: synthetic)")
+    parser.add_argument("--synthetic", type=int, default=50_000, help="Synthetic catalog size")
+    parser.add_argument("--dim", type=int, default=384, help="Synthetic embedding dimension")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    args = parser.parse_args()
+
+    if args.embeddings:
+        baseline = JobEmbeddingStore.load(args.embeddings, mmap=False, dtype="float32")
+    else:
+        baseline = synthetic_store(args.synthetic, args.dim, clusters=max(8, args.synthetic // 500), seed=args.seed)
+    queries = sample_queries(baseline, min(args.queries, len(baseline)), args.seed)
+
+    results = {"n": len(baseline), "dim": baseline.dim, "k": args.k}
+    for dtype in ("float32", "float16", "int8"):
+        results[dtype] = compare(quantized_copy(baseline, dtype), baseline, queries, args.k)
+    for dtype in ("float16", "int8"):
+        results[dtype]["mb_vs_float32"] = round(results[dtype]["mb"] / results["float32"]["mb"], 3)
+        results[dtype]["latency_vs_float32"] = round(results[dtype]["p50_ms"] / results["float32"]["p50_ms"], 2)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""Micro-benchmark resume_parser._normalize_text against the original multi-pass version.
+
+Runs both normalizers over the datasets/<version> resumes (text extracted from
+resumes/*.pdf|docx plus the texts in model_inputs.jsonl), checks the output is
+byte-identical for every document, and reports throughput.
+
+Usage:
+  python Scripts/normalize_benchmark.py
+  python Scripts/normalize_benchmark.py --version v1 --repeat 200
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from job_descr_LLM.user_input_pipeline.resume_parser import _normalize_text  # noqa: E402
+
+
+def normalize_text_reference(text: str) -> str:
+    """The original multi-pass _normalize_text, kept verbatim as the correctness oracle."""
+    replacements = {
+        "?": "-",
+        "·": "-",
+        "": "-",
+        "●": "-",
+        "•": "-",
+        "–": "-",
+        "—": "-",
+        " ": " ",
+        # common PDF extraction artifacts
+        "Š": "-",
+        "Œ": "-",
+    }
+    for src, tgt in replacements.items():
+        text = text.replace(src, tgt)
+
+    # De-hyphenate common PDF line breaks: "co-\nmputer" -> "computer"
+    text = re.sub(r"(\w)-\n(\w)", r"\1\2", text)
+
+    # Join stacked headings like "PROFESSIONAL\nSUMMARY".
+    text = re.sub(r"(?mi)\bPROFESSIONAL\s*\n\s*SUMMARY\b", "PROFESSIONAL SUMMARY", text)
+    text = re.sub(r"(?mi)\bSKILLS\s*\n\s*SUMMARY\b", "SKILLS SUMMARY", text)
+    text = re.sub(r"(?mi)\bWORK\s*\n\s*HISTORY\b", "WORK HISTORY", text)
+
+    # If a heading shares a line with content, split it onto its own line.
+    inline_headings = [
+        "PROFESSIONAL SUMMARY",
+        "SUMMARY",
+        "SKILLS SUMMARY",
+        "SKILLS",
+        "WORK HISTORY",
+        "EXPERIENCE",
+        "PROFESSIONAL EXPERIENCE",
+        "WORK EXPERIENCE",
+        "RELEVANT EXPERIENCE",
+        "EDUCATION",
+        "PROJECTS",
+        "CERTIFICATIONS",
+        "LICENSURE & CERTIFICATIONS",
+        "LICENSES & CERTIFICATIONS",
+        "TECHNICAL SKILLS",
+        "RELEVANT SKILLS",
+        "CLINICAL SKILLS",
+        "TOOLS",
+        "TECHNOLOGIES",
+        "ADDITIONAL INFORMATION",
+        "PUBLICATIONS",
+        "VOLUNTEER EXPERIENCE",
+    ]
+    for heading in inline_headings:
+        if heading == "SKILLS":
+            pattern = re.compile(r"(?im)^(?P<h>SKILLS)(?!\s+SUMMARY)\s+(?=\S)")
+        else:
+            pattern = re.compile(rf"(?im)^(?P<h>{re.escape(heading)})\s+(?=\S)")
+        text = pattern.sub(r"\g<h>\n", text)
+
+    # Collapse whitespace
+    text = re.sub(r"[\t\f\r]+", " ", text)
+    text = re.sub(r" +", " ", text)
+    return text
+
+
+def load_corpus(dataset_root: Path) -> List[str]:
+    texts: List[str] = []
+    resume_dir = dataset_root / "resumes"
+    if resume_dir.exists():
+        from job_descr_LLM.parsers.docx_extract import parse_docx
+        from job_descr_LLM.parsers.pdf_extract import parse_pdf
+
+        for path in sorted(resume_dir.iterdir()):
+            suffix = path.suffix.lower()
+            if suffix == ".pdf":
+                texts.append(parse_pdf(path).text)
+            elif suffix in {".doc", ".docx"}:
+                texts.append(parse_docx(path).text)
+    model_inputs = dataset_root / "model_inputs.jsonl"
+    if model_inputs.exists():
+        with model_inputs.open("r", encoding="utf-8") as fh:
+            texts.extend(json.loads(line).get("text", "") for line in fh if line.strip())
+    return [text for text in texts if text]
+
+
+def throughput(fn, texts: List[str], repeat: int) -> float:
+    total_chars = sum(len(text) for text in texts) * repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return total_chars / (time.perf_counter() - start) / 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--version", default="v1")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    texts = load_corpus(REPO_ROOT / "datasets" / args.version)
+    if not texts:
+        print(f"No resume texts found under datasets/{args.version}")
+        return 1
+
+    mismatches = [i for i, text in enumerate(texts) if _normalize_text(text) != normalize_text_reference(text)]
+    reference = throughput(normalize_text_reference, texts, args.repeat)
+    current = throughput(_normalize_text, texts, args.repeat)
+
+    print(f"documents:          {len(texts)} ({sum(map(len, texts)) / 1024:.0f} KiB)")
+    print(f"byte-identical:     {len(texts) - len(mismatches)}/{len(texts)}")
+    print(f"reference:          {reference:.2f} MB/s")
+    print(f"single-pass:        {current:.2f} MB/s  ({current / reference:.2f}x)")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
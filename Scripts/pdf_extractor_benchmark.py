@@ -0,0 +1,202 @@
+"""Compare PDF extractors and extraction strategies on a resume corpus.
+
+Every PDF is extracted with each extractor (pdfminer, pypdf). The text goes
+through the same clean_text.normalize_text + parse_resume path as the
+dataset pipeline. For each extractor the report gives:
+- latency: mean / p50 / p95 / total, the best of --repeat runs
+- success rate
+- per-field agreement of parse_resume output with the pdfminer parse
+  (the historic default, so "agreement" means "would not change the
+  dataset")
+- when resume_parser_expected.jsonl has hand-labelled fields for the
+  resume, agreement with those
+
+Each strategy (quality-first, fast-first, adaptive) is then replayed from
+the same measurements: the first extractor in its order that yields text
+wins, and every extractor tried is paid for. This shows the cheapest
+strategy that keeps parses unchanged. Results carry the git commit so runs
+can be compared across commits.
+
+Usage:
+  python Scripts/pdf_extractor_benchmark.py
+  python Scripts/pdf_extractor_benchmark.py --resumes-dir datasets/v1/resumes --repeat 3 --output bench/pdf.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from job_descr_LLM.parsers.pdf_extract import PDF_EXTRACTORS, STRATEGIES, extractor_order  # noqa: E402
+from job_descr_LLM.user_input_pipeline.clean_text import normalize_text  # noqa: E402
+from job_descr_LLM.user_input_pipeline.resume_parser import parse_resume  # noqa: E402
+
+BASELINE = "pdfminer"
+FIELDS = [
+    "years_experience",
+    "education",
+    "skills",
+    "experience",
+    "projects",
+    "certifications",
+    "clearances_or_work_auth",
+]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def load_expected(path: Path) -> Dict[str, dict]:
+    if not path.exists():
+        return {}
+    expected = {}
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                row = json.loads(line)
+                if row.get("expected"):
+                    expected[str(row["id"])] = row["expected"]
+    return expected
+
+
+def run_extractor(name: str, path: Path, repeat: int) -> dict:
+    best = float("inf")
+    text, error = "", None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            text = PDF_EXTRACTORS[name](path)
+            error = None
+        except Exception as exc:  # noqa: BLE001
+            text, error = "", str(exc)
+        best = min(best, time.perf_counter() - start)
+    parsed = parse_resume(normalize_text(text)) if text else None
+    return {"seconds": best, "ok": error is None, "parsed": parsed}
+
+
+def agreement(parsed: Optional[dict], reference: Optional[dict], fields: List[str]) -> Dict[str, bool]:
+    if reference is None:
+        return {}
+    return {field: parsed is not None and parsed.get(field) == reference.get(field) for field in fields}
+
+
+def latency_summary(seconds: List[float]) -> dict:
+    ms = np.array(seconds) * 1000.0
+    return {
+        "mean_ms": round(float(ms.mean()), 2),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p95_ms": round(float(np.percentile(ms, 95)), 2),
+        "total_s": round(float(ms.sum()) / 1000.0, 3),
+    }
+
+
+def field_rates(rows: List[Dict[str, bool]]) -> dict:
+    rows = [row for row in rows if row]
+    if not rows:
+        return {}
+    rates = {field: round(sum(row[field] for row in rows) / len(rows), 3) for field in rows[0]}
+    rates["all_fields"] = round(sum(all(row.values()) for row in rows) / len(rows), 3)
+    rates["n"] = len(rows)
+    return rates
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes-dir", default="datasets/v1/resumes")
+    parser.add_argument("--expected", default="datasets/v1/resume_parser_expected.jsonl")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per extractor and file (best is kept)")
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    resumes_dir = Path(args.resumes_dir)
+    if not resumes_dir.is_absolute():
+        resumes_dir = REPO_ROOT / resumes_dir
+    expected_path = Path(args.expected)
+    if not expected_path.is_absolute():
+        expected_path = REPO_ROOT / expected_path
+    expected = load_expected(expected_path)
+    pdfs = sorted(path for path in resumes_dir.iterdir() if path.suffix.lower() == ".pdf")
+    if not pdfs:
+        print(f"[ERROR] No PDFs under {resumes_dir}")
+        return 1
+
+    runs: Dict[str, Dict[str, dict]] = {}
+    for path in pdfs:
+        runs[path.name] = {name: run_extractor(name, path, args.repeat) for name in PDF_EXTRACTORS}
+
+    results = {
+        "commit": git_commit(),
+        "files": len(pdfs),
+        "labelled": sum(path.stem in expected for path in pdfs),
+        "extractors": {},
+        "strategies": {},
+    }
+    for name in PDF_EXTRACTORS:
+        per_file = [runs[path.name][name] for path in pdfs]
+        results["extractors"][name] = {
+            **latency_summary([run["seconds"] for run in per_file]),
+            "success_rate": round(sum(run["ok"] for run in per_file) / len(per_file), 3),
+            "agrees_with_baseline": field_rates(
+                [agreement(runs[p.name][name]["parsed"], runs[p.name][BASELINE]["parsed"], FIELDS) for p in pdfs]
+            ),
+            "agrees_with_expected": field_rates(
+                [agreement(runs[p.name][name]["parsed"], expected.get(p.stem), FIELDS) for p in pdfs]
+            ),
+        }
+
+    for strategy in STRATEGIES:
+        seconds, chosen, vs_baseline, vs_expected = [], [], [], []
+        for path in pdfs:
+            start = time.perf_counter()
+            order = extractor_order(path, strategy)
+            cost = time.perf_counter() - start  # adaptive pays for its page count
+            winner = None
+            for name in order:
+                cost += runs[path.name][name]["seconds"]
+                if runs[path.name][name]["ok"]:
+                    winner = name
+                    break
+            parsed = runs[path.name][winner]["parsed"] if winner else None
+            seconds.append(cost)
+            chosen.append(winner or "none")
+            vs_baseline.append(agreement(parsed, runs[path.name][BASELINE]["parsed"], FIELDS))
+            vs_expected.append(agreement(parsed, expected.get(path.stem), FIELDS))
+        results["strategies"][strategy] = {
+            **latency_summary(seconds),
+            "chosen": {name: chosen.count(name) for name in sorted(set(chosen))},
+            "agrees_with_baseline": field_rates(vs_baseline),
+            "agrees_with_expected": field_rates(vs_expected),
+        }
+
+    for kind in ("extractors", "strategies"):
+        for name, row in results[kind].items():
+            baseline = row["agrees_with_baseline"].get("all_fields", "-")
+            labelled = row["agrees_with_expected"].get("all_fields", "-")
+            print(f"{name:>14}  mean {row['mean_ms']:>8} ms  p95 {row['p95_ms']:>8} ms  "
+                  f"same parse {baseline}  matches expected {labelled}", file=sys.stderr)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
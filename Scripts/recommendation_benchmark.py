@@ -0,0 +1,203 @@
+"""Benchmark the recommendation path against synthetic catalogs of growing size.
+
+For each catalog size the same profile texts go through every stage of
+POST /api/recommendations — prepare text, encode, score, select top-N,
+persist JobRecommendation rows — and each stage reports p50/p95 latency,
+throughput and the tracemalloc peak of one traced run. Process peak RSS is
+recorded after each catalog. Results carry the git commit so runs can be
+compared across commits.
+
+By default profiles are encoded with a deterministic hash encoder so the
+harness runs anywhere and measures everything except model inference; pass
+--model LLM/fine_tuned_resume_model to include the real encoder.
+
+Usage:
+  python Scripts/recommendation_benchmark.py
+  python Scripts/recommendation_benchmark.py --sizes 1000 10000 --queries 50 --output bench/recs.json
+  python Scripts/recommendation_benchmark.py --model LLM/fine_tuned_resume_model --index ivf
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from old_LLM import profile2model  # noqa: E402
+from old_LLM.ann_index import ExactIndex, IVFIndex  # noqa: E402
+from old_LLM.model_registry import register  # noqa: E402
+from Scripts.ann_recall_benchmark import synthetic_store  # noqa: E402
+
+SKILLS = [
+    "Python", "SQL", "React", "TypeScript", "AWS", "Kubernetes", "Excel", "Tableau",
+    "patient care", "accounting", "project management", "machine learning", "Java", "sales",
+]
+
+
+class HashEncoder:
+    """Deterministic stand-in for SentenceTransformer (no inference cost)."""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False):
+        single = isinstance(texts, str)
+        rows = []
+        for text in [texts] if single else texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "little")
+            vec = np.random.default_rng(seed).normal(size=self.dim).astype(np.float32)
+            rows.append(vec / np.linalg.norm(vec))
+        out = np.stack(rows)
+        return out[0] if single else out
+
+
+def synthetic_profiles(count: int, seed: int) -> List[str]:
+    rng = np.random.default_rng(seed)
+    profiles = []
+    for i in range(count):
+        skills = ", ".join(rng.choice(SKILLS, size=5, replace=False))
+        years = int(rng.integers(0, 15))
+        profiles.append(
+            f"Summary:\nCandidate {i} with {years} years of experience.\n\n"
+            f"Skills:\n{skills}\n\nExperience:\n" + "Delivered projects. " * int(rng.integers(5, 60))
+        )
+    return profiles
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 if sys.platform != "darwin" else 1024 * 1024
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1)
+
+
+def time_stage(fn: Callable, inputs: list) -> Dict[str, float]:
+    outputs = []
+    latencies = []
+    for item in inputs:
+        start = time.perf_counter()
+        outputs.append(fn(item))
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(inputs[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    lat_ms = np.array(latencies) * 1000.0
+    return {
+        "p50_ms": round(float(np.percentile(lat_ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(lat_ms, 95)), 3),
+        "per_sec": round(len(inputs) / max(sum(latencies), 1e-9), 1),
+        "alloc_peak_mb": round(peak / 2**20, 2),
+    }, outputs
+
+
+def make_persist(top_n: int):
+    """Writes JobRecommendation rows through the real models into in-memory SQLite."""
+    from flask import Flask
+    from model import JobRecommendation, User, db
+
+    app = Flask("recommendation_benchmark")
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    db.init_app(app)
+    ctx = app.app_context()
+    ctx.push()
+    db.create_all()
+    user = User(email="bench@example.com", password="x", name="Bench", role="job-seeker")
+    db.session.add(user)
+    db.session.commit()
+
+    def persist(top_scores):
+        JobRecommendation.query.filter_by(user_id=user.id).delete()
+        for job_id, score in top_scores[:top_n]:
+            db.session.add(JobRecommendation(user_id=user.id, job_id=int(job_id), score=float(score)))
+        db.session.commit()
+
+    return persist
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=100, help="Profiles per catalog size")
+    parser.add_argument("--top-n", type=int, default=20)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--model", default=None, help="SentenceTransformer path (default: hash encoder)")
+    parser.add_argument("--index", choices=["exact", "ivf"], default="exact")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="Optional JSON file for the results")
+    args = parser.parse_args()
+
+    if args.model:
+        from sentence_transformers import SentenceTransformer
+
+        encoder = SentenceTransformer(args.model)
+        args.dim = encoder.get_sentence_embedding_dimension()
+    else:
+        encoder = HashEncoder(args.dim)
+    # Route profile2model's encoder lookups to the benchmark encoder.
+    register(profile2model.model_path, encoder)
+
+    profiles = synthetic_profiles(args.queries, args.seed)
+    persist = make_persist(args.top_n)
+    results = {
+        "commit": git_commit(),
+        "encoder": args.model or "hash",
+        "index": args.index,
+        "dim": args.dim,
+        "top_n": args.top_n,
+        "queries": args.queries,
+        "catalogs": {},
+    }
+
+    for size in args.sizes:
+        store = synthetic_store(size, args.dim, clusters=max(8, size // 500), seed=args.seed)
+        index = IVFIndex.build(store, seed=args.seed) if args.index == "ivf" else ExactIndex(store)
+        profile2model._job_store = store
+        profile2model._job_index = index
+
+        stages = {}
+        stages["prepare"], prepared = time_stage(profile2model.prepare_profile_text, profiles)
+        stages["encode"], vectors = time_stage(profile2model.encode_profile, prepared)
+        stages["score"], _ = time_stage(store.scores, vectors)
+        stages["select_top_n"], top = time_stage(lambda v: index.top_k(v, args.top_n), vectors)
+        stages["persist"], _ = time_stage(persist, top)
+        stages["end_to_end"], _ = time_stage(
+            lambda text: persist(profile2model.top_mlscores(text, args.top_n)), profiles
+        )
+
+        results["catalogs"][str(size)] = {"stages": stages, "peak_rss_mb": peak_rss_mb()}
+        print(f"{size:>8} jobs  end-to-end p50 {stages['end_to_end']['p50_ms']} ms  "
+              f"p95 {stages['end_to_end']['p95_ms']} ms  rss {peak_rss_mb()} MB", file=sys.stderr)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
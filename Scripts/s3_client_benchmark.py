@@ -0,0 +1,85 @@
+"""Compare a fresh boto3 S3 client per request with the shared client from storage.py.
+
+"Requests" are simulated by calling the client factory N times. Without
+--live only client setup is timed (no network; dummy credentials are used if
+S3_* is unset). With --live each request also issues a HEAD for --key, so the
+TLS handshake a fresh client pays on every request shows up too.
+
+Usage:
+  python Scripts/s3_client_benchmark.py
+  python Scripts/s3_client_benchmark.py --requests 50 --live --key profile/1/abc/resume.pdf
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import storage  # noqa: E402
+
+
+def summary(seconds: List[float]) -> dict:
+    ms = np.array(seconds) * 1000.0
+    return {
+        "mean_ms": round(float(ms.mean()), 2),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p95_ms": round(float(np.percentile(ms, 95)), 2),
+    }
+
+
+def run(factory: Callable, requests: int, live: bool, bucket: str, key: str) -> List[float]:
+    seconds = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client = factory()
+        if live:
+            try:
+                client.head_object(Bucket=bucket, Key=key)
+            except client.exceptions.ClientError:
+                pass  # a 404 still costs the round trip being measured
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--live", action="store_true", help="HEAD an object per request (needs real S3_* env)")
+    parser.add_argument("--key", default="healthcheck", help="Object key for --live")
+    args = parser.parse_args()
+
+    if not args.live:
+        os.environ.setdefault("S3_ENDPOINT_URL", "https://example.r2.cloudflarestorage.com")
+        os.environ.setdefault("S3_ACCESS_KEY_ID", "benchmark")
+        os.environ.setdefault("S3_SECRET_ACCESS_KEY", "benchmark")
+    bucket = os.environ.get("S3_BUCKET_NAME", "")
+
+    settings = storage._settings()[1:]
+    fresh = run(lambda: storage._create_client(*settings), args.requests, args.live, bucket, args.key)
+    storage.reset_client()
+    shared = run(storage.get_s3_client, args.requests, args.live, bucket, args.key)
+
+    results = {
+        "requests": args.requests,
+        "live": args.live,
+        "fresh_client": summary(fresh),
+        "shared_client": summary(shared),
+        "saved_ms_per_request": round((sum(fresh) - sum(shared)) * 1000.0 / args.requests, 2),
+        "stats": storage.client_stats(),
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,3 +1,4 @@
+import click
 from flask import Flask, jsonify, request
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import (
@@ -21,13 +22,11 @@ import re
 import importlib
 import importlib.util
 import sys
-import tempfile
+import time
 import traceback
+from contextlib import contextmanager
 from pathlib import Path
 from urllib.parse import urlparse
-import boto3
-import psycopg2
-from psycopg2.extras import RealDictCursor
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -48,7 +47,9 @@ def _load_resume_parser():
         raise ImportError("Unable to load resume_parser module")
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
-    return module.parse_resume
+    # Reuses parses from the on-disk cache only when RESUME_PARSE_CACHE is set;
+    # it is off by default because entries hold resume PII (see parse_cache).
+    return module.cached_parse_resume
 
 parse_resume = _load_resume_parser()
 
@@ -91,9 +92,23 @@ def _is_valid_linkedin_url(value: str) -> bool:
 
 from flask_migrate import Migrate
 
-from model import AuditLog, IntakeSubmission, JobRecommendation, ResumeParseCorrection, User, db
+import audit_sink
+import background
+import db_pool
+from email_queue import drain_due, enqueue_email, purge_finished
+from email_utils import early_access_modal_message, intake_notification_message, verification_message
+from storage import client_stats as s3_client_stats, get_s3_client
+
+from model import (
+    IntakeSubmission,
+    JobRecommendation,
+    RecommendationJob,
+    ResumeIngestJob,
+    ResumeParseCorrection,
+    User,
+    db,
+)
 from datetime import timedelta
-import pandas as pd
 
 #from LLM.profile2model import jobs_path
 
@@ -158,6 +173,7 @@ CORS(
 )
 
 app.config["SQLALCHEMY_DATABASE_URI"] = os.environ["DATABASE_URL"]
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = db_pool.engine_options(os.environ["DATABASE_URL"])
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
 
@@ -201,6 +217,12 @@ jwt = JWTManager(app)
 limiter = init_rate_limiter(app)
 
 
+@app.before_request
+def _start_background_sweeps():
+    # Recovery sweeps for queued work (see background.register_sweep), one thread per worker.
+    background.start_sweeps(app)
+
+
 # Early access modal endpoint (no resume upload)
 @app.post("/api/early-access-request")
 def early_access_request():
@@ -218,17 +240,16 @@ def early_access_request():
 
     # Send notification email to info@solverah.com
     try:
-        from email_utils import send_early_access_modal_notification
-        send_early_access_modal_notification(
+        enqueue_email(app, early_access_modal_message(
             first_name=first_name,
             last_name=last_name,
             email=email,
             phone=phone,
             preferred_contact=preferred_contact,
             career_journey=career_journey,
-        )
+        ))
     except Exception as e:
-        app.logger.error(f"Failed to send early access modal notification: {e}")
+        app.logger.error(f"Failed to queue early access modal notification: {e}")
         return jsonify({"error": "Failed to send notification."}), 500
     return jsonify({"ok": True})
 
@@ -236,20 +257,29 @@ def early_access_request():
 MAX_LOGIN_ATTEMPTS = int(os.environ.get("MAX_LOGIN_ATTEMPTS", "5"))
 LOGIN_LOCKOUT_MINUTES = int(os.environ.get("LOGIN_LOCKOUT_MINUTES", "15"))
 
-# Helper function to get a new DB connection
-def get_db_conn():
-    return psycopg2.connect(os.environ["DATABASE_URL"], cursor_factory=RealDictCursor)
-
-# Helper function to get S3 client
-def get_s3_client():
-    # Cloudflare R2 is S3-compatible
-    return boto3.client(
-        "s3",
-        endpoint_url=os.environ["S3_ENDPOINT_URL"],
-        aws_access_key_id=os.environ["S3_ACCESS_KEY_ID"],
-        aws_secret_access_key=os.environ["S3_SECRET_ACCESS_KEY"],
-        region_name=os.environ.get("S3_REGION", "auto"),
-    )
+
+@contextmanager
+def pooled_db_cursor():
+    """Cursor for raw SQL on a connection borrowed from the SQLAlchemy pool.
+
+    Commits when the block succeeds, rolls back when it raises, and always
+    returns the connection to the pool.
+    """
+    start = time.perf_counter()
+    conn = db.engine.raw_connection()
+    db_pool.record_raw_checkout(time.perf_counter() - start)
+    try:
+        cur = conn.cursor()
+        try:
+            yield cur
+        finally:
+            cur.close()
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
 
 
 def _module_available(module_name: str) -> bool:
@@ -371,45 +401,40 @@ def _coerce_insight_payload(payload: dict, quiz_group: str, fallback_quizzes: li
     return {"overallInsight": overall_insight, "insights": normalized}
 
 
-def _extract_resume_text(file_path: Path, mime: str) -> str:
-    if mime == "application/pdf":
-        if not _module_available("pdfminer.high_level"):
-            return ""
-        extract_text = importlib.import_module("pdfminer.high_level").extract_text
-        return extract_text(str(file_path)) or ""
-
-    if mime == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        if not _module_available("docx"):
-            return ""
-        docx = importlib.import_module("docx")
-        doc = docx.Document(str(file_path))
-        return "\n".join(p.text for p in doc.paragraphs if p.text).strip()
-
-    return ""
-
-
-def _build_profile_from_intake(intake: IntakeSubmission) -> dict:
-    resume_text = ""
+def _extract_resume_text(raw_bytes: bytes, mime: str) -> str:
+    """Extract resume text straight from the uploaded bytes (no temp file)."""
     try:
-        s3 = get_s3_client()
-        bucket = os.environ["S3_BUCKET_NAME"]
-        obj = s3.get_object(Bucket=bucket, Key=intake.resume_key)
-        raw_bytes = obj["Body"].read()
-
-        suffix = Path(intake.resume_key).suffix or ".bin"
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            tmp_file.write(raw_bytes)
-            temp_path = Path(tmp_file.name)
-
-        resume_text = _extract_resume_text(temp_path, intake.resume_mime)
-    except Exception:
-        resume_text = ""
-    finally:
-        if "temp_path" in locals() and temp_path.exists():
-            temp_path.unlink()
+        in_memory = importlib.import_module("job_descr_LLM.parsers.in_memory")
+    except ImportError:
+        app.logger.exception("Resume text extraction is unavailable")
+        return ""
+    if mime not in in_memory.MIME_PARSERS:
+        return ""
+    text = in_memory.parse_document_bytes(raw_bytes, mime=mime).text
+    if mime == in_memory.DOCX_MIME:
+        return "\n".join(line for line in text.split("\n") if line).strip()
+    return text
+
+
+def _parse_stored_resume(resume_key: str, mime: str) -> dict:
+    """Downloads a stored resume, extracts its text and parses it.
+
+    Raises when the download or extraction fails, so callers can tell a
+    failed parse from a resume with nothing to parse.
+    """
+    s3 = get_s3_client()
+    bucket = os.environ["S3_BUCKET_NAME"]
+    obj = s3.get_object(Bucket=bucket, Key=resume_key)
+    raw_bytes = obj["Body"].read()
+    resume_text = _extract_resume_text(raw_bytes, mime)
+    if not resume_text:
+        raise ValueError("No text extracted from resume")
+    return parse_resume(resume_text)
 
-    parsed = parse_resume(resume_text) if resume_text else {}
 
+def _resume_profile_fields(parsed: dict) -> dict:
+    """Profile experience / education / skills (plus the parsed years of
+    experience and certifications used for matching) from a parse_resume result."""
     experience_entries = []
     for idx, exp in enumerate(parsed.get("experience", []) if isinstance(parsed, dict) else []):
         bullets = exp.get("impact_bullets") or []
@@ -462,6 +487,29 @@ def _build_profile_from_intake(intake: IntakeSubmission) -> dict:
         skills = [skills]
     skills = [skill for skill in skills if skill]
 
+    fields = {
+        "experience": experience_entries,
+        "education": education_entries,
+        "skills": skills,
+    }
+    if isinstance(parsed, dict):
+        if isinstance(parsed.get("years_experience"), (int, float)):
+            fields["yearsExperience"] = parsed["years_experience"]
+        certifications = parsed.get("certifications") or []
+        fields["certifications"] = [str(cert) for cert in certifications if cert]
+    return fields
+
+
+def _parse_stored_resume_or_empty(resume_key: str, mime: str) -> dict:
+    try:
+        return _parse_stored_resume(resume_key, mime)
+    except Exception:
+        return {}
+
+
+def _build_profile_from_intake(intake: IntakeSubmission, parse: bool = True) -> dict:
+    """Profile for an intake submission; parse=False leaves the resume fields
+    to a resume ingest job (see _enqueue_resume_ingest)."""
     profile = default_profile(
         email=intake.email,
         name=f"{intake.first_name} {intake.last_name}".strip(),
@@ -476,9 +524,6 @@ def _build_profile_from_intake(intake: IntakeSubmission) -> dict:
             "location": intake.state or "",
             "primaryLocation": intake.state or "",
             "linkedinUrl": intake.linkedin_url or "",
-            "experience": experience_entries,
-            "education": education_entries,
-            "skills": skills,
             "uploadedResume": {
                 "name": Path(intake.resume_key).name,
                 "size": intake.resume_size_bytes,
@@ -487,6 +532,8 @@ def _build_profile_from_intake(intake: IntakeSubmission) -> dict:
             "resumeKey": intake.resume_key,
         }
     )
+    if parse:
+        profile.update(_resume_profile_fields(_parse_stored_resume_or_empty(intake.resume_key, intake.resume_mime)))
 
     return profile
 
@@ -496,105 +543,142 @@ def _build_profile_from_resume_key(
     resume_mime: str,
     resume_size_bytes: int,
     resume_name: str | None = None,
+    parse: bool = True,
 ) -> dict:
-    resume_text = ""
-    try:
-        s3 = get_s3_client()
-        bucket = os.environ["S3_BUCKET_NAME"]
-        obj = s3.get_object(Bucket=bucket, Key=resume_key)
-        raw_bytes = obj["Body"].read()
+    filename = resume_name.strip() if resume_name else Path(resume_key).name
 
-        suffix = Path(resume_key).suffix or ".bin"
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            tmp_file.write(raw_bytes)
-            temp_path = Path(tmp_file.name)
+    profile = {}
+    if parse:
+        profile.update(_resume_profile_fields(_parse_stored_resume_or_empty(resume_key, resume_mime)))
+    profile.update(
+        {
+            "uploadedResume": {
+                "name": filename,
+                "size": resume_size_bytes,
+                "type": resume_mime,
+            },
+            "resumeKey": resume_key,
+        }
+    )
+    return profile
 
-        resume_text = _extract_resume_text(temp_path, resume_mime)
-    except Exception:
-        resume_text = ""
-    finally:
-        if "temp_path" in locals() and temp_path.exists():
-            temp_path.unlink()
+# Off by default: the profile page does not poll parseStatus yet, and a
+# profile save while the job runs would race it for profile_data.
+RESUME_INGEST_ASYNC = os.getenv("RESUME_INGEST_ASYNC", "0") == "1"
+# A queued or running ingest job older than this is queued again by the
+# recovery sweep (its worker died or restarted).
+RESUME_INGEST_STALE_SECONDS = int(os.getenv("RESUME_INGEST_STALE_SECONDS", "900"))
 
-    parsed = parse_resume(resume_text) if resume_text else {}
 
-    experience_entries = []
-    for idx, exp in enumerate(parsed.get("experience", []) if isinstance(parsed, dict) else []):
-        bullets = exp.get("impact_bullets") or []
-        description = "\n".join(f"- {bullet}" for bullet in bullets) if bullets else ""
-        experience_entries.append(
-            {
-                "id": idx + 1,
-                "company": exp.get("company", ""),
-                "position": exp.get("title", ""),
-                "startDate": "",
-                "endDate": exp.get("duration", ""),
-                "description": description,
-            }
-        )
+def _utcnow():
+    # Naive UTC, matching how the job DateTime columns are stored and compared.
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
 
-    education_entries = []
-    education_structured = parsed.get("education_entries") if isinstance(parsed, dict) else None
-    if isinstance(education_structured, list) and education_structured:
-        for idx, entry in enumerate(education_structured):
-            if not isinstance(entry, dict):
-                continue
-            education_entries.append(
-                {
-                    "id": idx + 1,
-                    "institution": entry.get("institution", ""),
-                    "degree": entry.get("degree", ""),
-                    "startDate": entry.get("startDate", ""),
-                    "endDate": entry.get("endDate", ""),
-                    "gpa": entry.get("gpa", ""),
-                    "description": "",
-                }
-            )
-    else:
-        education_raw = parsed.get("education", "") if isinstance(parsed, dict) else ""
-        for idx, line in enumerate([item.strip() for item in str(education_raw).splitlines() if item.strip()]):
-            education_entries.append(
-                {
-                    "id": idx + 1,
-                    "institution": "",
-                    "degree": line,
-                    "startDate": "",
-                    "endDate": "",
-                    "gpa": "",
-                    "description": "",
-                }
-            )
-
-    skills = parsed.get("skills", []) if isinstance(parsed, dict) else []
-    if isinstance(skills, str):
-        skills = [skills]
-    skills = [skill for skill in skills if skill]
-
-    filename = resume_name.strip() if resume_name else Path(resume_key).name
 
+def _parsed_resume_snapshot(resume_key: str, fields: dict) -> dict:
+    # A snapshot of what the parser produced so we can later diff against
+    # any edits the user makes — used to build parser improvement training data.
     return {
-        "experience": experience_entries,
-        "education": education_entries,
-        "skills": skills,
-        "uploadedResume": {
-            "name": filename,
-            "size": resume_size_bytes,
-            "type": resume_mime,
-        },
         "resumeKey": resume_key,
+        "parsedAt": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "experience": fields.get("experience", []),
+        "education": fields.get("education", []),
+        "skills": fields.get("skills", []),
     }
 
+
+def _enqueue_resume_ingest(user, resume_key, resume_mime, record_snapshot=False):
+    """Queues download -> extract -> parse of a stored resume off the request path.
+
+    The profile is marked parseStatus "pending" here; the job fills in the
+    parsed fields and sets parseStatus to "done" or "failed". Commits.
+    """
+    job = ResumeIngestJob(
+        id=str(uuid.uuid4()),
+        user_id=user.id,
+        resume_key=resume_key,
+        resume_mime=resume_mime,
+        record_snapshot=record_snapshot,
+        status="queued",
+    )
+    db.session.add(job)
+    user.profile_data = {**(user.profile_data or {}), "parseStatus": "pending"}
+    db.session.commit()
+    background.submit(app, _run_resume_ingest_job, job.id)
+    return job
+
+
+def _run_resume_ingest_job(job_id):
+    # Claim the row so a duplicate submission or a recovery sweep does not run it twice.
+    claimed = (
+        ResumeIngestJob.query
+        .filter_by(id=job_id, status="queued")
+        .update({"status": "running", "started_at": _utcnow()}, synchronize_session=False)
+    )
+    db.session.commit()
+    if not claimed:
+        return
+    job = db.session.get(ResumeIngestJob, job_id)
+
+    fields = None
+    try:
+        fields = _resume_profile_fields(_parse_stored_resume(job.resume_key, job.resume_mime))
+    except Exception as e:
+        app.logger.exception(f"Resume ingest job {job_id} failed")
+        job.status = "failed"
+        job.error = str(e)[:500]
+    else:
+        job.status = "done"
+    job.finished_at = _utcnow()
+
+    user = db.session.get(User, job.user_id)
+    profile = dict(user.profile_data or {}) if user else {}
+    # A newer upload replaced this resume while it was parsing; leave the profile to its job.
+    if user is not None and profile.get("resumeKey") == job.resume_key:
+        if fields is not None:
+            profile.update(fields)
+            if job.record_snapshot:
+                profile["_parsedResumeSnapshot"] = _parsed_resume_snapshot(job.resume_key, fields)
+        profile["parseStatus"] = job.status
+        user.profile_data = profile
+    db.session.commit()
+
+
+@background.register_sweep
+def _requeue_stale_resume_ingest_jobs():
+    """Resubmits resume ingest jobs left queued or running past the stale age,
+    so a profile cannot stay at parseStatus "pending" after a worker restart."""
+    cutoff = _utcnow() - datetime.timedelta(seconds=RESUME_INGEST_STALE_SECONDS)
+    ResumeIngestJob.query.filter(
+        ResumeIngestJob.status == "running", ResumeIngestJob.started_at < cutoff
+    ).update({"status": "queued"}, synchronize_session=False)
+    db.session.commit()
+    stale = (
+        ResumeIngestJob.query
+        .filter(
+            ResumeIngestJob.status == "queued",
+            db.or_(ResumeIngestJob.created_at < cutoff, ResumeIngestJob.started_at < cutoff),
+        )
+        .all()
+    )
+    for job in stale:
+        background.submit(app, _run_resume_ingest_job, job.id)
+    return len(stale)
+
+
 # Helper to log audit events
 def log_audit_event(action, actor_user_id, resource, metadata=None):
-    audit = AuditLog(
+    # Buffered and written in batches by audit_sink, so callers no longer need
+    # a commit of their own for the audit row.
+    audit_sink.record(
+        app,
         actor_user_id=actor_user_id,
         action=action,
         resource=resource,
         ip_address=request.remote_addr,
         user_agent=request.headers.get("User-Agent", ""),
-        event_metadata=metadata or {},
+        metadata=metadata or {},
     )
-    db.session.add(audit)
 
 # Endpoint to get presigned upload URL
 @limiter.limit("10 per minute")
@@ -724,41 +808,34 @@ def finalize():
         return jsonify({"error": "Upload not found in storage"}), 400
 
     # Insert record
-    conn = get_db_conn()
-    try:
-        with conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO intake_submissions
-                    (id, first_name, last_name, email, state, phone, linkedin_url, portfolio_url,
-                    resume_key, resume_mime, resume_size_bytes, status)
-                    VALUES
-                    (%s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, 'uploaded')
-                    """,
-                    (
-                        submission_id,
-                        first_name,
-                        last_name,
-                        email,
-                        state,
-                        phone or None,
-                        linkedin_url or None,
-                        portfolio_url or None,
-                        object_key,
-                        mime,
-                        size,
-                    ),
-                )
-
-    finally:
-        conn.close()
+    with pooled_db_cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO intake_submissions
+            (id, first_name, last_name, email, state, phone, linkedin_url, portfolio_url,
+            resume_key, resume_mime, resume_size_bytes, status)
+            VALUES
+            (%s, %s, %s, %s, %s, %s, %s, %s,
+            %s, %s, %s, 'uploaded')
+            """,
+            (
+                submission_id,
+                first_name,
+                last_name,
+                email,
+                state,
+                phone or None,
+                linkedin_url or None,
+                portfolio_url or None,
+                object_key,
+                mime,
+                size,
+            ),
+        )
 
     # Send notification email to info@solverah.com
     try:
-        from email_utils import send_intake_notification
-        send_intake_notification(
+        enqueue_email(app, intake_notification_message(
             first_name=first_name,
             last_name=last_name,
             email=email,
@@ -769,9 +846,9 @@ def finalize():
             object_key=object_key,
             mime=mime,
             size=size,
-        )
+        ))
     except Exception as e:
-        app.logger.error(f"Failed to send intake notification to info@solverah.com: {e}")
+        app.logger.error(f"Failed to queue intake notification to info@solverah.com: {e}")
     return jsonify({"ok": True})
 
 
@@ -810,7 +887,7 @@ def intake_create_account():
     token = uuid.uuid4().hex
     hashed_pw = bcrypt.generate_password_hash(password).decode("utf-8")
     full_name = f"{intake.first_name} {intake.last_name}".strip()
-    profile_data = _build_profile_from_intake(intake)
+    profile_data = _build_profile_from_intake(intake, parse=not RESUME_INGEST_ASYNC)
 
     new_user = User(
         email=intake.email.lower(),
@@ -826,6 +903,8 @@ def intake_create_account():
 
     intake.status = "account_created"
     db.session.commit()
+    if RESUME_INGEST_ASYNC:
+        _enqueue_resume_ingest(new_user, intake.resume_key, intake.resume_mime)
 
     # Send confirmation email (best-effort)
     try:
@@ -893,7 +972,7 @@ def intake_sign_in():
     if not getattr(user, "email_confirmed", False):
         return jsonify({"error": "Email not confirmed. Please confirm your email before signing in."}), 403
 
-    intake_profile = _build_profile_from_intake(intake)
+    intake_profile = _build_profile_from_intake(intake, parse=not RESUME_INGEST_ASYNC)
     existing_profile = user.profile_data or {}
     merged_profile = {**existing_profile, **intake_profile}
     user.profile_data = merged_profile
@@ -910,6 +989,8 @@ def intake_sign_in():
         metadata={"submission_id": intake.id, "user_id": user.id},
     )
     db.session.commit()
+    if RESUME_INGEST_ASYNC:
+        _enqueue_resume_ingest(user, intake.resume_key, intake.resume_mime)
 
     access_token = create_access_token(identity=user.email)
     resp = jsonify({
@@ -1089,8 +1170,31 @@ def resend_confirmation():
     return jsonify({"message": "confirmation_sent"}), 200
 
 
+def send_confirmation_email(to_email, code):
+    """Queues the verification code email; email_queue delivers it off the request."""
+    enqueue_email(app, verification_message(to_email, code))
+
+
+@background.register_sweep
+def _sweep_outbound_emails():
+    # Sends emails whose delivery was lost with a restarted worker, then purges old ones.
+    drain_due(app)
+    purge_finished()
+
+
+@app.cli.command("drain-emails")
+def drain_emails_command():
+    """Deliver queued emails that are due (e.g. after a restart)."""
+    click.echo(f"Tried {drain_due(app)} queued emails")
+
+
+@app.cli.command("purge-emails")
+def purge_emails_command():
+    """Delete sent and failed emails past EMAIL_RETENTION_HOURS."""
+    click.echo(f"Purged {purge_finished()} finished emails")
+
+
 #Registering new user
-from email_utils import send_confirmation_email
 
 @limiter.limit("5 per minute")
 @app.route("/api/register", methods=["POST"])
@@ -1163,7 +1267,8 @@ def profile():
             resource="profile",
             metadata={"target_user_id": user.id},
         )
-        db.session.commit()
+        if not audit_sink.buffering_enabled():
+            db.session.commit()
         return jsonify({
             "id": user.id,
             "email": user.email,
@@ -1250,7 +1355,7 @@ def profile():
                     ).first()
                     if correction:
                         correction.corrected_value = new_val
-                        correction.updated_at = datetime.datetime.utcnow()
+                        correction.updated_at = datetime.datetime.now(datetime.timezone.utc)
                     else:
                         correction = ResumeParseCorrection(
                             user_id=user.id,
@@ -1566,20 +1671,22 @@ def profile_resume_finalize():
         resume_mime=mime,
         resume_size_bytes=size,
         resume_name=name or None,
+        parse=not RESUME_INGEST_ASYNC,
     )
 
     existing = user.profile_data or {}
     merged = {**existing, **profile_updates}
 
-    # Store a snapshot of what the parser produced so we can later diff against
-    # any edits the user makes — used to build parser improvement training data.
-    merged["_parsedResumeSnapshot"] = {
-        "resumeKey": object_key,
-        "parsedAt": datetime.datetime.utcnow().isoformat(),
-        "experience": profile_updates.get("experience", []),
-        "education": profile_updates.get("education", []),
-        "skills": profile_updates.get("skills", []),
-    }
+    if RESUME_INGEST_ASYNC:
+        user.profile_data = merged
+        job = _enqueue_resume_ingest(user, object_key, mime, record_snapshot=True)
+        return jsonify({
+            "message": "Resume queued for processing",
+            "jobId": job.id,
+            "profileData": user.profile_data,
+        }), 202
+
+    merged["_parsedResumeSnapshot"] = _parsed_resume_snapshot(object_key, profile_updates)
 
     user.profile_data = merged
     db.session.commit()
@@ -1628,34 +1735,204 @@ def generate_recommendations():
     if not ML_ENABLED:
         return jsonify({"error": "Recommendations disabled for demo"}), 503
     
-    from LLM.profile2model import sorted_mlscores
     #till here
-    
-    scores = sorted_mlscores(profile_text)  # returns list of (job_id, score, job_text)
-
-    # Keep only the top N
-    TOP_N = 20
-    top_scores = scores[:TOP_N]
 
-    # Optionally clear old recommendations for this user
-    JobRecommendation.query.filter_by(user_id=user.id).delete()
+    if RECOMMENDATIONS_ASYNC or data.get("async") is True:
+        job = _enqueue_recommendation_job(user, profile_text)
+        return jsonify({"jobId": job.id, "status": job.status}), 202
 
-    # Insert new ones
-    for job_id, score, _job_text in top_scores:
-        rec = JobRecommendation(user_id=user.id, job_id=job_id, score=score)
-        db.session.add(rec)
-
-    db.session.commit()
+    top_scores = _score_recommendations(user.id, profile_text)
 
     # Also return them for immediate use on the frontend
     return jsonify({
         "recommendations": [
-            {"job_id": job_id, "score": score}
-            for job_id, score, _ in top_scores
+            {"job_id": int(job_id), "score": score}
+            for job_id, score in top_scores
         ]
     })
 
 
+RECOMMENDATIONS_ASYNC = os.getenv("RECOMMENDATIONS_ASYNC", "0") == "1"
+# Keep only the top N
+RECOMMENDATIONS_TOP_N = 20
+
+
+def _score_recommendations(user_id, profile_text):
+    """Scores a profile and stores the top N as the user's JobRecommendation rows.
+
+    Returns the list of (job_id, score), best first. Only rescored when the
+    profile or the job catalog changed since the stored rows were written.
+    """
+    from LLM.profile2model import refresh_top_mlscores
+
+    existing = (
+        JobRecommendation.query
+        .filter_by(user_id=user_id)
+        .order_by(JobRecommendation.score.desc())
+        .all()
+    )
+    previous = None
+    if existing:
+        previous = {
+            "profile_fingerprint": existing[0].profile_fingerprint,
+            "catalog_size": existing[0].catalog_size,
+            "catalog_fingerprint": existing[0].catalog_fingerprint,
+            "scores": [(rec.job_id, rec.score) for rec in existing],
+        }
+
+    user = db.session.get(User, user_id)
+    candidate_profile = _candidate_profile(user.profile_data if user else None)
+    top_scores, state, status = refresh_top_mlscores(
+        profile_text, RECOMMENDATIONS_TOP_N, previous, candidate_profile=candidate_profile
+    )
+
+    if status != "unchanged":
+        # Replace old recommendations for this user
+        JobRecommendation.query.filter_by(user_id=user_id).delete()
+
+        for job_id, score in top_scores:
+            rec = JobRecommendation(user_id=user_id, job_id=int(job_id), score=score, **state)
+            db.session.add(rec)
+
+        db.session.commit()
+
+    return top_scores
+
+
+def _candidate_profile(profile_data):
+    """Structured fields from a saved profile, for skill recall and compare_profiles.
+
+    years_experience and certifications are only included when the profile
+    has them (from a parsed resume), so hybrid ranking can leave those match
+    dimensions out instead of scoring the candidate as having none.
+    """
+    profile_data = profile_data if isinstance(profile_data, dict) else {}
+    skills = profile_data.get("skills") or []
+    if isinstance(skills, str):
+        skills = [skills]
+    experience = [exp for exp in profile_data.get("experience") or [] if isinstance(exp, dict)]
+    education = [edu for edu in profile_data.get("education") or [] if isinstance(edu, dict)]
+    candidate = {
+        "skills": [str(skill) for skill in skills if skill],
+        "titles": [exp.get("position", "") for exp in experience if exp.get("position")],
+        "education": " ".join(
+            f"{edu.get('degree', '')} {edu.get('institution', '')}".strip() for edu in education
+        ),
+    }
+    years = profile_data.get("yearsExperience")
+    if isinstance(years, (int, float)) and not isinstance(years, bool):
+        candidate["years_experience"] = float(years)
+    certifications = profile_data.get("certifications")
+    if isinstance(certifications, list):
+        candidate["certifications"] = [str(cert) for cert in certifications if cert]
+    return candidate
+
+
+# A queued or running job older than this is taken to belong to a worker that
+# died or restarted, and is queued again by the recovery sweep.
+RECOMMENDATION_JOB_STALE_SECONDS = int(os.getenv("RECOMMENDATION_JOB_STALE_SECONDS", "900"))
+
+
+def _latest_recommendation_job(user_id):
+    return (
+        RecommendationJob.query
+        .filter_by(user_id=user_id)
+        .order_by(RecommendationJob.created_at.desc(), RecommendationJob.id.desc())
+        .first()
+    )
+
+
+def _enqueue_recommendation_job(user, profile_text):
+    """Records a queued scoring run and hands it to the background pool.
+
+    A run that is still queued for this user is reused (with the newer
+    profile) instead of stacking up duplicate work. The job is submitted
+    either way: the runner's claim makes extra submissions no-ops, and it
+    rescues a queued row whose earlier submission was lost.
+    """
+    job = _latest_recommendation_job(user.id)
+    reused = False
+    if job is not None and job.status == "queued":
+        # Only while still queued: once a runner has claimed the job it has
+        # read the old profile, so the new one needs a run of its own.
+        reused = bool(
+            RecommendationJob.query
+            .filter_by(id=job.id, status="queued")
+            .update({"profile_text": profile_text}, synchronize_session=False)
+        )
+    if not reused:
+        job = RecommendationJob(id=str(uuid.uuid4()), user_id=user.id, status="queued", profile_text=profile_text)
+        db.session.add(job)
+    db.session.commit()
+    background.submit(app, _run_recommendation_job, job.id)
+    return job
+
+
+def _run_recommendation_job(job_id):
+    # Claim the row so a duplicate submission or a recovery sweep does not run it twice.
+    claimed = (
+        RecommendationJob.query
+        .filter_by(id=job_id, status="queued")
+        .update({"status": "running", "started_at": _utcnow()}, synchronize_session=False)
+    )
+    db.session.commit()
+    if not claimed:
+        return
+    job = db.session.get(RecommendationJob, job_id)
+
+    try:
+        _score_recommendations(job.user_id, job.profile_text)
+    except Exception as e:
+        db.session.rollback()
+        app.logger.exception(f"Recommendation job {job_id} failed")
+        job.status = "failed"
+        job.error = str(e)[:500]
+    else:
+        job.status = "done"
+    job.finished_at = _utcnow()
+    db.session.commit()
+
+
+@background.register_sweep
+def _requeue_stale_recommendation_jobs():
+    """Resubmits recommendation jobs left queued or running past the stale age."""
+    cutoff = _utcnow() - datetime.timedelta(seconds=RECOMMENDATION_JOB_STALE_SECONDS)
+    RecommendationJob.query.filter(
+        RecommendationJob.status == "running", RecommendationJob.started_at < cutoff
+    ).update({"status": "queued"}, synchronize_session=False)
+    db.session.commit()
+    stale = (
+        RecommendationJob.query
+        .filter(
+            RecommendationJob.status == "queued",
+            db.or_(RecommendationJob.created_at < cutoff, RecommendationJob.started_at < cutoff),
+        )
+        .all()
+    )
+    for job in stale:
+        background.submit(app, _run_recommendation_job, job.id)
+    return len(stale)
+
+
+def _recommendation_job_payload(job):
+    if job is None:
+        return {"status": "none", "jobId": None}
+    payload = {"status": job.status, "jobId": job.id}
+    if job.status == "failed":
+        payload["error"] = "Scoring failed"
+    return payload
+
+
+@app.get("/api/recommendations/jobs/<job_id>")
+@jwt_required()
+def get_recommendation_job(job_id):
+    current_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_email).first_or_404()
+
+    job = RecommendationJob.query.filter_by(id=job_id, user_id=user.id).first_or_404()
+    return jsonify(_recommendation_job_payload(job))
+
+
 @app.route("/api/recommendations", methods=["GET"])
 @jwt_required()
 def get_recommendations():
@@ -1675,22 +1952,21 @@ def get_recommendations():
         .all()
     )
 
+    # Status of the latest queued/background scoring run, so the client knows
+    # whether these results are final or a newer set is still being computed
+    job_status = _recommendation_job_payload(_latest_recommendation_job(user.id))
+
     if not recs:
-        return jsonify({"recommendations": []})
+        return jsonify({"recommendations": [], **job_status})
 
-    # Load the jobs CSV and index by ID
+    # Look up just these jobs in the cached catalog (reloaded only when the CSV changes)
     
     #removes these lines when demo is done
     from LLM.profile2model import jobs_path
-    jobs_df = pd.read_csv(jobs_path)
+    from LLM.job_catalog import get_catalog
     #till here
 
-    jobs_df = pd.read_csv(jobs_path)
-    jobs_by_id = {
-        int(row["ID"]): row
-        for _, row in jobs_df.iterrows()
-        if "ID" in row
-    }
+    jobs_by_id = get_catalog(jobs_path).get_many(rec.job_id for rec in recs)
 
     results = []
     for rec in recs:
@@ -1699,22 +1975,59 @@ def get_recommendations():
             continue
 
         # Build a job object matching what Feed.tsx currently uses :contentReference[oaicite:7]{index=7}
-        job_obj = {
-            "ID": rec.job_id,
-            "Title": row.get("Title", ""),
-            "Company": row.get("Company", ""),
-            "Location": row.get("Location", ""),
-            "EmploymentType": row.get("EmploymentType", ""),
-            "DatePosted": row.get("DatePosted", ""),
-            "Remote": row.get("Remote", ""),
-            "RoleDescription": row.get("RoleDescription", ""),
-            "Experience": row.get("Experience", ""),
-            "Link": row.get("Link", ""),
-            "score": rec.score,
-        }
+        job_obj = {"ID": rec.job_id, **row, "score": rec.score}
         results.append(job_obj)
 
-    return jsonify({"recommendations": results})
+    return jsonify({"recommendations": results, **job_status})
+
+
+# Internal process metrics. Hidden (404) unless METRICS_ENABLED=1, and then
+# only served to the accounts listed in METRICS_ALLOWED_EMAILS.
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0") == "1"
+METRICS_ALLOWED_EMAILS = {
+    email.strip().lower() for email in os.getenv("METRICS_ALLOWED_EMAILS", "").split(",") if email.strip()
+}
+
+
+def _metrics_denied():
+    if not METRICS_ENABLED or (get_jwt_identity() or "").lower() not in METRICS_ALLOWED_EMAILS:
+        return jsonify({"error": "Not found"}), 404
+    return None
+
+
+@app.get("/api/metrics/ml")
+@jwt_required()
+def ml_metrics():
+    denied = _metrics_denied()
+    if denied:
+        return denied
+    if not ML_ENABLED:
+        return jsonify({"models": {}}), 200
+
+    from LLM.model_registry import model_stats
+
+    # load_seconds per model; "inherited" means this worker got it from the pre-fork warm-up
+    return jsonify({"pid": os.getpid(), "models": model_stats()}), 200
+
+
+@app.get("/api/metrics/storage")
+@jwt_required()
+def storage_metrics():
+    denied = _metrics_denied()
+    if denied:
+        return denied
+    # S3 client builds vs reuses in this worker; saved_ms is setup time avoided by reuse
+    return jsonify({"pid": os.getpid(), "s3": s3_client_stats()}), 200
+
+
+@app.get("/api/metrics/db")
+@jwt_required()
+def db_metrics():
+    denied = _metrics_denied()
+    if denied:
+        return denied
+    # engine pool state plus per-worker counters; "reused" checkouts skipped a new connection
+    return jsonify({"pid": os.getpid(), "pool": db_pool.pool_stats(db.engine)}), 200
 
 
 
@@ -1830,52 +2143,49 @@ def intake_link_account():
         return jsonify({"error": "Upload not found in storage"}), 400
 
     # Insert intake record linked to the user's email with account_linked status
-    conn = get_db_conn()
-    try:
-        with conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO intake_submissions
-                    (id, first_name, last_name, email, state, phone, linkedin_url, portfolio_url,
-                    resume_key, resume_mime, resume_size_bytes, status)
-                    VALUES
-                    (%s, %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, 'account_linked')
-                    """,
-                    (
-                        submission_id,
-                        first_name,
-                        last_name,
-                        current_email,
-                        state,
-                        phone or None,
-                        linkedin_url or None,
-                        portfolio_url or None,
-                        object_key,
-                        mime,
-                        size,
-                    ),
-                )
-    finally:
-        conn.close()
+    with pooled_db_cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO intake_submissions
+            (id, first_name, last_name, email, state, phone, linkedin_url, portfolio_url,
+            resume_key, resume_mime, resume_size_bytes, status)
+            VALUES
+            (%s, %s, %s, %s, %s, %s, %s, %s,
+            %s, %s, %s, 'account_linked')
+            """,
+            (
+                submission_id,
+                first_name,
+                last_name,
+                current_email,
+                state,
+                phone or None,
+                linkedin_url or None,
+                portfolio_url or None,
+                object_key,
+                mime,
+                size,
+            ),
+        )
 
     # Build and merge profile data
     intake = IntakeSubmission.query.filter_by(id=submission_id).first()
     if intake:
-        intake_profile = _build_profile_from_intake(intake)
+        intake_profile = _build_profile_from_intake(intake, parse=not RESUME_INGEST_ASYNC)
         existing_profile = user.profile_data or {}
         user.profile_data = {**existing_profile, **intake_profile}
         full_name = f"{first_name} {last_name}".strip()
         if full_name:
             user.name = full_name
         db.session.commit()
+        if RESUME_INGEST_ASYNC:
+            _enqueue_resume_ingest(user, intake.resume_key, intake.resume_mime)
 
     log_audit_event(
         action="intake_link_account",
-        actor_email=current_email,
-        target_email=current_email,
-        detail=f"submission_id={submission_id}",
+        actor_user_id=user.id,
+        resource="intake",
+        metadata={"submission_id": submission_id},
     )
 
     return jsonify({"ok": True})
@@ -0,0 +1,267 @@
+"""
+Buffered audit log writer.
+
+log_audit_event used to add an AuditLog row to the request's session, so
+even GET /api/profile ran an INSERT and a commit. Events are now collected
+in-process and written in bulk (one multi-row INSERT on a pooled connection)
+every AUDIT_FLUSH_EVENTS events or AUDIT_FLUSH_MS milliseconds, whichever
+comes first, by a flusher thread. created_at is stamped when the event
+happens, not when it is written.
+
+The buffer is flushed when the process exits (atexit, and gunicorn's
+worker_exit hook). If a flush cannot reach the database, the events are
+appended to this process's spool file (<pid>.jsonl in the spool directory)
+and written by a later flush, so they are not lost to a database outage or
+a restart. A flush replays its own spool and those of processes that have
+exited, each claimed by an atomic rename so two workers never replay the
+same file.
+
+When the bulk insert is rejected for reasons other than connectivity, rows
+are retried one at a time; a row the database refuses on its own is moved
+to rejected-<pid>.jsonl for inspection instead of blocking the rest forever.
+
+The buffer is per process: a forked worker starts empty and gets its own
+flusher thread.
+
+Env:
+- AUDIT_BUFFERED=0: write each event in the caller's session (old behaviour)
+- AUDIT_FLUSH_EVENTS: flush after this many buffered events (default 100)
+- AUDIT_FLUSH_MS: flush at least this often while events wait (default 1000)
+- AUDIT_SPOOL_DIR: spool and quarantine directory (default instance/audit_spool)
+"""
+
+import atexit
+import datetime
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+
+from model import AuditLog, db
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPOOL_DIR = Path(__file__).resolve().parent / "instance" / "audit_spool"
+SPOOL_SUFFIX = ".jsonl"
+CLAIMED_SUFFIX = ".claimed"
+
+
+def buffering_enabled():
+    return os.environ.get("AUDIT_BUFFERED", "1") == "1"
+
+
+def _spool_dir():
+    return Path(os.environ.get("AUDIT_SPOOL_DIR", str(DEFAULT_SPOOL_DIR)))
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _claim_spools(directory):
+    """Claims the spool files this process may replay, by renaming them.
+
+    That is its own spool (appended to only under its flush lock) and the
+    spools and stale claims of processes that are gone. Returns the claimed paths.
+    """
+    pid = os.getpid()
+    claimed = []
+    for path in sorted(directory.glob("*" + SPOOL_SUFFIX + "*")):
+        parts = path.name.split(".")
+        # <pid>.jsonl, or <pid>.jsonl.<claimer pid>.claimed
+        if not parts[0].isdigit():
+            continue
+        if path.name.endswith(CLAIMED_SUFFIX):
+            owner = int(parts[-2]) if parts[-2].isdigit() else 0
+        else:
+            owner = int(parts[0])
+        if owner != pid and _pid_alive(owner):
+            continue
+        target = directory / f"{parts[0]}{SPOOL_SUFFIX}.{pid}{CLAIMED_SUFFIX}"
+        try:
+            os.rename(path, target)
+        except FileNotFoundError:
+            continue  # another process claimed it first
+        claimed.append(target)
+    return claimed
+
+
+class AuditBuffer:
+    """Collects audit rows for one process and writes them in batches."""
+
+    def __init__(self, app, flush_events=None, flush_ms=None):
+        self.app = app
+        self.flush_events = flush_events or int(os.environ.get("AUDIT_FLUSH_EVENTS", "100"))
+        self.flush_seconds = (flush_ms or float(os.environ.get("AUDIT_FLUSH_MS", "1000"))) / 1000.0
+        self.pid = os.getpid()
+        self._rows = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self.flushed = 0
+        self.spooled = 0
+        self.rejected = 0
+        self._thread = threading.Thread(target=self._run, name="audit-flusher", daemon=True)
+        self._thread.start()
+
+    def add(self, row):
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.flush_events
+        if full:
+            self._wake.set()
+
+    def pending(self):
+        with self._lock:
+            return len(self._rows)
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Writes every buffered event (and any claimable spooled ones). Returns how many were written."""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+            directory = _spool_dir()
+            claimed = _claim_spools(directory) if directory.exists() else []
+            batch = [row for path in claimed for row in _read_spool(path)] + rows
+            if not batch:
+                return 0
+            written, rejected, unsent = self._write(batch)
+            if unsent:
+                _append_spool(directory / f"{os.getpid()}{SPOOL_SUFFIX}", unsent)
+                self.spooled += len(unsent)
+            if rejected:
+                _append_spool(directory / f"rejected-{os.getpid()}{SPOOL_SUFFIX}", rejected)
+                self.rejected += len(rejected)
+            # Only now: every claimed row is in the database or in a spool file again.
+            for path in claimed:
+                path.unlink(missing_ok=True)
+            self.flushed += written
+            return written
+
+    def _write(self, rows):
+        """Inserts rows. Returns (written, rejected rows, rows to spool for later)."""
+        table = AuditLog.__table__
+        try:
+            with self.app.app_context():
+                with db.engine.begin() as conn:
+                    conn.execute(table.insert(), rows)
+            return len(rows), [], []
+        except DBAPIError as exc:
+            if isinstance(exc, (OperationalError, InterfaceError)) or exc.connection_invalidated:
+                logger.exception("Audit flush failed; spooling %d events", len(rows))
+                return 0, [], rows
+            logger.warning("Audit bulk insert rejected (%s); retrying %d events one by one", exc, len(rows))
+        except Exception:
+            logger.exception("Audit flush failed; spooling %d events", len(rows))
+            return 0, [], rows
+
+        written, rejected = 0, []
+        with self.app.app_context():
+            for i, row in enumerate(rows):
+                try:
+                    with db.engine.begin() as conn:
+                        conn.execute(table.insert(), [row])
+                    written += 1
+                except (OperationalError, InterfaceError):
+                    logger.exception("Audit flush lost the database; spooling %d events", len(rows) - i)
+                    return written, rejected, rows[i:]
+                except Exception:
+                    logger.exception("Audit event rejected; quarantining it: %r", row)
+                    rejected.append(row)
+        return written, rejected, []
+
+    def close(self):
+        self._stopped = True
+        self._wake.set()
+        self._thread.join(timeout=5)
+        self.flush()
+
+
+def _append_spool(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as fh:
+        for row in rows:
+            fh.write(json.dumps({**row, "created_at": row["created_at"].isoformat()}, default=str) + "\n")
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+def _read_spool(path):
+    rows = []
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                row["created_at"] = datetime.datetime.fromisoformat(row["created_at"])
+            except (ValueError, KeyError, TypeError):
+                # e.g. a line cut short when its process died mid-write
+                logger.warning("Skipping unreadable audit spool line in %s: %r", path, line[:200])
+                continue
+            rows.append(row)
+    return rows
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer(app):
+    """The process's audit buffer, created on first use (and again after fork)."""
+    global _buffer
+    if _buffer is None or _buffer.pid != os.getpid():
+        with _buffer_lock:
+            if _buffer is None or _buffer.pid != os.getpid():
+                _buffer = AuditBuffer(app)
+    return _buffer
+
+
+def record(app, actor_user_id, action, resource, ip_address, user_agent, metadata):
+    """Buffers one audit event, or adds it to the current session when buffering is off."""
+    if not buffering_enabled():
+        db.session.add(
+            AuditLog(
+                actor_user_id=actor_user_id,
+                action=action,
+                resource=resource,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                event_metadata=metadata,
+            )
+        )
+        return
+    get_buffer(app).add(
+        {
+            "actor_user_id": actor_user_id,
+            "action": action,
+            "resource": resource,
+            "ip_address": (ip_address or "")[:64] or None,
+            "user_agent": (user_agent or "")[:300],
+            "metadata": metadata,
+            "created_at": datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None),
+        }
+    )
+
+
+@atexit.register
+def flush_on_exit():
+    """Flushes this process's buffer; also called from gunicorn's worker_exit hook."""
+    if _buffer is not None and _buffer.pid == os.getpid():
+        _buffer.close()
@@ -0,0 +1,111 @@
+"""
+In-process background worker pool for work that should not hold a request thread.
+
+Jobs run on a small ThreadPoolExecutor inside an application context, so they
+can use `db.session` like a request handler does. State that must survive a
+restart (status, results) belongs in the database, not in the job callable.
+
+The executor is created lazily and per process: under gunicorn each forked
+worker gets its own pool (threads do not survive fork).
+
+Because the pool lives in the process, work submitted by a worker that is
+restarted mid-job is lost. Modules register a recovery sweep with
+`register_sweep(fn)`; once `start_sweeps(app)` has been called in a process, a
+thread there runs every sweep each BACKGROUND_SWEEP_SECONDS, so rows left
+queued or running in the database are picked up again.
+
+Env:
+- BACKGROUND_WORKERS: threads per process (default 2)
+- BACKGROUND_INLINE=1: run jobs synchronously in the caller (tests / debugging)
+- BACKGROUND_SWEEP_SECONDS: interval between recovery sweeps (default 60, 0 disables)
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_pid = None
+_lock = threading.Lock()
+_sweeps = []
+_sweeps_pid = None
+
+
+def _get_executor():
+    global _executor, _executor_pid
+    pid = os.getpid()
+    if _executor is None or _executor_pid != pid:
+        with _lock:
+            if _executor is None or _executor_pid != pid:
+                _executor = ThreadPoolExecutor(
+                    max_workers=int(os.environ.get("BACKGROUND_WORKERS", "2")),
+                    thread_name_prefix="background",
+                )
+                _executor_pid = pid
+    return _executor
+
+
+def _run_with_context(app, fn, args, kwargs):
+    with app.app_context():
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            logger.exception("Background job %s failed", getattr(fn, "__name__", fn))
+            raise
+        finally:
+            from model import db
+
+            db.session.remove()
+
+
+def submit(app, fn, *args, **kwargs) -> Future:
+    """Runs fn(*args, **kwargs) in the background inside `app`'s context."""
+    if os.environ.get("BACKGROUND_INLINE") == "1":
+        future = Future()
+        try:
+            future.set_result(_run_with_context(app, fn, args, kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+    return _get_executor().submit(_run_with_context, app, fn, args, kwargs)
+
+
+def register_sweep(fn):
+    """Adds fn() to the periodic recovery sweep; it runs inside an app context."""
+    if fn not in _sweeps:
+        _sweeps.append(fn)
+    return fn
+
+
+def _sweep_interval():
+    return float(os.environ.get("BACKGROUND_SWEEP_SECONDS", "60"))
+
+
+def _run_sweeps(app, interval):
+    while True:
+        time.sleep(interval)
+        for fn in list(_sweeps):
+            try:
+                _run_with_context(app, fn, (), {})
+            except Exception:
+                pass  # already logged; the next sweep tries again
+
+
+def start_sweeps(app):
+    """Starts this process's sweep thread (once per process, and again after fork)."""
+    global _sweeps_pid
+    pid = os.getpid()
+    interval = _sweep_interval()
+    if _sweeps_pid == pid or interval <= 0:
+        return
+    with _lock:
+        if _sweeps_pid == pid:
+            return
+        _sweeps_pid = pid
+        threading.Thread(
+            target=_run_sweeps, args=(app, interval), name="background-sweep", daemon=True
+        ).start()
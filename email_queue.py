@@ -0,0 +1,149 @@
+"""
+Outbound email queue: requests record the email, a background job sends it.
+
+`enqueue_email` stores the message in the outbound_email table and hands its
+delivery to the background pool, so request latency no longer includes the
+Resend round trip and a provider outage does not turn into a 500. A failed
+send is retried with exponential backoff (from a timer in the same process);
+after EMAIL_MAX_ATTEMPTS the email is marked failed. Configuration errors
+(missing API key) fail immediately.
+
+Queued emails survive restarts in the table. `drain_due` delivers every
+email that is due. It runs in each worker's background recovery sweep, so
+emails queued before a restart and retries whose timer died with their
+process are still sent. It can also be run by hand with `flask drain-emails`.
+
+Rows keep the full message (verification codes, applicant details), so the
+sweep also deletes sent and failed emails older than EMAIL_RETENTION_HOURS
+(`purge_finished`, also `flask purge-emails`).
+
+Env:
+- EMAIL_MAX_ATTEMPTS: delivery attempts per email (default 5)
+- EMAIL_RETRY_BASE_SECONDS: first retry delay, doubled per attempt (default 30)
+- EMAIL_RETENTION_HOURS: keep sent/failed rows this long (default 24)
+- EMAIL_TRANSPORT: see email_utils ("resend" or "stub")
+"""
+
+import datetime
+import logging
+import os
+import threading
+
+import background
+import email_utils
+from model import OutboundEmail, db
+
+logger = logging.getLogger(__name__)
+
+# How long a claimed ("sending") email is reserved before another worker may retry it.
+SEND_LEASE_SECONDS = 300
+
+
+def _now():
+    # Naive UTC, matching how the DateTime columns are compared.
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _max_attempts():
+    return int(os.environ.get("EMAIL_MAX_ATTEMPTS", "5"))
+
+
+def _retry_delay(attempts):
+    return float(os.environ.get("EMAIL_RETRY_BASE_SECONDS", "30")) * 2 ** (attempts - 1)
+
+
+def enqueue_email(app, message):
+    """Stores `message` ({"to", "subject", "html"}) and schedules its delivery. Commits."""
+    email = OutboundEmail(
+        to=list(message["to"]),
+        subject=message["subject"],
+        html=message["html"],
+        status="queued",
+        attempts=0,
+        next_attempt_at=_now(),
+    )
+    db.session.add(email)
+    db.session.commit()
+    background.submit(app, deliver_email, app, email.id)
+    return email
+
+
+def _schedule_retry(app, email_id, delay):
+    timer = threading.Timer(delay, background.submit, args=(app, deliver_email, app, email_id))
+    timer.daemon = True
+    timer.start()
+
+
+def _due():
+    # A "sending" row whose lease ran out belongs to a process that died mid-send.
+    return db.and_(
+        OutboundEmail.status.in_(("queued", "sending")),
+        OutboundEmail.next_attempt_at <= _now(),
+    )
+
+
+def deliver_email(app, email_id):
+    """One delivery attempt for a due email (runs in the background pool)."""
+    # Claim the row so a concurrent drain does not send it twice.
+    claimed = (
+        OutboundEmail.query
+        .filter(OutboundEmail.id == email_id, _due())
+        .update(
+            {"status": "sending", "next_attempt_at": _now() + datetime.timedelta(seconds=SEND_LEASE_SECONDS)},
+            synchronize_session=False,
+        )
+    )
+    db.session.commit()
+    if not claimed:
+        return
+
+    email = db.session.get(OutboundEmail, email_id)
+    email.attempts += 1
+    try:
+        email_utils.send_message({"to": email.to, "subject": email.subject, "html": email.html})
+    except Exception as exc:
+        email.last_error = str(exc)[:500]
+        if isinstance(exc, email_utils.EmailConfigError) or email.attempts >= _max_attempts():
+            email.status = "failed"
+            logger.error("Email %s to %s failed after %d attempts: %s", email.id, email.to, email.attempts, exc)
+        else:
+            delay = _retry_delay(email.attempts)
+            email.status = "queued"
+            email.next_attempt_at = _now() + datetime.timedelta(seconds=delay)
+            db.session.commit()
+            logger.warning("Email %s attempt %d failed, retrying in %.0fs: %s", email.id, email.attempts, delay, exc)
+            _schedule_retry(app, email.id, delay)
+            return
+    else:
+        email.status = "sent"
+        email.sent_at = _now()
+        email.last_error = None
+    db.session.commit()
+
+
+def drain_due(app, limit=100):
+    """Delivers up to `limit` queued emails that are due, in this thread. Returns how many were tried."""
+    due = (
+        OutboundEmail.query
+        .filter(_due())
+        .order_by(OutboundEmail.next_attempt_at, OutboundEmail.id)
+        .limit(limit)
+        .all()
+    )
+    for email in due:
+        deliver_email(app, email.id)
+    return len(due)
+
+
+def purge_finished(older_than_hours=None):
+    """Deletes sent and failed emails created more than `older_than_hours` ago. Returns how many."""
+    if older_than_hours is None:
+        older_than_hours = float(os.environ.get("EMAIL_RETENTION_HOURS", "24"))
+    cutoff = _now() - datetime.timedelta(hours=older_than_hours)
+    purged = (
+        OutboundEmail.query
+        .filter(OutboundEmail.status.in_(("sent", "failed")), OutboundEmail.created_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    db.session.commit()
+    return purged
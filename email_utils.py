@@ -1,47 +1,48 @@
-# Send early access modal notification (no resume)
-def send_early_access_modal_notification(
-    first_name: str,
-    last_name: str,
-    email: str,
-    phone: str,
-    preferred_contact: str,
-    career_journey: str,
-) -> None:
-    """Send an email to info@solverah.com with early access modal submission details."""
-    if not RESEND_API_KEY:
-        raise EmailConfigError("RESEND_API_KEY is not set")
-    if not EMAIL_FROM:
-        raise EmailConfigError("EMAIL_FROM is not set")
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+RESEND_API_KEY = os.environ.get("RESEND_API_KEY")
+EMAIL_FROM = os.environ.get("EMAIL_FROM", "no-reply@solverah.com")
+NOTIFY_TO = "info@solverah.com"
+
+# "resend" delivers through the Resend API; "stub" only records messages in
+# STUB_OUTBOX (local development and tests).
+EMAIL_TRANSPORT = os.environ.get("EMAIL_TRANSPORT", "resend")
+STUB_OUTBOX: list = []
 
+
+class EmailConfigError(RuntimeError):
+    pass
+
+
+# Messages are plain dicts ({"to", "subject", "html"}) so they can be stored
+# in the outbound email queue (see email_queue.py) and delivered later.
+
+
+def verification_message(to_email: str, code: str) -> dict:
+    """A 6-digit verification code email."""
     html_content = f"""
-    <div style='font-family: sans-serif; max-width: 480px; margin: 0 auto; padding: 32px; background: #0f172a; color: #e2e8f0; border-radius: 12px;'>
-      <h2 style='color: #6ee7b7; margin-top: 0;'>New Early Access Modal Submission</h2>
-      <ul style='color: #e2e8f0; font-size: 15px;'>
-        <li><b>First Name:</b> {first_name}</li>
-        <li><b>Last Name:</b> {last_name}</li>
-        <li><b>Email:</b> {email}</li>
-        <li><b>Phone:</b> {phone or 'N/A'}</li>
-        <li><b>Preferred Contact:</b> {preferred_contact or 'N/A'}</li>
-        <li><b>Career Journey:</b> {career_journey or 'N/A'}</li>
-      </ul>
+    <div style="font-family: sans-serif; max-width: 480px; margin: 0 auto; padding: 32px; background: #faf8f5; color: #1a1a18; border-radius: 12px; border: 1px solid #e8e4dd;">
+      <p style="font-size: 11px; font-weight: 700; letter-spacing: 0.08em; text-transform: uppercase; color: #6a8f72; margin: 0 0 8px 0;">Verify your email</p>
+      <h2 style="margin: 0 0 16px 0; font-size: 24px; font-weight: 700; color: #1a1a18;">Confirm your Solverah account</h2>
+      <p style="color: #4a4a44; font-size: 15px; margin: 0 0 24px 0;">Enter this code on the verification page to activate your account:</p>
+      <div style="font-size: 40px; font-weight: 700; letter-spacing: 10px; color: #1a3d25; background: #ffffff; padding: 20px; border-radius: 8px; border: 1px solid #e8e4dd; text-align: center; margin: 0 0 24px 0;">
+        {code}
+      </div>
+      <p style="color: #7a7a72; font-size: 13px; margin: 0;">This code expires in 15 minutes. If you didn't create a Solverah account, you can safely ignore this email.</p>
     </div>
     """
 
-    try:
-        import resend as resend_lib
-    except ImportError:
-        raise EmailConfigError("resend package is not installed. Run: pip install resend")
-
-    resend_lib.api_key = RESEND_API_KEY
-    params = {
-        "from": EMAIL_FROM,
-        "to": ["info@solverah.com"],
-        "subject": "New Early Access Modal Submission",
+    return {
+        "to": [to_email],
+        "subject": "Your Solverah verification code",
         "html": html_content,
     }
-    resend_lib.Emails.send(params)
-# Send early access intake notification to info@solverah.com
-def send_intake_notification(
+
+
+def intake_notification_message(
     first_name: str,
     last_name: str,
     email: str,
@@ -52,13 +53,8 @@ def send_intake_notification(
     object_key: str,
     mime: str,
     size: int,
-) -> None:
-    """Send an email to info@solverah.com with early access submission details."""
-    if not RESEND_API_KEY:
-        raise EmailConfigError("RESEND_API_KEY is not set")
-    if not EMAIL_FROM:
-        raise EmailConfigError("EMAIL_FROM is not set")
-
+) -> dict:
+    """Early access submission details for info@solverah.com."""
     html_content = f"""
     <div style='font-family: sans-serif; max-width: 480px; margin: 0 auto; padding: 32px; background: #0f172a; color: #e2e8f0; border-radius: 12px;'>
       <h2 style='color: #6ee7b7; margin-top: 0;'>New Early Access Submission</h2>
@@ -77,63 +73,91 @@ def send_intake_notification(
     </div>
     """
 
-    try:
-        import resend as resend_lib
-    except ImportError:
-        raise EmailConfigError("resend package is not installed. Run: pip install resend")
-
-    resend_lib.api_key = RESEND_API_KEY
-    params = {
-        "from": EMAIL_FROM,
-        "to": ["info@solverah.com"],
+    return {
+        "to": [NOTIFY_TO],
         "subject": "New Early Access Submission",
         "html": html_content,
     }
-    resend_lib.Emails.send(params)
-import os
 
-RESEND_API_KEY = os.environ.get("RESEND_API_KEY")
-EMAIL_FROM = os.environ.get("EMAIL_FROM", "no-reply@solverah.com")
 
+def early_access_modal_message(
+    first_name: str,
+    last_name: str,
+    email: str,
+    phone: str,
+    preferred_contact: str,
+    career_journey: str,
+) -> dict:
+    """Early access modal submission details (no resume) for info@solverah.com."""
+    html_content = f"""
+    <div style='font-family: sans-serif; max-width: 480px; margin: 0 auto; padding: 32px; background: #0f172a; color: #e2e8f0; border-radius: 12px;'>
+      <h2 style='color: #6ee7b7; margin-top: 0;'>New Early Access Modal Submission</h2>
+      <ul style='color: #e2e8f0; font-size: 15px;'>
+        <li><b>First Name:</b> {first_name}</li>
+        <li><b>Last Name:</b> {last_name}</li>
+        <li><b>Email:</b> {email}</li>
+        <li><b>Phone:</b> {phone or 'N/A'}</li>
+        <li><b>Preferred Contact:</b> {preferred_contact or 'N/A'}</li>
+        <li><b>Career Journey:</b> {career_journey or 'N/A'}</li>
+      </ul>
+    </div>
+    """
 
-class EmailConfigError(RuntimeError):
-    pass
+    return {
+        "to": [NOTIFY_TO],
+        "subject": "New Early Access Modal Submission",
+        "html": html_content,
+    }
 
 
-def send_verification_email(to_email: str, code: str) -> None:
-    """Send a 6-digit verification code email via Resend."""
+def _send_resend(message: dict) -> None:
     if not RESEND_API_KEY:
         raise EmailConfigError("RESEND_API_KEY is not set")
     if not EMAIL_FROM:
         raise EmailConfigError("EMAIL_FROM is not set")
 
-    html_content = f"""
-    <div style="font-family: sans-serif; max-width: 480px; margin: 0 auto; padding: 32px; background: #faf8f5; color: #1a1a18; border-radius: 12px; border: 1px solid #e8e4dd;">
-      <p style="font-size: 11px; font-weight: 700; letter-spacing: 0.08em; text-transform: uppercase; color: #6a8f72; margin: 0 0 8px 0;">Verify your email</p>
-      <h2 style="margin: 0 0 16px 0; font-size: 24px; font-weight: 700; color: #1a1a18;">Confirm your Solverah account</h2>
-      <p style="color: #4a4a44; font-size: 15px; margin: 0 0 24px 0;">Enter this code on the verification page to activate your account:</p>
-      <div style="font-size: 40px; font-weight: 700; letter-spacing: 10px; color: #1a3d25; background: #ffffff; padding: 20px; border-radius: 8px; border: 1px solid #e8e4dd; text-align: center; margin: 0 0 24px 0;">
-        {code}
-      </div>
-      <p style="color: #7a7a72; font-size: 13px; margin: 0;">This code expires in 15 minutes. If you didn't create a Solverah account, you can safely ignore this email.</p>
-    </div>
-    """
-
     try:
         import resend as resend_lib
     except ImportError:
         raise EmailConfigError("resend package is not installed. Run: pip install resend")
 
     resend_lib.api_key = RESEND_API_KEY
-    params: resend_lib.Emails.SendParams = {
-        "from": EMAIL_FROM,
-        "to": [to_email],
-        "subject": "Your Solverah verification code",
-        "html": html_content,
-    }
+    params: resend_lib.Emails.SendParams = {"from": EMAIL_FROM, **message}
     resend_lib.Emails.send(params)
 
 
+def _send_stub(message: dict) -> None:
+    logger.info("Stub email to %s: %s", ", ".join(message["to"]), message["subject"])
+    STUB_OUTBOX.append(message)
+
+
+TRANSPORTS = {"resend": _send_resend, "stub": _send_stub}
+
+
+def send_message(message: dict) -> None:
+    """Delivers `message` now through EMAIL_TRANSPORT; raises on failure."""
+    try:
+        transport = TRANSPORTS[EMAIL_TRANSPORT]
+    except KeyError:
+        raise EmailConfigError(f"Unknown EMAIL_TRANSPORT {EMAIL_TRANSPORT!r}")
+    transport(message)
+
+
+def send_verification_email(to_email: str, code: str) -> None:
+    """Send a 6-digit verification code email via Resend."""
+    send_message(verification_message(to_email, code))
+
+
 # Backward-compatible alias used by existing app.py imports
 def send_confirmation_email(to_email: str, token: str) -> None:
     send_verification_email(to_email, token)
+
+
+def send_intake_notification(**fields) -> None:
+    """Send an email to info@solverah.com with early access submission details."""
+    send_message(intake_notification_message(**fields))
+
+
+def send_early_access_modal_notification(**fields) -> None:
+    """Send an email to info@solverah.com with early access modal submission details."""
+    send_message(early_access_modal_message(**fields))
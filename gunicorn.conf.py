@@ -0,0 +1,30 @@
+"""Gunicorn settings (picked up automatically from the working directory).
+
+    gunicorn app:app
+
+When ML_ENABLED=1 the master loads the recommendation encoder and the job
+embedding index before forking, so workers start with the model already in
+memory and share its weights copy-on-write instead of each loading a copy on
+their first recommendation request. Set ML_PRELOAD=0 to skip the warm-up.
+
+Each worker flushes its buffered audit events when it exits.
+"""
+import os
+
+
+def on_starting(server):
+    if os.environ.get("ML_ENABLED", "0") != "1" or os.environ.get("ML_PRELOAD", "1") != "1":
+        return
+    from LLM import profile2model
+    from LLM.model_registry import model_stats, warm_up
+
+    profile2model.load_job_index()
+    warm_up([profile2model.model_path])
+    server.log.info("Preloaded ML models before fork: %s", model_stats())
+
+
+def worker_exit(server, worker):
+    # Write audit events still buffered in this worker (see audit_sink.py).
+    import audit_sink
+
+    audit_sink.flush_on_exit()
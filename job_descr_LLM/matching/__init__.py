@@ -1,5 +1,6 @@
 """Matching utilities for comparing job descriptions to candidate profiles."""
 
 from .compare import compare_profiles, compare_records
+from .recall import SkillIndex
 
-__all__ = ["compare_profiles", "compare_records"]
\ No newline at end of file
+__all__ = ["compare_profiles", "compare_records", "SkillIndex"]
\ No newline at end of file
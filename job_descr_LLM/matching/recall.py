@@ -0,0 +1,92 @@
+"""Inverted-index candidate recall over parsed job descriptions.
+
+First stage of hybrid ranking: instead of scoring every job, look up the jobs
+that share at least one normalized skill or title term with the candidate and
+keep the best `limit` by IDF-weighted overlap. Only those candidates go on to
+embedding + compare_profiles re-ranking.
+
+Skills are matched as whole normalized phrases (the same normalization
+compare_profiles uses for overlap); titles are matched word by word.
+"""
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+from job_descr_LLM.jd_input_pipeline.schema import JobDescriptionOutput
+
+from .compare import _normalize_tokens
+
+TITLE_WORD = re.compile(r"[a-z0-9+#]+")
+TITLE_STOPWORDS = {"and", "of", "the", "for", "with", "i", "ii", "iii", "sr", "jr"}
+
+
+def title_terms(titles: Iterable[str]) -> List[str]:
+    terms: List[str] = []
+    for title in titles:
+        for word in TITLE_WORD.findall(str(title or "").lower()):
+            if len(word) > 1 and word not in TITLE_STOPWORDS:
+                terms.append(f"title:{word}")
+    return terms
+
+
+def skill_terms(skills: Iterable[str]) -> List[str]:
+    return [f"skill:{token}" for token in _normalize_tokens(str(s) for s in skills or [])]
+
+
+def _record_terms(record: Mapping[str, object]) -> set[str]:
+    titles = [block.get("title", "") for block in record.get("experience", []) or [] if isinstance(block, Mapping)]
+    if record.get("title"):
+        titles.append(str(record["title"]))
+    return set(skill_terms(record.get("skills", []))) | set(title_terms(titles))
+
+
+class SkillIndex:
+    """Term -> job id postings built from jd_input_pipeline output."""
+
+    def __init__(self, postings: Dict[str, List[int]], records: Dict[int, JobDescriptionOutput]):
+        self.postings = postings
+        self.records = records
+        total = max(len(records), 1)
+        self.idf = {term: math.log(1.0 + total / len(ids)) for term, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @classmethod
+    def build(cls, records: Iterable[JobDescriptionOutput]) -> "SkillIndex":
+        postings: Dict[str, List[int]] = defaultdict(list)
+        by_id: Dict[int, JobDescriptionOutput] = {}
+        for record in records:
+            job_id = int(record.get("id", 0) or 0)
+            by_id[job_id] = record
+            for term in _record_terms(record):
+                postings[term].append(job_id)
+        return cls(dict(postings), by_id)
+
+    @classmethod
+    def from_jsonl(cls, path: Path | str) -> "SkillIndex":
+        """Loads parsed JDs as written by jd_input_pipeline.run.write_jsonl."""
+        with Path(path).open("r", encoding="utf-8") as handle:
+            return cls.build(json.loads(line) for line in handle if line.strip())
+
+    def candidates(
+        self,
+        skills: Iterable[str],
+        titles: Iterable[str] = (),
+        limit: int = 500,
+    ) -> List[Tuple[int, float]]:
+        """Returns up to `limit` (job_id, recall_score) pairs, best first."""
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(skill_terms(skills)) | set(title_terms(titles)):
+            weight = self.idf.get(term)
+            if weight is None:
+                continue
+            for job_id in self.postings[term]:
+                scores[job_id] += weight
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit]
@@ -6,19 +6,25 @@ from pathlib import Path
 
 from docx import Document
 
-from job_descr_LLM.parsers.types import ParsedDocument
+from job_descr_LLM.parsers.types import ParsedDocument, Source, rewind
 
 logger = logging.getLogger(__name__)
 
 
-def parse_docx(file_path: Path) -> ParsedDocument:
-    file_path = Path(file_path)
+def docx_text(file_path: Source) -> str:
+    document = Document(rewind(file_path))
+    text = "\n".join(paragraph.text for paragraph in document.paragraphs)
+    if not text.strip():
+        raise ValueError("DOCX extraction returned no text")
+    return text
+
+
+def parse_docx(file_path: Source | str) -> ParsedDocument:
+    """Extract text from a DOCX path or binary stream."""
+    if isinstance(file_path, str):
+        file_path = Path(file_path)
     try:
-        document = Document(file_path)
-        text = "\n".join(paragraph.text for paragraph in document.paragraphs)
-        if not text.strip():
-            raise ValueError("DOCX extraction returned no text")
-        return ParsedDocument(text=text, parser="python-docx", error=None)
+        return ParsedDocument(text=docx_text(file_path), parser="python-docx", error=None)
     except Exception as exc:  # noqa: BLE001
         logger.warning("DOCX fallback failed for %s: %s", file_path, exc)
-        return ParsedDocument(text="", parser="python-docx", error=str(exc))
\ No newline at end of file
+        return ParsedDocument(text="", parser="python-docx", error=str(exc))
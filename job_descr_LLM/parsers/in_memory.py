@@ -0,0 +1,30 @@
+"""Extraction straight from resume bytes (e.g. an S3 object body), no temp files."""
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from job_descr_LLM.parsers.docx_extract import parse_docx
+from job_descr_LLM.parsers.pdf_extract import parse_pdf
+from job_descr_LLM.parsers.types import ParsedDocument
+
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+MIME_PARSERS: Dict[str, Callable[[BytesIO], ParsedDocument]] = {
+    PDF_MIME: parse_pdf,
+    DOCX_MIME: parse_docx,
+}
+SUFFIX_PARSERS: Dict[str, Callable[[BytesIO], ParsedDocument]] = {
+    ".pdf": parse_pdf,
+    ".docx": parse_docx,
+}
+
+
+def parse_document_bytes(data: bytes, mime: Optional[str] = None, filename: str = "") -> ParsedDocument:
+    """Parse a PDF/DOCX held in memory; the type comes from `mime`, else the filename suffix."""
+    parser = MIME_PARSERS.get(mime or "") or SUFFIX_PARSERS.get(Path(filename).suffix.lower())
+    if parser is None:
+        return ParsedDocument(text="", parser="unknown", error="No suitable parser")
+    return parser(BytesIO(data))
@@ -0,0 +1,292 @@
+"""Resume text extraction across worker processes with per-file timeouts.
+
+Each file has a parser chain (PDF: pdfminer and pypdf, ordered by the
+PDF_EXTRACT_STRATEGY, see pdf_extract.extractor_order; DOCX: python-docx).
+Parsers run one at a time in a pool of worker processes. If a parser fails
+or runs past the wall-clock `timeout`, the file moves on to the next parser
+in its chain. A worker that times out is killed and replaced, so one
+pathological PDF costs at most `timeout` seconds per parser instead of
+stalling the run.
+
+Results are yielded in input order, and each ParsedDocument records the
+seconds spent in every parser tried (`timings`).
+
+A chain that depends on the file (the adaptive PDF order opens the PDF to
+count pages) is chosen by the file's first task in a worker, under the same
+timeout as a parser; if that probe fails or times out the chain's fallback
+order is used. The parent process never opens the files itself.
+
+Env:
+- EXTRACT_WORKERS: worker processes (default: CPU count)
+- EXTRACT_TIMEOUT_SECONDS: per-parser timeout (default 60; 0 disables the
+  pool and parses in-process without a timeout)
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from job_descr_LLM.parsers.docx_extract import docx_text
+from job_descr_LLM.parsers.pdf_extract import PDF_EXTRACTORS, _resolve_case_insensitive_path, extractor_order
+from job_descr_LLM.parsers.types import ParsedDocument
+
+logger = logging.getLogger(__name__)
+
+ParserFn = Callable[[Path], str]
+Chain = List[Tuple[str, ParserFn]]
+# suffix -> (label used in the combined error, ordered chain or path -> chain)
+ParserChains = Dict[str, Tuple[str, Union[Chain, Callable[[Path], Chain]]]]
+
+
+@dataclass(frozen=True)
+class AdaptiveChain:
+    """A per-file chain: `resolve(path)` picks it, `fallback` is used if that fails."""
+
+    resolve: Callable[[Path], Chain]
+    fallback: Chain
+
+    def __call__(self, path: Path) -> Chain:
+        return self.resolve(path)
+
+
+def pdf_chain(path: Path) -> Chain:
+    return [(name, PDF_EXTRACTORS[name]) for name in extractor_order(path)]
+
+
+# A PDF whose probe hangs or fails is one pypdf struggles with; lead with pdfminer.
+PDF_FALLBACK_CHAIN: Chain = [(name, PDF_EXTRACTORS[name]) for name in extractor_order(None, "quality-first")]
+
+PARSER_CHAINS: ParserChains = {
+    ".pdf": ("PDF", AdaptiveChain(pdf_chain, PDF_FALLBACK_CHAIN)),
+    ".doc": ("DOCX", [("python-docx", docx_text)]),
+    ".docx": ("DOCX", [("python-docx", docx_text)]),
+}
+
+
+def _default_workers() -> int:
+    return int(os.environ.get("EXTRACT_WORKERS", "0")) or os.cpu_count() or 1
+
+
+def _default_timeout() -> float:
+    return float(os.environ.get("EXTRACT_TIMEOUT_SECONDS", "60"))
+
+
+# Pseudo parser name of the task that resolves a file's chain.
+RESOLVE_STEP = "choose-parsers"
+
+
+@dataclass
+class _FileJob:
+    path: Path
+    chains: ParserChains = field(default_factory=lambda: PARSER_CHAINS)
+    label: str = ""
+    parsers: List[Tuple[str, ParserFn]] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    text: Optional[str] = None
+    parser: Optional[str] = None
+    resolver: Optional[Callable[[Path], Chain]] = None
+
+    def __post_init__(self):
+        suffix = self.path.suffix.lower()
+        if suffix in self.chains:
+            self.path = _resolve_case_insensitive_path(self.path)
+            self.label, chain = self.chains[suffix]
+            if callable(chain):
+                # Resolved by the job's first task, see next_parser.
+                self.resolver = chain
+            else:
+                self.parsers = chain
+
+    @property
+    def done(self) -> bool:
+        if self.resolver is not None:
+            return False
+        return self.text is not None or len(self.timings) == len(self.parsers)
+
+    def next_parser(self) -> Tuple[str, Callable]:
+        if self.resolver is not None:
+            return RESOLVE_STEP, self.resolver
+        return self.parsers[len(self.timings)]
+
+    def record(self, name: str, seconds: float, text=None, error: Optional[str] = None) -> None:
+        if name == RESOLVE_STEP:
+            chain, self.resolver = self.resolver, None
+            if error is None:
+                self.parsers = text
+            else:
+                logger.warning("Could not choose parsers for %s (%s); using the fallback order", self.path, error)
+                self.parsers = list(getattr(chain, "fallback", []))
+            return
+        self.timings[name] = round(seconds, 4)
+        if error is None:
+            self.text, self.parser = text, name
+        else:
+            logger.warning("%s failed for %s: %s", name, self.path, error)
+            self.errors.append(error)
+
+    def result(self) -> ParsedDocument:
+        if not self.parsers:
+            return ParsedDocument(text="", parser="unknown", error="No suitable parser")
+        if self.text is not None:
+            return ParsedDocument(text=self.text, parser=self.parser, error=None, timings=self.timings)
+        last = self.errors[-1] if self.errors else "no parser ran"
+        if len(self.parsers) > 1:
+            names = ", ".join(name for name, _ in self.parsers)
+            error = f"{self.label} extraction returned no text ({names}): {last}"
+        else:
+            error = last
+        return ParsedDocument(text="", parser=self.parsers[-1][0], error=error, timings=self.timings)
+
+
+def _run_parser(fn: ParserFn, path: Path) -> Tuple[Optional[str], Optional[str], float]:
+    start = time.perf_counter()
+    try:
+        text = fn(path)
+        return text, None, time.perf_counter() - start
+    except Exception as exc:  # noqa: BLE001
+        return None, str(exc), time.perf_counter() - start
+
+
+def extract_document(path: Path, chains: Optional[ParserChains] = None) -> ParsedDocument:
+    """Run the file's parser chain in this process (no timeout)."""
+    job = _FileJob(Path(path), chains or PARSER_CHAINS)
+    while not job.done:
+        name, fn = job.next_parser()
+        text, error, seconds = _run_parser(fn, job.path)
+        job.record(name, seconds, text=text, error=error)
+    return job.result()
+
+
+def _worker_main(conn) -> None:
+    while True:
+        task = conn.recv()
+        if task is None:
+            return
+        conn.send(_run_parser(*task))
+
+
+class _Worker:
+    def __init__(self, ctx):
+        self._ctx = ctx
+        self._spawn()
+
+    def _spawn(self) -> None:
+        self.conn, child_conn = self._ctx.Pipe()
+        self.process = self._ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.task: Optional[Tuple[int, str, float]] = None  # (file index, parser, deadline)
+
+    def start(self, index: int, job: _FileJob, timeout: float) -> None:
+        name, fn = job.next_parser()
+        self.conn.send((fn, job.path))
+        self.task = (index, name, time.monotonic() + timeout)
+
+    def restart(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+        self._spawn()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+def extract_documents(
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    chains: Optional[ParserChains] = None,
+) -> Iterator[ParsedDocument]:
+    """Extract many files in parallel; yields one ParsedDocument per path, in order.
+
+    chains: suffix -> (label, [(parser name, fn)]) overriding PARSER_CHAINS;
+    parser functions must be importable module-level functions.
+    """
+    workers = workers or _default_workers()
+    timeout = _default_timeout() if timeout is None else timeout
+    chains = chains or PARSER_CHAINS
+    if not timeout:
+        for path in paths:
+            yield extract_document(path, chains)
+        return
+
+    ctx = multiprocessing.get_context("spawn")
+    pool = [_Worker(ctx) for _ in range(workers)]
+    pending = iter(enumerate(paths))
+    exhausted = False
+    jobs: Dict[int, _FileJob] = {}
+    queue: Deque[int] = deque()
+    finished: Dict[int, ParsedDocument] = {}
+    next_index = 0
+
+    def settle(index: int) -> None:
+        if jobs[index].done:
+            finished[index] = jobs.pop(index).result()
+        else:
+            queue.append(index)
+
+    try:
+        while True:
+            while not exhausted and len(jobs) + len(finished) < workers * 4:
+                try:
+                    index, path = next(pending)
+                except StopIteration:
+                    exhausted = True
+                    break
+                jobs[index] = _FileJob(Path(path), chains)
+                settle(index)
+
+            for worker in pool:
+                if worker.task is None and queue:
+                    index = queue.popleft()
+                    worker.start(index, jobs[index], timeout)
+
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+
+            busy = [worker for worker in pool if worker.task is not None]
+            if not busy:
+                if exhausted and not jobs and not finished:
+                    return
+                continue
+
+            wait_for = max(0.0, min(worker.task[2] for worker in busy) - time.monotonic())
+            readable = wait([worker.conn for worker in busy], timeout=wait_for)
+            now = time.monotonic()
+            for worker in busy:
+                index, name, deadline = worker.task
+                if worker.conn in readable:
+                    try:
+                        text, error, seconds = worker.conn.recv()
+                    except (EOFError, OSError):
+                        text, error, seconds = None, "extraction worker crashed", timeout - (deadline - now)
+                        worker.restart()
+                    jobs[index].record(name, seconds, text=text, error=error)
+                elif now >= deadline:
+                    worker.restart()
+                    jobs[index].record(name, timeout, error=f"{name} timed out after {timeout:g}s")
+                else:
+                    continue
+                worker.task = None
+                settle(index)
+    finally:
+        for worker in pool:
+            worker.stop()
@@ -1,13 +1,18 @@
-"""PDF fallback extraction using pdfminer.six."""
+"""PDF text extraction with pdfminer.six and pypdf.
+
+Which extractor runs first is a strategy (PDF_EXTRACT_STRATEGY): see
+extractor_order(). Scripts/pdf_extractor_benchmark.py compares speed and
+downstream parse agreement of the extractors and strategies.
+"""
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 
 from pdfminer.high_level import extract_text
-from pypdf import PdfReader
 
-from job_descr_LLM.parsers.types import ParsedDocument
+from job_descr_LLM.parsers.types import ParsedDocument, Source, rewind
 
 logger = logging.getLogger(__name__)
 
@@ -23,29 +28,89 @@ def _resolve_case_insensitive_path(file_path: Path) -> Path:
     return file_path
 
 
-def parse_pdf(file_path: Path) -> ParsedDocument:
-    file_path = _resolve_case_insensitive_path(Path(file_path))
-    try:
-        text = extract_text(file_path)
-        if not text:
-            raise ValueError("PDF extraction returned no text")
-        return ParsedDocument(text=text, parser="pdfminer", error=None)
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("PDF fallback failed for %s: %s", file_path, exc)
+def pdfminer_text(file_path: Source) -> str:
+    text = extract_text(rewind(file_path))
+    if not text:
+        raise ValueError("PDF extraction returned no text")
+    return text
+
+
+def pypdf_text(file_path: Source) -> str:
+    # Imported here so pdfminer (and DOCX) extraction keeps working without pypdf.
+    from pypdf import PdfReader
+
+    reader = PdfReader(rewind(file_path))
+    pages = []
+    for page in reader.pages:
+        pages.append(page.extract_text() or "")
+    text = "\n".join(pages).strip()
+    if not text:
+        raise ValueError("PyPDF extraction returned no text")
+    return text
+
+
+PDF_EXTRACTORS = {"pdfminer": pdfminer_text, "pypdf": pypdf_text}
+
+# quality-first: pdfminer layout analysis, pypdf only as a fallback (historic default)
+# fast-first: pypdf (much cheaper), pdfminer only when pypdf finds no text
+# adaptive: quality-first for small documents, fast-first for long/large ones
+STRATEGIES = ("quality-first", "fast-first", "adaptive")
+DEFAULT_STRATEGY = os.environ.get("PDF_EXTRACT_STRATEGY", "quality-first")
+ADAPTIVE_MAX_PAGES = int(os.environ.get("PDF_ADAPTIVE_MAX_PAGES", "3"))
+ADAPTIVE_MAX_BYTES = int(os.environ.get("PDF_ADAPTIVE_MAX_BYTES", str(1024 * 1024)))
 
+
+def _page_count(file_path: Source) -> int | None:
     try:
-        reader = PdfReader(str(file_path))
-        pages = []
-        for page in reader.pages:
-            pages.append(page.extract_text() or "")
-        text = "\n".join(pages).strip()
-        if not text:
-            raise ValueError("PyPDF extraction returned no text")
-        return ParsedDocument(text=text, parser="pypdf", error=None)
-    except Exception as exc:  # noqa: BLE001
-        logger.warning("PyPDF fallback failed for %s: %s", file_path, exc)
-        return ParsedDocument(
-            text="",
-            parser="pypdf",
-            error=f"PDF extraction returned no text (pdfminer, pypdf): {exc}",
-        )
+        from pypdf import PdfReader
+
+        return len(PdfReader(rewind(file_path)).pages)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _size(file_path: Source) -> int:
+    if isinstance(file_path, Path):
+        return file_path.stat().st_size
+    file_path.seek(0, os.SEEK_END)
+    return file_path.tell()
+
+
+def extractor_order(file_path: Source, strategy: str | None = None) -> list[str]:
+    """Extractor names to try, in order, for `file_path` under `strategy`."""
+    strategy = strategy or DEFAULT_STRATEGY
+    if strategy == "quality-first":
+        return ["pdfminer", "pypdf"]
+    if strategy == "fast-first":
+        return ["pypdf", "pdfminer"]
+    if strategy == "adaptive":
+        try:
+            size = _size(file_path)
+        except OSError:
+            return ["pdfminer", "pypdf"]
+        if size > ADAPTIVE_MAX_BYTES:
+            return ["pypdf", "pdfminer"]
+        pages = _page_count(file_path)
+        # Unreadable by pypdf: pdfminer is the only real chance.
+        if pages is None or pages <= ADAPTIVE_MAX_PAGES:
+            return ["pdfminer", "pypdf"]
+        return ["pypdf", "pdfminer"]
+    raise ValueError(f"Unknown PDF extraction strategy {strategy!r}; expected one of {STRATEGIES}")
+
+
+def parse_pdf(file_path: Source | str, strategy: str | None = None) -> ParsedDocument:
+    """Extract text from a PDF path or binary stream."""
+    if isinstance(file_path, (str, Path)):
+        file_path = _resolve_case_insensitive_path(Path(file_path))
+    order = extractor_order(file_path, strategy)
+    for name in order:
+        try:
+            return ParsedDocument(text=PDF_EXTRACTORS[name](file_path), parser=name, error=None)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("PDF extraction with %s failed for %s: %s", name, file_path, exc)
+            last_error = exc
+    return ParsedDocument(
+        text="",
+        parser=order[-1],
+        error=f"PDF extraction returned no text ({', '.join(order)}): {last_error}",
+    )
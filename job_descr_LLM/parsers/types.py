@@ -1,8 +1,19 @@
 """Shared parser response types for resume extraction."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Union
+
+# Parsers accept a file path or an in-memory binary stream (e.g. BytesIO).
+Source = Union[Path, BinaryIO]
+
+
+def rewind(source: Source) -> Source:
+    """Streams are read from the start by every parser attempt."""
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
 
 
 @dataclass
@@ -12,3 +23,5 @@ class ParsedDocument:
     text: str
     parser: str
     error: Optional[str]
+    # Seconds spent in each parser tried, in order (includes failed attempts).
+    timings: Dict[str, float] = field(default_factory=dict)
@@ -1,5 +1,5 @@
 """Pipeline utilities for transforming cleaned user inputs."""
 
-from job_descr_LLM.user_input_pipeline.resume_parser import parse_resume
+from job_descr_LLM.user_input_pipeline.resume_parser import parse_resume, parse_resumes_batch
 
-__all__ = ["parse_resume"]
\ No newline at end of file
+__all__ = ["parse_resume", "parse_resumes_batch"]
\ No newline at end of file
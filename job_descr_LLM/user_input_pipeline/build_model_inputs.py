@@ -3,42 +3,67 @@ from __future__ import annotations
 
 import json
 import logging
+from itertools import tee
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
-from job_descr_LLM.user_input_pipeline.resume_parser import parse_resume
+from job_descr_LLM.user_input_pipeline.incremental import StageResult, record_hash, update_stage
+from job_descr_LLM.user_input_pipeline.parse_cache import parser_version
+from job_descr_LLM.user_input_pipeline.resume_parser import parse_resumes_batch
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def build_model_inputs(dataset_root: Path, dataset_version: str) -> None:
+def model_input_rows(
+    records: Iterable[dict], dataset_version: str, workers: int | None = None
+) -> Iterator[dict]:
+    """Parse cleaned records into model_inputs.jsonl rows, preserving order."""
+    records, to_parse = tee(records)
+    texts = (record.get("text", "") for record in to_parse)
+    for record, parsed_resume in zip(records, parse_resumes_batch(texts, workers=workers)):
+        yield {
+            "id": record.get("id"),
+            "text": record.get("text", ""),
+            "state": record.get("state"),
+            "resume_key": record.get("resume_key"),
+            "dataset_version": dataset_version,
+            **parsed_resume,
+        }
+
+
+def build_model_inputs(
+    dataset_root: Path, dataset_version: str, workers: int | None = None, full: bool = False
+) -> StageResult:
+    """Update model_inputs.jsonl, parsing only new or changed clean records (all if `full`).
+
+    The parser source hash is part of every input hash, so editing
+    resume_parser.py reparses everything.
+    """
     clean_path = dataset_root / "resumes_clean.jsonl"
     output_path = dataset_root / "model_inputs.jsonl"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with clean_path.open("r", encoding="utf-8") as clean_fh, output_path.open(
-        "w", encoding="utf-8"
-    ) as output_fh:
-        for line in clean_fh:
-            record = json.loads(line)
-            text = record.get("text", "")
-            parsed_resume = parse_resume(text)
-            model_row = {
-                "id": record.get("id"),
-                "text": text,
-                "state": record.get("state"),
-                "resume_key": record.get("resume_key"),
-                "dataset_version": dataset_version,
-                **parsed_resume,
-            }
-            output_fh.write(json.dumps(model_row) + "\n")
-
-
-def build_from_env(version: str = "v1") -> None:
+    salt = f"{dataset_version}:{parser_version()}"
+
+    def inputs():
+        with clean_path.open("r", encoding="utf-8") as clean_fh:
+            for line in clean_fh:
+                record = json.loads(line)
+                yield record.get("id"), record_hash({"record": record, "salt": salt}), record
+
+    return update_stage(
+        dataset_root,
+        "build",
+        output_path,
+        inputs,
+        lambda records: model_input_rows(records, dataset_version, workers=workers),
+        full=full,
+    )
+
+
+def build_from_env(version: str = "v1", full: bool = False) -> StageResult:
     dataset_root = Path("datasets") / version
-    build_model_inputs(dataset_root, dataset_version=version)
+    return build_model_inputs(dataset_root, dataset_version=version, full=full)
 
 
 if __name__ == "__main__":
-    build_from_env()
\ No newline at end of file
+    build_from_env()
@@ -4,6 +4,9 @@ from __future__ import annotations
 import json
 import re
 from pathlib import Path
+from typing import Iterable, Iterator
+
+from job_descr_LLM.user_input_pipeline.incremental import StageResult, record_hash, update_stage
 
 
 def normalize_text(text: str) -> str:
@@ -18,25 +21,38 @@ def normalize_text(text: str) -> str:
     return normalized.strip()
 
 
-def clean_raw_resumes(dataset_root: Path) -> None:
+def clean_record(record: dict) -> dict:
+    return {**record, "text": normalize_text(record.get("text", ""))}
+
+
+def clean_records(records: Iterable[dict]) -> Iterator[dict]:
+    for record in records:
+        yield clean_record(record)
+
+
+def _read_jsonl(path: Path) -> Iterator[dict]:
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def clean_raw_resumes(dataset_root: Path, full: bool = False) -> StageResult:
+    """Update resumes_clean.jsonl, cleaning only new or changed raw records (all if `full`)."""
     raw_path = dataset_root / "resumes_raw.jsonl"
     output_path = dataset_root / "resumes_clean.jsonl"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with raw_path.open("r", encoding="utf-8") as raw_fh, output_path.open(
-        "w", encoding="utf-8"
-    ) as clean_fh:
-        for line in raw_fh:
-            record = json.loads(line)
-            clean_text = normalize_text(record.get("text", ""))
-            cleaned_record = {**record, "text": clean_text}
-            clean_fh.write(json.dumps(cleaned_record) + "\n")
+    def inputs():
+        for record in _read_jsonl(raw_path):
+            yield record.get("id"), record_hash(record), record
+
+    return update_stage(dataset_root, "clean", output_path, inputs, clean_records, full=full)
 
 
-def clean_from_env(version: str = "v1") -> None:
+def clean_from_env(version: str = "v1", full: bool = False) -> StageResult:
     dataset_root = Path("datasets") / version
-    clean_raw_resumes(dataset_root)
+    return clean_raw_resumes(dataset_root, full=full)
 
 
 if __name__ == "__main__":
-    clean_from_env()
\ No newline at end of file
+    clean_from_env()
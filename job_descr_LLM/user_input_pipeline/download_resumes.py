@@ -1,21 +1,96 @@
-"""Download raw resumes from R2 using the intake manifest."""
+"""Download raw resumes from R2 using the intake manifest.
+
+Objects are fetched by a bounded thread pool sharing one client (and its
+connection pool). A local file with the object's size and ETag is left
+alone, transient errors are retried with exponential backoff, and progress
+and throughput are logged as downloads complete.
+
+download_from_env raises DownloadFailed when any resume could not be
+fetched, so a partial dataset does not silently feed the later pipeline steps.
+
+Env:
+- R2_DOWNLOAD_WORKERS: concurrent downloads (default 16)
+- R2_ALLOW_FAILED_DOWNLOADS=1: log failed downloads instead of raising
+"""
 from __future__ import annotations
 
+import hashlib
+import logging
 import mimetypes
 import os
-from dataclasses import dataclass
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 import boto3
 import pandas as pd
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
 
+logger = logging.getLogger(__name__)
+
 MIME_EXTENSION_MAP = {
     "application/pdf": ".pdf",
     "application/msword": ".doc",
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
 }
 
+DEFAULT_WORKERS = int(os.environ.get("R2_DOWNLOAD_WORKERS", "16"))
+PROGRESS_EVERY = 100
+# Missing objects and bad credentials will not succeed on retry.
+NON_RETRYABLE_CODES = {"404", "NoSuchKey", "403", "AccessDenied", "InvalidAccessKeyId", "SignatureDoesNotMatch"}
+
+
+class DownloadFailed(RuntimeError):
+    """Some resumes could not be downloaded; `report` has the details."""
+
+    def __init__(self, report: "DownloadReport"):
+        shown = "; ".join(f"{key}: {error}" for key, error in report.failed[:5])
+        more = f" (+{len(report.failed) - 5} more)" if len(report.failed) > 5 else ""
+        super().__init__(f"{len(report.failed)} resume download(s) failed: {shown}{more}")
+        self.report = report
+
+
+@dataclass
+class DownloadReport:
+    downloaded: int = 0
+    skipped: int = 0
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes / 2**20 / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.downloaded} downloaded, {self.skipped} up to date, {len(self.failed)} failed; "
+            f"{self.bytes / 2**20:.1f} MiB in {self.seconds:.1f}s ({self.mb_per_second:.2f} MiB/s)"
+        )
+
+
+def _file_md5(path: Path) -> str:
+    digest = hashlib.md5()
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _is_current(destination: Path, head: dict) -> bool:
+    """Local copy matches the object's size and, for single-part uploads, its ETag (MD5)."""
+    if not destination.exists() or destination.stat().st_size != head.get("ContentLength"):
+        return False
+    etag = str(head.get("ETag") or "").strip('"')
+    if not etag or "-" in etag:  # multipart ETags are not an MD5 of the content
+        return True
+    return _file_md5(destination) == etag
+
 
 @dataclass
 class ResumeDownloader:
@@ -23,14 +98,26 @@ class ResumeDownloader:
     endpoint_url: str
     access_key: str
     secret_key: str
+    workers: int = DEFAULT_WORKERS
+    max_attempts: int = 4
+    backoff_seconds: float = 0.5
 
     def _client(self):
+        # One client shared by all download threads (clients are thread-safe);
+        # the pool is sized so every thread keeps a warm connection.
         session = boto3.session.Session()
         return session.client(
             "s3",
             endpoint_url=self.endpoint_url,
             aws_access_key_id=self.access_key,
             aws_secret_access_key=self.secret_key,
+            config=Config(
+                max_pool_connections=max(self.workers, 10),
+                tcp_keepalive=True,
+                # One attempt per call: _fetch retries with its own backoff, and
+                # botocore's legacy mode would still retry under max_attempts=1.
+                retries={"total_max_attempts": 1, "mode": "standard"},
+            ),
         )
 
     def _determine_extension(self, resume_key: str, resume_mime: str | None) -> str:
@@ -41,21 +128,79 @@ class ResumeDownloader:
             return MIME_EXTENSION_MAP[guess]
         return Path(resume_key).suffix or ".bin"
 
-    def download(self, intake_csv: Path, output_dir: Path) -> None:
+    def _fetch(self, client, resume_key: str, destination: Path) -> Tuple[bool, int]:
+        """Download one object unless the local copy is current; returns (downloaded, bytes)."""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                if destination.exists():
+                    head = client.head_object(Bucket=self.bucket, Key=resume_key)
+                    if _is_current(destination, head):
+                        return False, 0
+                tmp_path = destination.with_name(destination.name + ".part")
+                try:
+                    client.download_file(self.bucket, resume_key, str(tmp_path))
+                    os.replace(tmp_path, destination)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                return True, destination.stat().st_size
+            except ClientError as exc:
+                code = str(exc.response.get("Error", {}).get("Code", ""))
+                if code in NON_RETRYABLE_CODES or attempt == self.max_attempts:
+                    raise
+            except (BotoCoreError, OSError):
+                if attempt == self.max_attempts:
+                    raise
+            delay = self.backoff_seconds * 2 ** (attempt - 1)
+            time.sleep(delay + random.uniform(0, delay))
+        raise AssertionError("unreachable")
+
+    def download(self, intake_csv: Path, output_dir: Path) -> DownloadReport:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         df = pd.read_csv(intake_csv)
         client = self._client()
+
+        jobs: List[Tuple[str, Path]] = []
+        report = DownloadReport()
         for _, row in df.iterrows():
             resume_key = row["resume_key"]
             submission_id = row["id"]
-            resume_mime = row.get("resume_mime")
-            ext = self._determine_extension(resume_key, resume_mime)
-            destination = output_dir / f"{submission_id}{ext}"
-            client.download_file(self.bucket, resume_key, str(destination))
+            if pd.isna(resume_key):
+                report.failed.append((f"id={submission_id}", "missing resume_key"))
+                continue
+            resume_key = str(resume_key)
+            ext = self._determine_extension(resume_key, row.get("resume_mime"))
+            jobs.append((resume_key, output_dir / f"{submission_id}{ext}"))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, self.workers), thread_name_prefix="r2-download") as pool:
+            futures = {pool.submit(self._fetch, client, key, dest): key for key, dest in jobs}
+            for done, future in enumerate(as_completed(futures), 1):
+                key = futures[future]
+                try:
+                    downloaded, size = future.result()
+                except Exception as exc:
+                    logger.warning("Failed to download %s: %s", key, exc)
+                    report.failed.append((key, str(exc)))
+                else:
+                    report.downloaded += downloaded
+                    report.skipped += not downloaded
+                    report.bytes += size
+                if done % PROGRESS_EVERY == 0 or done == len(jobs):
+                    report.seconds = time.perf_counter() - start
+                    logger.info("[%d/%d] %s", done, len(jobs), report.summary())
+        report.seconds = time.perf_counter() - start
+        return report
+
 
+def download_from_env(version: str = "v1", allow_failures: Optional[bool] = None) -> DownloadReport:
+    """Downloads datasets/<version>/resumes from the intake manifest.
 
-def download_from_env(version: str = "v1") -> None:
+    Raises DownloadFailed if any download failed, unless allow_failures
+    (default: R2_ALLOW_FAILED_DOWNLOADS=1) opts into a partial dataset.
+    """
+    if allow_failures is None:
+        allow_failures = os.environ.get("R2_ALLOW_FAILED_DOWNLOADS") == "1"
     required_env = [
         "R2_BUCKET",
         "R2_ENDPOINT_URL",
@@ -73,7 +218,11 @@ def download_from_env(version: str = "v1") -> None:
         secret_key=os.environ["R2_SECRET_ACCESS_KEY"],
     )
     dataset_root = Path("datasets") / version
-    downloader.download(dataset_root / "intake.csv", dataset_root / "resumes")
+    report = downloader.download(dataset_root / "intake.csv", dataset_root / "resumes")
+    logger.info("Resume download finished: %s", report.summary())
+    if report.failed and not allow_failures:
+        raise DownloadFailed(report)
+    return report
 
 
 if __name__ == "__main__":
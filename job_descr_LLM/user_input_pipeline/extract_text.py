@@ -1,22 +1,30 @@
-"""Extract resume text using local PDF/DOCX parsers."""
+"""Extract resume text using local PDF/DOCX parsers.
+
+Files are extracted in parallel worker processes with a per-parser timeout
+(see job_descr_LLM.parsers.parallel); set workers/timeout on ExtractOptions
+or via EXTRACT_WORKERS / EXTRACT_TIMEOUT_SECONDS.
+"""
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import tee
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 import pandas as pd
 
-from job_descr_LLM.parsers.docx_extract import parse_docx
-from job_descr_LLM.parsers.pdf_extract import parse_pdf
+from job_descr_LLM.parsers.parallel import extract_documents
 from job_descr_LLM.parsers.types import ParsedDocument
+from job_descr_LLM.user_input_pipeline.incremental import StageResult, file_sha256, record_hash, update_stage
 
 
 @dataclass
 class ExtractOptions:
     dataset_root: Path
     resume_dirname: str = "resumes"
+    workers: Optional[int] = None
+    timeout: Optional[float] = None
 
     @property
     def intake_path(self) -> Path:
@@ -45,50 +53,78 @@ def _detect_extension(resume_key: object, resume_mime: str | None) -> str:
     return ""
 
 
-def _choose_parser(file_path: Path) -> ParsedDocument:
-    suffix = file_path.suffix.lower()
-    if suffix == ".pdf":
-        return parse_pdf(file_path)
-    if suffix in {".doc", ".docx"}:
-        return parse_docx(file_path)
+def _resolve_resume_path(row: pd.Series, options: ExtractOptions) -> Path:
+    submission_id = row["id"]
+    suffix = _detect_extension(row["resume_key"], row.get("resume_mime"))
+    resume_path = options.resume_dir / f"{submission_id}{suffix}" if suffix else None
+    if resume_path is None or not resume_path.exists():
+        matches = list(options.resume_dir.glob(f"{submission_id}.*"))
+        resume_path = matches[0] if matches else None
+    if resume_path is None:
+        resume_path = options.resume_dir / f"{submission_id}.bin"
+    return resume_path
+
+
+def _raw_record(row: pd.Series, parsed: ParsedDocument) -> dict:
+    return {
+        "id": row["id"],
+        "resume_key": row["resume_key"],
+        "resume_mime": row.get("resume_mime"),
+        "state": row.get("state"),
+        "created_at": row.get("created_at"),
+        "parser": parsed.parser,
+        "error": parsed.error,
+        "text": parsed.text,
+        "parser_timings": parsed.timings,
+        "extracted_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def extract_records(rows: Iterable[pd.Series], options: ExtractOptions) -> Iterator[dict]:
+    """Extract intake rows into resumes_raw.jsonl records, in order."""
+    rows, to_extract = tee(rows)
+    paths = (_resolve_resume_path(row, options) for row in to_extract)
+    documents = extract_documents(paths, workers=options.workers, timeout=options.timeout)
+    for row, parsed in zip(rows, documents):
+        yield _raw_record(row, parsed)
+
+
+def iter_extracted(options: ExtractOptions, start: int = 0) -> Iterator[dict]:
+    """Yield extracted records for intake rows `start` onward, in intake order."""
+    df = pd.read_csv(options.intake_path)
+    yield from extract_records((row for _, row in df.iloc[start:].iterrows()), options)
+
 
-    return ParsedDocument(text="", parser="unknown", error="No suitable parser")
+def _row_input_hash(row: pd.Series, options: ExtractOptions) -> str:
+    """Intake fields plus the resume file's content hash."""
+    resume_path = _resolve_resume_path(row, options)
+    file_hash = file_sha256(resume_path) if resume_path.exists() else None
+    fields = {key: row.get(key) for key in ("id", "resume_key", "resume_mime", "state", "created_at")}
+    return record_hash({**fields, "resume_sha256": file_hash})
 
 
-def extract_resumes(options: ExtractOptions) -> None:
+def extract_resumes(options: ExtractOptions, full: bool = False) -> StageResult:
+    """Update resumes_raw.jsonl, extracting only new or changed submissions (all if `full`)."""
     df = pd.read_csv(options.intake_path)
-    options.raw_output.parent.mkdir(parents=True, exist_ok=True)
-    with options.raw_output.open("w", encoding="utf-8") as fh:
+
+    def inputs():
         for _, row in df.iterrows():
-            submission_id = row["id"]
-            resume_key = row["resume_key"]
-            resume_mime = row.get("resume_mime")
-            suffix = _detect_extension(resume_key, resume_mime)
-            resume_path = options.resume_dir / f"{submission_id}{suffix}" if suffix else None
-            if resume_path is None or not resume_path.exists():
-                matches = list(options.resume_dir.glob(f"{submission_id}.*"))
-                resume_path = matches[0] if matches else None
-            if resume_path is None:
-                resume_path = options.resume_dir / f"{submission_id}.bin"
-            parsed = _choose_parser(resume_path)
-            record = {
-                "id": submission_id,
-                "resume_key": resume_key,
-                "resume_mime": resume_mime,
-                "state": row.get("state"),
-                "created_at": row.get("created_at"),
-                "parser": parsed.parser,
-                "error": parsed.error,
-                "text": parsed.text,
-                "extracted_at": datetime.now(timezone.utc).isoformat(),
-            }
-            fh.write(json.dumps(record) + "\n")
-
-
-def extract_from_env(version: str = "v1") -> None:
+            yield row["id"], _row_input_hash(row, options), row
+
+    return update_stage(
+        options.dataset_root,
+        "extract",
+        options.raw_output,
+        inputs,
+        lambda rows: extract_records(rows, options),
+        full=full,
+    )
+
+
+def extract_from_env(version: str = "v1", full: bool = False) -> StageResult:
     dataset_root = Path("datasets") / version
     options = ExtractOptions(dataset_root=dataset_root)
-    extract_resumes(options)
+    return extract_resumes(options, full=full)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,173 @@
+"""Per-record manifests for incremental dataset builds.
+
+Each dataset version keeps datasets/<version>/manifest.json with, per stage
+and record id, the hash of the stage's input, the hash of the line it wrote
+and when it was written. A rebuild then only runs the stage (extraction,
+cleaning, parsing) for records whose input hash changed, whose output line
+no longer matches, or that are new. Unchanged lines are copied from the
+existing output verbatim.
+
+When the only changes are new records after the existing ones, the new lines
+are appended to the output file. Otherwise the file is rewritten from the
+existing lines and the fresh outputs (patched), which drops records that
+left the intake.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import tee
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+# Fields that change on every run without the record changing.
+VOLATILE_FIELDS = {"extracted_at", "parser_timings"}
+
+T = TypeVar("T")
+
+
+def record_hash(record: dict) -> str:
+    stable = {key: value for key, value in record.items() if key not in VOLATILE_FIELDS}
+    payload = json.dumps(stable, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    """record id -> {"input", "output", "at"} per stage, for one dataset version."""
+
+    def __init__(self, path: Path, stages: Optional[Dict[str, Dict[str, dict]]] = None):
+        self.path = path
+        self.stages = stages or {}
+
+    @classmethod
+    def load(cls, dataset_root: Path) -> "Manifest":
+        path = dataset_root / MANIFEST_FILE
+        if not path.exists():
+            return cls(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(path, data.get("stages", {}))
+
+    def entry(self, stage: str, record_id: str) -> Optional[dict]:
+        return self.stages.get(stage, {}).get(record_id)
+
+    def set(self, stage: str, record_id: str, input_hash: str, output_hash: str) -> None:
+        self.stages.setdefault(stage, {})[record_id] = {
+            "input": input_hash,
+            "output": output_hash,
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def retain(self, stage: str, record_ids: Iterable[str]) -> None:
+        keep = set(record_ids)
+        entries = self.stages.get(stage, {})
+        self.stages[stage] = {rid: entry for rid, entry in entries.items() if rid in keep}
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"stages": self.stages}, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+@dataclass
+class StageResult:
+    total: int
+    processed: int
+    removed: int
+    appended: bool
+
+
+def _existing_lines(output_path: Path) -> Dict[str, str]:
+    lines: Dict[str, str] = {}
+    if not output_path.exists():
+        return lines
+    with output_path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                lines[str(json.loads(line).get("id"))] = line if line.endswith("\n") else line + "\n"
+    return lines
+
+
+def update_stage(
+    dataset_root: Path,
+    stage: str,
+    output_path: Path,
+    inputs: Callable[[], Iterable[Tuple[str, str, T]]],
+    transform: Callable[[Iterable[T]], Iterable[dict]],
+    full: bool = False,
+) -> StageResult:
+    """Bring `output_path` up to date with `inputs`, running `transform` only where needed.
+
+    inputs: called twice (plan, then build); yields (record_id, input_hash, payload)
+    in output order. transform: maps the payloads that need work to output
+    records, one per payload, in order.
+    """
+    manifest = Manifest.load(dataset_root)
+    existing = {} if full else _existing_lines(output_path)
+
+    def is_current(record_id: str, input_hash: str) -> bool:
+        entry = manifest.entry(stage, record_id)
+        line = existing.get(record_id)
+        return (
+            entry is not None
+            and line is not None
+            and entry["input"] == input_hash
+            and entry["output"] == record_hash(json.loads(line))
+        )
+
+    plan: List[Tuple[str, bool]] = [
+        (str(record_id), not is_current(str(record_id), input_hash)) for record_id, input_hash, _ in inputs()
+    ]
+    kept = [record_id for record_id, changed in plan if not changed]
+    n_changed = len(plan) - len(kept)
+    append = (
+        bool(existing)
+        and kept == list(existing)
+        and all(changed for _, changed in plan[len(kept):])
+    )
+
+    items: Iterator[Tuple[str, str, T, bool]] = (
+        (str(record_id), input_hash, payload, changed)
+        for (record_id, input_hash, payload), (_, changed) in zip(inputs(), plan)
+    )
+    items, to_transform = tee(items)
+    outputs = iter(transform(payload for _, _, payload, changed in to_transform if changed))
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with (output_path.open("a", encoding="utf-8") if append else tmp_path.open("w", encoding="utf-8")) as fh:
+        for record_id, input_hash, _, changed in items:
+            if not changed:
+                if not append:
+                    fh.write(existing[record_id])
+                continue
+            record = next(outputs)
+            fh.write(json.dumps(record) + "\n")
+            manifest.set(stage, record_id, input_hash, record_hash(record))
+    if not append:
+        os.replace(tmp_path, output_path)
+
+    removed = len(set(existing) - {record_id for record_id, _ in plan})
+    manifest.retain(stage, (record_id for record_id, _ in plan))
+    manifest.save()
+    logger.info(
+        "%s: %d records, %d processed, %d removed (%s)",
+        stage, len(plan), n_changed, removed,
+        "unchanged" if append and not n_changed else "appended" if append else "rewritten",
+    )
+    return StageResult(total=len(plan), processed=n_changed, removed=removed, appended=append)
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
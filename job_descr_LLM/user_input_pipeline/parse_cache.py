@@ -0,0 +1,183 @@
+"""Persistent, content-addressed cache of parse_resume results.
+
+Entries are keyed by (sha256 of the resume text, sha256 of resume_parser.py),
+so editing the parser invalidates every earlier result automatically: rows
+written by another parser version are never returned and are purged the next
+time a cache is opened. Results are stored as JSON in a single SQLite file
+that is shared safely by parser processes and app workers.
+
+The file is bounded in size; once it grows past `max_bytes`, the least
+recently used entries are evicted.
+
+Caching is opt-in. The cache holds parsed resume content (names, contact
+details, work history), so it is off unless RESUME_PARSE_CACHE is set, which
+offline dataset builds do when they re-parse the same corpus repeatedly.
+
+Env:
+- RESUME_PARSE_CACHE: unset or "0" (default) disables caching; "1" uses
+  .cache/resume_parse.sqlite under the repo root; any other value is the path
+  of the SQLite file
+- RESUME_PARSE_CACHE_MAX_MB: size bound in MiB (default 256)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+PARSER_PATH = Path(__file__).resolve().with_name("resume_parser.py")
+DEFAULT_CACHE_PATH = REPO_ROOT / ".cache" / "resume_parse.sqlite"
+DEFAULT_MAX_MB = 256
+EVICT_CHECK_EVERY = 32
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_cache (
+    text_sha256 TEXT NOT NULL,
+    parser_version TEXT NOT NULL,
+    result TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (text_sha256, parser_version)
+);
+CREATE INDEX IF NOT EXISTS ix_parse_cache_last_used ON parse_cache (last_used);
+"""
+
+
+def parser_version(path: Path = PARSER_PATH) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class ParseCache:
+    """SQLite-backed LRU of parsed resumes for one parser version."""
+
+    def __init__(self, path: Path | str, max_bytes: int = DEFAULT_MAX_MB * 2**20, version: Optional[str] = None):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.version = version or parser_version()
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        stale = self._conn.execute("DELETE FROM parse_cache WHERE parser_version != ?", (self.version,)).rowcount
+        if stale:
+            logger.info("Dropped %d parse cache entries from other parser versions", stale)
+
+    def get(self, text: str) -> Optional[Dict[str, object]]:
+        key = text_key(text)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM parse_cache WHERE text_sha256 = ? AND parser_version = ?",
+                (key, self.version),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE parse_cache SET last_used = ? WHERE text_sha256 = ? AND parser_version = ?",
+                (time.time(), key, self.version),
+            )
+        return json.loads(row[0])
+
+    def put(self, text: str, parsed: Dict[str, object]) -> None:
+        payload = json.dumps(parsed, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?, ?)",
+                (text_key(text), self.version, payload, len(payload), time.time()),
+            )
+            self._puts += 1
+            if self._puts % EVICT_CHECK_EVERY == 0:
+                self._evict()
+
+    def parse(self, text: str, parse_fn: Callable[[str], Dict[str, object]]) -> Dict[str, object]:
+        """Returns the cached result for `text`, computing and storing it on a miss."""
+        cached = self.get(text)
+        if cached is not None:
+            return cached
+        parsed = parse_fn(text)
+        self.put(text, parsed)
+        return parsed
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM parse_cache").fetchone()[0]
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        cutoff = None
+        for last_used, size in self._conn.execute("SELECT last_used, size FROM parse_cache ORDER BY last_used"):
+            excess -= size
+            cutoff = last_used
+            if excess <= 0:
+                break
+        evicted = self._conn.execute("DELETE FROM parse_cache WHERE last_used <= ?", (cutoff,)).rowcount
+        logger.info("Evicted %d parse cache entries", evicted)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parse_cache").fetchone()
+        return {
+            "path": str(self.path),
+            "parser_version": self.version[:12],
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM parse_cache")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: Optional[ParseCache] = None
+_cache_pid: Optional[int] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[ParseCache]:
+    """The process-wide cache configured from env, or None when disabled (the default).
+
+    Opened lazily and per process: SQLite connections must not cross fork.
+    """
+    global _cache, _cache_pid
+    location = os.environ.get("RESUME_PARSE_CACHE", "")
+    if location.strip().lower() in {"", "0", "off", "false"}:
+        return None
+    if location.strip().lower() in {"1", "on", "true"}:
+        location = str(DEFAULT_CACHE_PATH)
+    pid = os.getpid()
+    if _cache is None or _cache_pid != pid or _cache.path != Path(location):
+        with _cache_lock:
+            if _cache is None or _cache_pid != pid or _cache.path != Path(location):
+                max_mb = float(os.environ.get("RESUME_PARSE_CACHE_MAX_MB", DEFAULT_MAX_MB))
+                try:
+                    _cache = ParseCache(location, max_bytes=int(max_mb * 2**20))
+                except (OSError, sqlite3.Error):
+                    logger.warning("Resume parse cache unavailable at %s; parsing uncached", location, exc_info=True)
+                    return None
+                _cache_pid = pid
+    return _cache
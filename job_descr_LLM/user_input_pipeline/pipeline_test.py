@@ -14,6 +14,8 @@ How it works:
     3) extract_text.py       -> resumes_raw.jsonl
     4) clean_text.py         -> resumes_clean.jsonl
     5) build_model_inputs.py -> model_inputs.jsonl
+- Stages 3-5 are incremental: only new or changed submissions are processed
+  (per-record manifest in datasets/<version>/manifest.json).
 
 Usage examples:
   python pipeline_test.py --version v1
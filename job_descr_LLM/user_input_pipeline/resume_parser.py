@@ -2,6 +2,8 @@
 
 Public API:
 - parse_resume(text: str) -> dict
+- cached_parse_resume(text: str) -> dict (persistent cache, see parse_cache.py)
+- parse_resumes_batch(texts, workers=N) -> iterator of dicts, in input order
 
 Key heuristics (high-level):
 - Section-scoped extraction: skills are parsed only inside the Skills section; experience
@@ -16,12 +18,15 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from collections.abc import Mapping, Sequence
 
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -30,68 +35,136 @@ logger = logging.getLogger(__name__)
 # ---------------------------- Normalization helpers ----------------------------
 
 
+# Single-character glyphs PDF extraction leaves behind.
+_GLYPH_REPLACEMENTS = {
+    "?": "-",
+    "·": "-",
+    "": "-",
+    "●": "-",
+    "•": "-",
+    "–": "-",
+    "—": "-",
+    " ": " ",
+    # common PDF extraction artifacts
+    "Š": "-",
+    "Œ": "-",
+}
+# str.replace per glyph beats one str.translate table here: translate takes a
+# slow per-character path on non-ASCII text, replace is a C substring scan.
+_GLYPH_PAIRS = tuple((src, tgt) for src, tgt in _GLYPH_REPLACEMENTS.items() if src != tgt)
+
+# De-hyphenate common PDF line breaks: "co-\nmputer" -> "computer"
+_DEHYPHENATE_RE = re.compile(r"(\w)-\n(\w)")
+
+# Stacked headings like "PROFESSIONAL\nSUMMARY", joined onto one line.
+_STACKED_HEADING_RE = re.compile(
+    r"(?mi)\b(?:(?P<first>PROFESSIONAL|SKILLS)\s*\n\s*SUMMARY|WORK\s*\n\s*HISTORY)\b"
+)
+
+# Headings that may share a line with content; split onto their own line.
+# Order matters: after a split, the remainder of the line is only checked
+# against headings later in this list (see _split_inline_headings).
+INLINE_HEADINGS = [
+    "PROFESSIONAL SUMMARY",
+    "SUMMARY",
+    "SKILLS SUMMARY",
+    "SKILLS",
+    "WORK HISTORY",
+    "EXPERIENCE",
+    "PROFESSIONAL EXPERIENCE",
+    "WORK EXPERIENCE",
+    "RELEVANT EXPERIENCE",
+    "EDUCATION",
+    "PROJECTS",
+    "CERTIFICATIONS",
+    "LICENSURE & CERTIFICATIONS",
+    "LICENSES & CERTIFICATIONS",
+    "TECHNICAL SKILLS",
+    "RELEVANT SKILLS",
+    "CLINICAL SKILLS",
+    "TOOLS",
+    "TECHNOLOGIES",
+    "ADDITIONAL INFORMATION",
+    "PUBLICATIONS",
+    "VOLUNTEER EXPERIENCE",
+]
+
+
+def _inline_heading_pattern(heading: str) -> str:
+    if heading == "SKILLS":
+        return r"SKILLS(?!\s+SUMMARY)"
+    return re.escape(heading)
+
+
+# One alternation for every heading at a line start; the named group tells which matched.
+_INLINE_HEADING_RE = re.compile(
+    "(?im)^(?:"
+    + "|".join(f"(?P<h{i}>{_inline_heading_pattern(h)})" for i, h in enumerate(INLINE_HEADINGS))
+    + r")\s+(?=\S)"
+)
+# Per-heading patterns anchored at an arbitrary position, for content left on
+# the line after a split.
+_INLINE_HEADING_AT = [
+    re.compile(rf"(?i)(?P<h>{_inline_heading_pattern(h)})\s+(?=\S)") for h in INLINE_HEADINGS
+]
+
+# Runs of spaces/tabs/form feeds/CRs -> one space. Lone single spaces are not
+# matched at all, so ordinary word gaps cost nothing.
+_COLLAPSE_SPACES_RE = re.compile(r" [ \t\f\r]+|[\t\f\r][ \t\f\r]*")
+
+
+def _join_stacked_heading(match: re.Match) -> str:
+    first = match.group("first")
+    if first is None:
+        return "WORK HISTORY"
+    return "PROFESSIONAL SUMMARY" if first.upper() == "PROFESSIONAL" else "SKILLS SUMMARY"
+
+
+def _split_inline_headings(text: str) -> str:
+    """Put headings that share a line with content on their own line.
+
+    Equivalent to applying each INLINE_HEADINGS pattern in list order: once a
+    heading is split off, whatever now starts the next line can still be split
+    by a heading that comes later in the list, but not by an earlier one.
+    """
+    out: List[str] = []
+    pos = 0
+    for match in _INLINE_HEADING_RE.finditer(text):
+        if match.start() < pos:
+            continue  # already consumed as part of a chain below
+        index = int(match.lastgroup[1:])
+        out.append(text[pos : match.start()])
+        out.append(match.group(match.lastgroup))
+        out.append("\n")
+        pos = match.end()
+        while True:
+            for later in range(index + 1, len(INLINE_HEADINGS)):
+                chained = _INLINE_HEADING_AT[later].match(text, pos)
+                if chained:
+                    break
+            else:
+                break
+            index = later
+            out.append(chained.group("h"))
+            out.append("\n")
+            pos = chained.end()
+    out.append(text[pos:])
+    return "".join(out)
+
+
 def _normalize_text(text: str) -> str:
     """Normalize bullets/dashes/whitespace for PDF-extracted text."""
-    replacements = {
-        "?": "-",
-        "·": "-",
-        "": "-",
-        "●": "-",
-        "•": "-",
-        "–": "-",
-        "—": "-",
-        " ": " ",
-        # common PDF extraction artifacts
-        "Š": "-",
-        "Œ": "-",
-    }
-    for src, tgt in replacements.items():
+    for src, tgt in _GLYPH_PAIRS:
         text = text.replace(src, tgt)
-
-    # De-hyphenate common PDF line breaks: "co-\nmputer" -> "computer"
-    text = re.sub(r"(\w)-\n(\w)", r"\1\2", text)
-
-    # Join stacked headings like "PROFESSIONAL\nSUMMARY".
-    text = re.sub(r"(?mi)\bPROFESSIONAL\s*\n\s*SUMMARY\b", "PROFESSIONAL SUMMARY", text)
-    text = re.sub(r"(?mi)\bSKILLS\s*\n\s*SUMMARY\b", "SKILLS SUMMARY", text)
-    text = re.sub(r"(?mi)\bWORK\s*\n\s*HISTORY\b", "WORK HISTORY", text)
-
-    # If a heading shares a line with content, split it onto its own line.
-    inline_headings = [
-        "PROFESSIONAL SUMMARY",
-        "SUMMARY",
-        "SKILLS SUMMARY",
-        "SKILLS",
-        "WORK HISTORY",
-        "EXPERIENCE",
-        "PROFESSIONAL EXPERIENCE",
-        "WORK EXPERIENCE",
-        "RELEVANT EXPERIENCE",
-        "EDUCATION",
-        "PROJECTS",
-        "CERTIFICATIONS",
-        "LICENSURE & CERTIFICATIONS",
-        "LICENSES & CERTIFICATIONS",
-        "TECHNICAL SKILLS",
-        "RELEVANT SKILLS",
-        "CLINICAL SKILLS",
-        "TOOLS",
-        "TECHNOLOGIES",
-        "ADDITIONAL INFORMATION",
-        "PUBLICATIONS",
-        "VOLUNTEER EXPERIENCE",
-    ]
-    for heading in inline_headings:
-        if heading == "SKILLS":
-            pattern = re.compile(r"(?im)^(?P<h>SKILLS)(?!\s+SUMMARY)\s+(?=\S)")
-        else:
-            pattern = re.compile(rf"(?im)^(?P<h>{re.escape(heading)})\s+(?=\S)")
-        text = pattern.sub(r"\g<h>\n", text)
-
+    if "-\n" in text:
+        text = _DEHYPHENATE_RE.sub(r"\1\2", text)
+    # casefold() maps every character (?i) matches for these letters onto them
+    folded = text.casefold()
+    if "summary" in folded or "story" in folded:
+        text = _STACKED_HEADING_RE.sub(_join_stacked_heading, text)
+    text = _split_inline_headings(text)
     # Collapse whitespace
-    text = re.sub(r"[\t\f\r]+", " ", text)
-    text = re.sub(r" +", " ", text)
-    return text
+    return _COLLAPSE_SPACES_RE.sub(" ", text)
 
 
 def _lines(text: str) -> List[str]:
@@ -326,30 +399,42 @@ def _unique_preserve_order(items: Iterable[str]) -> List[str]:
     return ordered
 
 
-def _find_section_span(lines: Sequence[str], heading_re: re.Pattern[str]) -> Tuple[int, int] | None:
+SectionIndex = Dict[int, Tuple[int, int]]
+
+
+def _section_index(lines: Sequence[str]) -> SectionIndex:
+    """Map each known heading line to the (start, end) span of its section.
+
+    Built with a single MASTER_HEADING scan; every section parser looks its
+    heading up here instead of rescanning the whole resume. Each specific
+    HEADING_* pattern is a subset of MASTER_HEADING, so its heading is always
+    one of these lines.
+    """
+    heads = [i for i, line in enumerate(lines) if _is_clean_heading_line(line, MASTER_HEADING)]
+    ends = heads[1:] + [len(lines)]
+    return {head: (head + 1, end) for head, end in zip(heads, ends)}
+
+
+def _find_section_span(
+    lines: Sequence[str],
+    heading_re: re.Pattern[str],
+    sections: SectionIndex | None = None,
+) -> Tuple[int, int] | None:
     """Return (start, end) span of a section (excluding heading line).
 
     Section termination uses only *known* section headings, not generic ALL-CAPS
     lines (job titles are often ALL-CAPS).
     """
-    start = None
-    for i, line in enumerate(lines):
-        if _is_clean_heading_line(line, heading_re):
-            start = i + 1
-            break
-    if start is None:
-        return None
-
-    end = len(lines)
-    for j in range(start, len(lines)):
-        if _is_clean_heading_line(lines[j], MASTER_HEADING):
-            end = j
-            break
-    return start, end
+    if sections is None:
+        sections = _section_index(lines)
+    for head, span in sections.items():
+        if _is_clean_heading_line(lines[head], heading_re):
+            return span
+    return None
 
 
-def _parse_skill_categories(lines: Sequence[str]) -> Dict[str, List[str]]:
-    span = _find_section_span(lines, HEADING_SKILLS)
+def _parse_skill_categories(lines: Sequence[str], sections: SectionIndex | None = None) -> Dict[str, List[str]]:
+    span = _find_section_span(lines, HEADING_SKILLS, sections)
     scoped = lines[span[0] : span[1]] if span else []
     if not scoped:
         return {}
@@ -789,10 +874,10 @@ def _infer_title_company_from_context(
     return title, company
 
 
-def _parse_experience(lines: Sequence[str]) -> List[Dict[str, object]]:
+def _parse_experience(lines: Sequence[str], sections: SectionIndex | None = None) -> List[Dict[str, object]]:
     experiences: List[Dict[str, object]] = []
 
-    span = _find_section_span(lines, HEADING_EXPERIENCE)
+    span = _find_section_span(lines, HEADING_EXPERIENCE, sections)
     scoped = lines[span[0] : span[1]] if span else lines
 
     date_idxs = _collect_date_anchors(scoped)
@@ -945,8 +1030,8 @@ def _parse_experience(lines: Sequence[str]) -> List[Dict[str, object]]:
 # ---------------------------- Education extraction ------------------------------
 
 
-def _parse_education(lines: Sequence[str]) -> str:
-    span = _find_section_span(lines, HEADING_EDU)
+def _parse_education(lines: Sequence[str], sections: SectionIndex | None = None) -> str:
+    span = _find_section_span(lines, HEADING_EDU, sections)
     scoped = lines[span[0] : span[1]] if span else lines
 
     edu_lines: List[str] = []
@@ -1105,8 +1190,8 @@ def _tokenize_list_content(s: str) -> List[str]:
 # ---------------------------- Projects / certifications -------------------------
 
 
-def _parse_projects(lines: Sequence[str]) -> List[str]:
-    span = _find_section_span(lines, HEADING_PROJECTS)
+def _parse_projects(lines: Sequence[str], sections: SectionIndex | None = None) -> List[str]:
+    span = _find_section_span(lines, HEADING_PROJECTS, sections)
     scoped = lines[span[0] : span[1]] if span else []
     projects: List[str] = []
     for line in scoped:
@@ -1116,8 +1201,8 @@ def _parse_projects(lines: Sequence[str]) -> List[str]:
     return _unique_preserve_order(projects)
 
 
-def _parse_certifications(lines: Sequence[str]) -> List[str]:
-    span = _find_section_span(lines, HEADING_CERTS)
+def _parse_certifications(lines: Sequence[str], sections: SectionIndex | None = None) -> List[str]:
+    span = _find_section_span(lines, HEADING_CERTS, sections)
     scoped = lines[span[0] : span[1]] if span else []
     certs: List[str] = []
     for line in scoped:
@@ -1153,8 +1238,8 @@ def _parse_certifications(lines: Sequence[str]) -> List[str]:
     return _unique_preserve_order(certs)
 
 
-def _parse_volunteer_experience(lines: Sequence[str]) -> List[Dict[str, object]]:
-    span = _find_section_span(lines, HEADING_VOLUNTEER)
+def _parse_volunteer_experience(lines: Sequence[str], sections: SectionIndex | None = None) -> List[Dict[str, object]]:
+    span = _find_section_span(lines, HEADING_VOLUNTEER, sections)
     scoped = lines[span[0] : span[1]] if span else []
     if not scoped:
         return []
@@ -1229,10 +1314,11 @@ def _parse_clearances(text: str) -> str:
 def parse_resume(text: str) -> Dict[str, object]:
     """Parse resume text into structured fields."""
     line_list = _lines(text)
+    sections = _section_index(line_list)
 
     explicit_years = _parse_years_experience(text)
-    experience = _parse_experience(line_list)
-    volunteer_experience = _parse_volunteer_experience(line_list)
+    experience = _parse_experience(line_list, sections)
+    volunteer_experience = _parse_volunteer_experience(line_list, sections)
     if volunteer_experience:
         experience.extend(volunteer_experience)
 
@@ -1246,12 +1332,12 @@ def parse_resume(text: str) -> Dict[str, object]:
                 years.append(y)
         years_experience = int(sum(years)) if years else 0
 
-    education = _parse_education(line_list)
+    education = _parse_education(line_list, sections)
     education_entries = _parse_education_entries(education)
-    projects = _parse_projects(line_list)
-    certifications = _parse_certifications(line_list)
+    projects = _parse_projects(line_list, sections)
+    certifications = _parse_certifications(line_list, sections)
     clearances_or_work_auth = _parse_clearances(text)
-    skill_categories = _parse_skill_categories(line_list)
+    skill_categories = _parse_skill_categories(line_list, sections)
     skills = _flatten_skill_categories(skill_categories)
 
     return {
@@ -1267,21 +1353,80 @@ def parse_resume(text: str) -> Dict[str, object]:
     }
 
 
+def cached_parse_resume(text: str) -> Dict[str, object]:
+    """parse_resume through the on-disk parse cache (when enabled)."""
+    from job_descr_LLM.user_input_pipeline.parse_cache import get_cache
+
+    cache = get_cache()
+    return cache.parse(text, parse_resume) if cache is not None else parse_resume(text)
+
+
+# ---------------------------- Batch parsing -------------------------------------
+
+DEFAULT_BATCH_CHUNKSIZE = 32
+
+
+def _default_workers() -> int:
+    return int(os.environ.get("RESUME_PARSE_WORKERS", "0")) or os.cpu_count() or 1
+
+
+def _parse_chunk(texts: List[str]) -> List[Dict[str, object]]:
+    return [cached_parse_resume(text) for text in texts]
+
+
+def _chunked(texts: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for text in texts:
+        chunk.append(text)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parse_resumes_batch(
+    texts: Iterable[str],
+    workers: int | None = None,
+    chunksize: int = DEFAULT_BATCH_CHUNKSIZE,
+) -> Iterator[Dict[str, object]]:
+    """Parse many resumes across a process pool, yielding results in input order.
+
+    Texts are dispatched in chunks of `chunksize` to amortize pickling, and at
+    most two chunks per worker are in flight, so `texts` is consumed lazily and
+    memory stays bounded on arbitrarily large inputs.
+
+    workers: pool size (default RESUME_PARSE_WORKERS or the CPU count);
+    1 parses in the calling process. Results go through cached_parse_resume.
+    """
+    workers = workers or _default_workers()
+    if workers <= 1:
+        for text in texts:
+            yield cached_parse_resume(text)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunked(texts, chunksize):
+            pending.append(pool.submit(_parse_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
 # ---------------------------- Evaluation harness --------------------------------
 
 
-def evaluate_on_jsonl(path: Path, sample_size: int | None = 200) -> Dict[str, float]:
+def evaluate_on_jsonl(path: Path, sample_size: int | None = 200, workers: int | None = None) -> Dict[str, float]:
     """Run quick recall-oriented metrics over a JSONL of resumes."""
     totals = Counter()
     experience_counts: List[int] = []
 
     with path.open("r", encoding="utf-8") as fh:
-        for idx, line in enumerate(fh):
-            if sample_size is not None and idx >= sample_size:
-                break
-            record = json.loads(line)
-            parsed = parse_resume(record.get("text", ""))
-
+        lines = fh if sample_size is None else islice(fh, sample_size)
+        texts = (json.loads(line).get("text", "") for line in lines)
+        for parsed in parse_resumes_batch(texts, workers=workers):
             totals["resumes"] += 1
             totals["nonempty_experience"] += bool(parsed["experience"])
             totals["nonempty_skills"] += bool(parsed["skills"])
@@ -1297,4 +1442,4 @@ def evaluate_on_jsonl(path: Path, sample_size: int | None = 200) -> Dict[str, fl
     }
 
 
-__all__ = ["parse_resume", "evaluate_on_jsonl"]
+__all__ = ["parse_resume", "cached_parse_resume", "parse_resumes_batch", "evaluate_on_jsonl"]
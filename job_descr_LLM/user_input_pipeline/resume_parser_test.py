@@ -8,6 +8,7 @@ Paths are resolved relative to the repo root so it can be run from any cwd.
 Usage:
   python resume_parser_test.py --version v1
   python resume_parser_test.py --version v1 --limit 50
+  python resume_parser_test.py --version v1 --workers 8
 """
 from __future__ import annotations
 
@@ -16,8 +17,9 @@ import csv
 import json
 import sys
 from difflib import unified_diff
+from itertools import tee
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 def resolve_repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
@@ -28,7 +30,7 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 
-from job_descr_LLM.user_input_pipeline.resume_parser import parse_resume  # noqa: E402
+from job_descr_LLM.user_input_pipeline.resume_parser import parse_resumes_batch  # noqa: E402
 
 
 def load_jsonl(path: Path) -> List[Dict[str, Any]]:
@@ -143,6 +145,7 @@ def main() -> int:
     parser.add_argument("--datasets-root", default="datasets", help="Root datasets folder (default: datasets)")
     parser.add_argument("--expected-file", default="resume_parser_expected.jsonl", help="Expected/actual JSONL file name")
     parser.add_argument("--limit", type=int, default=None, help="Optional cap on number of resumes to test")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
     args = parser.parse_args()
 
     repo_root = resolve_repo_root()
@@ -170,9 +173,10 @@ def main() -> int:
     mismatched = 0
     skipped = 0
 
-    with clean_path.open("r", encoding="utf-8") as fh:
+    def selected_records(fh) -> Iterator[Dict[str, Any]]:
+        count = 0
         for line in fh:
-            if args.limit is not None and total >= args.limit:
+            if args.limit is not None and count >= args.limit:
                 break
             line = line.strip()
             if not line:
@@ -185,8 +189,15 @@ def main() -> int:
             if str(record_id) not in allowed_ids:
                 continue
 
+            count += 1
+            yield record
+
+    with clean_path.open("r", encoding="utf-8") as fh:
+        records, to_parse = tee(selected_records(fh))
+        texts = (record.get("text", "") for record in to_parse)
+        for record, actual in zip(records, parse_resumes_batch(texts, workers=args.workers)):
+            record_id = record.get("id")
             total += 1
-            actual = parse_resume(record.get("text", ""))
             existing = expected_index.get(str(record_id))
             expected = existing.get("expected", {}) if existing else {}
             if not isinstance(expected, dict):
@@ -0,0 +1,169 @@
+"""Single-pass extract -> clean -> parse -> write pipeline for a dataset version.
+
+Running extract_text, clean_text and build_model_inputs one after another
+reads and re-serializes every record three times. This module chains their
+record-level generators instead, so each intake row is extracted, cleaned and
+parsed once and memory stays bounded by the parser's in-flight window.
+
+model_inputs.jsonl is always written; resumes_raw.jsonl and
+resumes_clean.jsonl are written only for the stages named in `persist`.
+
+Every `commit_every` records (and when a run fails) the outputs are fsynced
+and a checkpoint with the record count and byte offset of every output file
+is written to pipeline_checkpoint.json. With resume=True a later run
+truncates the outputs back to those offsets and continues from the next
+intake row. The checkpoint is removed after a successful run.
+
+Usage:
+  python -m job_descr_LLM.user_input_pipeline.stream_pipeline --version v1
+  python -m job_descr_LLM.user_input_pipeline.stream_pipeline --version v1 --persist clean --resume
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+from itertools import tee
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional
+
+from job_descr_LLM.user_input_pipeline.build_model_inputs import model_input_rows
+from job_descr_LLM.user_input_pipeline.clean_text import clean_record
+from job_descr_LLM.user_input_pipeline.extract_text import ExtractOptions, iter_extracted
+from job_descr_LLM.user_input_pipeline.incremental import file_sha256
+
+logger = logging.getLogger(__name__)
+
+STAGE_FILES = {
+    "raw": "resumes_raw.jsonl",
+    "clean": "resumes_clean.jsonl",
+    "model_inputs": "model_inputs.jsonl",
+}
+CHECKPOINT_FILE = "pipeline_checkpoint.json"
+DEFAULT_COMMIT_EVERY = 25
+
+
+def iter_pipeline(
+    options: ExtractOptions,
+    dataset_version: str,
+    start: int = 0,
+    workers: Optional[int] = None,
+) -> Iterator[Dict[str, dict]]:
+    """Yield {"raw", "clean", "model_inputs"} records per intake row, in intake order."""
+    staged = ({"raw": raw, "clean": clean_record(raw)} for raw in iter_extracted(options, start=start))
+    staged, to_parse = tee(staged)
+    rows = model_input_rows((stages["clean"] for stages in to_parse), dataset_version, workers=workers)
+    for stages, model_row in zip(staged, rows):
+        stages["model_inputs"] = model_row
+        yield stages
+
+
+def _commit(
+    checkpoint_path: Path,
+    handles: Dict[str, BinaryIO],
+    records: int,
+    offsets: Dict[str, int],
+    meta: dict,
+) -> None:
+    for fh in handles.values():
+        fh.flush()
+        os.fsync(fh.fileno())
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps({**meta, "records": records, "offsets": offsets}), encoding="utf-8")
+    os.replace(tmp_path, checkpoint_path)
+
+
+def run_pipeline(
+    dataset_root: Path,
+    dataset_version: str,
+    persist: Iterable[str] = ("raw", "clean"),
+    resume: bool = False,
+    workers: Optional[int] = None,
+    commit_every: int = DEFAULT_COMMIT_EVERY,
+) -> int:
+    """Run all stages in one pass; returns the total number of records written."""
+    options = ExtractOptions(dataset_root=dataset_root)
+    unknown = set(persist) - {"raw", "clean"}
+    if unknown:
+        raise ValueError(f"Unknown stages to persist: {sorted(unknown)}")
+    stages = [stage for stage in ("raw", "clean") if stage in persist] + ["model_inputs"]
+    checkpoint_path = dataset_root / CHECKPOINT_FILE
+    meta = {
+        "dataset_version": dataset_version,
+        "stages": stages,
+        "intake_sha256": file_sha256(options.intake_path),
+    }
+
+    start = 0
+    offsets = {stage: 0 for stage in stages}
+    if resume and checkpoint_path.exists():
+        checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        for key, value in meta.items():
+            if checkpoint.get(key) != value:
+                raise ValueError(f"Checkpoint {checkpoint_path} does not match this run ({key} changed); rerun without resume")
+        start = checkpoint["records"]
+        offsets = checkpoint["offsets"]
+        logger.info("Resuming %s after %d committed records", dataset_root, start)
+
+    dataset_root.mkdir(parents=True, exist_ok=True)
+    handles: Dict[str, BinaryIO] = {}
+    records = start
+    try:
+        for stage in stages:
+            fh = (dataset_root / STAGE_FILES[stage]).open("r+b" if start else "wb")
+            fh.truncate(offsets[stage])
+            fh.seek(offsets[stage])
+            handles[stage] = fh
+
+        for staged in iter_pipeline(options, dataset_version, start=start, workers=workers):
+            for stage, fh in handles.items():
+                fh.write((json.dumps(staged[stage]) + "\n").encode("utf-8"))
+            records += 1
+            offsets = {stage: fh.tell() for stage, fh in handles.items()}
+            if records % commit_every == 0:
+                _commit(checkpoint_path, handles, records, offsets, meta)
+    except BaseException:
+        if handles:
+            _commit(checkpoint_path, handles, records, offsets, meta)
+            logger.error("Pipeline stopped after %d committed records; rerun with resume to continue", records)
+        raise
+    finally:
+        for fh in handles.values():
+            fh.close()
+
+    checkpoint_path.unlink(missing_ok=True)
+    return records
+
+
+def run_from_env(version: str = "v1") -> int:
+    dataset_root = Path("datasets") / version
+    return run_pipeline(dataset_root, dataset_version=version)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--version", default="v1", help="Dataset version folder name (default: v1)")
+    parser.add_argument("--datasets-root", default="datasets", help="Root datasets folder (default: datasets)")
+    parser.add_argument("--persist", default="raw,clean", help="Intermediate stages to write: raw,clean (or empty)")
+    parser.add_argument("--resume", action="store_true", help="Continue from the last checkpoint")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument("--commit-every", type=int, default=DEFAULT_COMMIT_EVERY)
+    args = parser.parse_args()
+
+    persist = [stage.strip() for stage in args.persist.split(",") if stage.strip()]
+    dataset_root = Path(args.datasets_root) / args.version
+    total = run_pipeline(
+        dataset_root,
+        dataset_version=args.version,
+        persist=persist,
+        resume=args.resume,
+        workers=args.workers,
+        commit_every=args.commit_every,
+    )
+    print(f"[OK] Wrote {total} records to {dataset_root / STAGE_FILES['model_inputs']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,35 @@
+"""Add outbound_email table for queued email delivery.
+
+Revision ID: 20261018_add_outbound_email
+Revises: 20261018_add_resume_ingest_job
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261018_add_outbound_email"
+down_revision = "20261018_add_resume_ingest_job"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "outbound_email",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("to", sa.JSON(), nullable=False),
+        sa.Column("subject", sa.String(length=300), nullable=False),
+        sa.Column("html", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_outbound_email_status", "outbound_email", ["status"])
+
+
+def downgrade():
+    op.drop_index("ix_outbound_email_status", table_name="outbound_email")
+    op.drop_table("outbound_email")
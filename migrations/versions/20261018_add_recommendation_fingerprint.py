@@ -0,0 +1,28 @@
+"""Add profile/catalog fingerprint columns to job_recommendation.
+
+Lets POST /api/recommendations skip rescoring when neither the profile nor the
+job catalog changed, and score only newly added jobs when just the catalog grew.
+
+Revision ID: 20261018_add_recommendation_fingerprint
+Revises: 20260408_add_culture_narratives
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261018_add_recommendation_fingerprint"
+down_revision = "20260408_add_culture_narratives"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("job_recommendation", sa.Column("profile_fingerprint", sa.String(length=64), nullable=True))
+    op.add_column("job_recommendation", sa.Column("catalog_size", sa.Integer(), nullable=True))
+    op.add_column("job_recommendation", sa.Column("catalog_fingerprint", sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    op.drop_column("job_recommendation", "catalog_fingerprint")
+    op.drop_column("job_recommendation", "catalog_size")
+    op.drop_column("job_recommendation", "profile_fingerprint")
@@ -0,0 +1,33 @@
+"""Add recommendation_job table for asynchronous recommendation scoring.
+
+Revision ID: 20261018_add_recommendation_job
+Revises: 20261018_add_recommendation_fingerprint
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261018_add_recommendation_job"
+down_revision = "20261018_add_recommendation_fingerprint"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "recommendation_job",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("profile_text", sa.Text(), nullable=False),
+        sa.Column("error", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_recommendation_job_user_id", "recommendation_job", ["user_id"])
+
+
+def downgrade():
+    op.drop_index("ix_recommendation_job_user_id", table_name="recommendation_job")
+    op.drop_table("recommendation_job")
@@ -0,0 +1,35 @@
+"""Add resume_ingest_job table for asynchronous resume parsing.
+
+Revision ID: 20261018_add_resume_ingest_job
+Revises: 20261018_add_recommendation_job
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261018_add_resume_ingest_job"
+down_revision = "20261018_add_recommendation_job"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "resume_ingest_job",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("resume_key", sa.String(length=500), nullable=False),
+        sa.Column("resume_mime", sa.String(length=100), nullable=False),
+        sa.Column("record_snapshot", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("error", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_resume_ingest_job_user_id", "resume_ingest_job", ["user_id"])
+
+
+def downgrade():
+    op.drop_index("ix_resume_ingest_job_user_id", table_name="resume_ingest_job")
+    op.drop_table("resume_ingest_job")
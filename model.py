@@ -5,6 +5,9 @@ This module defines the database schema used by the Flask backend, including:
 
 - User: Authentication/authorization data and a flexible JSON profile payload.
 - JobRecommendation: Stores per-user job recommendations with a score and timestamp.
+- RecommendationJob: Queued/background recommendation scoring runs and their status.
+- ResumeIngestJob: Queued/background resume download, extraction and parsing runs.
+- OutboundEmail: Emails queued for delivery by the background worker, with retry state.
 - AuditLog: Security and activity logging for traceability and monitoring.
 - IntakeSubmission: Pre-launch / intake form submissions with resume upload metadata.
 
@@ -27,10 +30,81 @@ class JobRecommendation(db.Model):
     job_id = db.Column(db.Integer, nullable=False)
     score = db.Column(db.Float, nullable=False)
     created_at = db.Column(db.DateTime, server_default=db.func.now())
+    # What the score was computed from: sha256 of prepared profile text + model, and
+    # the size/fingerprint of the job catalog at scoring time (see profile2model.refresh_top_mlscores).
+    profile_fingerprint = db.Column(db.String(64), nullable=True)
+    catalog_size = db.Column(db.Integer, nullable=True)
+    catalog_fingerprint = db.Column(db.String(64), nullable=True)
 
     user = db.relationship("User", backref="recommendations")
 
 
+class RecommendationJob(db.Model):
+    """A recommendation scoring run queued by POST /api/recommendations in async mode.
+
+    status moves queued -> running -> done | failed; results are written to
+    JobRecommendation when the run completes.
+    """
+
+    __tablename__ = "recommendation_job"
+
+    id = db.Column(db.String(36), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False, index=True)
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    profile_text = db.Column(db.Text, nullable=False)
+    error = db.Column(db.String(500))
+    created_at = db.Column(db.DateTime, server_default=db.func.now(), nullable=False)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    user = db.relationship("User", backref="recommendation_jobs")
+
+
+class ResumeIngestJob(db.Model):
+    """A resume download -> extract -> parse run queued after an upload.
+
+    status moves queued -> running -> done | failed; the parsed fields are
+    merged into the user's profile_data, whose parseStatus mirrors the job.
+    """
+
+    __tablename__ = "resume_ingest_job"
+
+    id = db.Column(db.String(36), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False, index=True)
+    resume_key = db.Column(db.String(500), nullable=False)
+    resume_mime = db.Column(db.String(100), nullable=False)
+    # Keep a _parsedResumeSnapshot for parser-correction training data (profile uploads).
+    record_snapshot = db.Column(db.Boolean, nullable=False, default=False)
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    error = db.Column(db.String(500))
+    created_at = db.Column(db.DateTime, server_default=db.func.now(), nullable=False)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    user = db.relationship("User", backref="resume_ingest_jobs")
+
+
+class OutboundEmail(db.Model):
+    """An email waiting for (or done with) delivery; see email_queue.py.
+
+    status moves queued -> sending -> sent | failed; a failed attempt before
+    the last puts it back to queued with next_attempt_at pushed back.
+    """
+
+    __tablename__ = "outbound_email"
+
+    id = db.Column(db.Integer, primary_key=True)
+    to = db.Column(JSON, nullable=False)  # list of addresses
+    subject = db.Column(db.String(300), nullable=False)
+    html = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default="queued", index=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, server_default=db.func.now())
+    last_error = db.Column(db.String(500))
+    created_at = db.Column(db.DateTime, server_default=db.func.now(), nullable=False)
+    sent_at = db.Column(db.DateTime)
+
+
 class User(db.Model):
     """Application user record, including auth credentials and profile metadata."""
 
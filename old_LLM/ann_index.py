@@ -0,0 +1,286 @@
+"""Top-k job retrieval over the persisted job embedding matrix.
+
+Every index exposes the same call:
+
+    index.top_k(profile_vector, k) -> [(job_id, score), ...]   # best first
+
+Implementations:
+    ExactIndex  brute-force matrix-vector product + argpartition. Always correct,
+                and the fastest option for small catalogs.
+    IVFIndex    inverted-file index (k-means coarse quantizer, numpy only). Only
+                the `nprobe` closest clusters are scored, so query cost grows
+                with n / nlist * nprobe instead of n.
+    HNSWIndex   graph index backed by the optional `hnswlib` package.
+
+IVF and HNSW structures are built offline next to the embeddings:
+
+    python -m old_LLM.ann_index --embeddings LLM/job_embeddings --kind ivf
+
+`load_index(store)` picks the exact scorer for catalogs below
+EXACT_THRESHOLD jobs and otherwise whichever prebuilt structure is on disk.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import os
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .job_embeddings import JobEmbeddingStore
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+logger = logging.getLogger(__name__)
+
+EXACT_THRESHOLD = int(os.environ.get("ANN_EXACT_THRESHOLD", "50000"))
+IVF_FILE = "ivf.npz"
+HNSW_FILE = "hnsw.bin"
+HNSW_META_FILE = "hnsw.json"
+
+ScoredJob = Tuple[int, float]
+
+
+def _unit(vector: np.ndarray) -> Optional[np.ndarray]:
+    vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return None
+    return vector / norm
+
+
+def _select_top(rows: np.ndarray, scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k best scores, ordered by score desc then row asc."""
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    order = np.lexsort((rows[candidates], -scores[candidates]))
+    return candidates[order]
+
+
+class ExactIndex:
+    """Brute-force cosine over every row of the store."""
+
+    kind = "exact"
+
+    def __init__(self, store: JobEmbeddingStore):
+        self.store = store
+
+    def top_k(self, profile_vector: np.ndarray, k: int) -> List[ScoredJob]:
+        if k <= 0 or not len(self.store):
+            return []
+        scores = self.store.scores(profile_vector)
+        rows = np.arange(len(scores))
+        best = _select_top(rows, scores, k)
+        return [(self.store.ids[i], float(scores[i])) for i in best]
+
+
+class IVFIndex:
+    """Inverted-file index: jobs are bucketed by their nearest k-means centroid."""
+
+    kind = "ivf"
+
+    def __init__(
+        self,
+        store: JobEmbeddingStore,
+        centroids: np.ndarray,
+        list_offsets: np.ndarray,
+        list_rows: np.ndarray,
+        nprobe: int = 16,
+    ):
+        self.store = store
+        self.centroids = centroids.astype(np.float32, copy=False)
+        self.list_offsets = list_offsets
+        self.list_rows = list_rows
+        self.nprobe = nprobe
+
+    @classmethod
+    def build(
+        cls,
+        store: JobEmbeddingStore,
+        nlist: Optional[int] = None,
+        nprobe: int = 16,
+        iterations: int = 10,
+        sample_size: int = 50_000,
+        seed: int = 0,
+    ) -> "IVFIndex":
+        n = len(store)
+        if n == 0:
+            raise ValueError("Cannot build an IVF index over an empty store")
+        nlist = min(n, nlist or max(1, int(4 * math.sqrt(n))))
+        rng = np.random.default_rng(seed)
+        matrix = store.rows(slice(None))
+
+        sample = matrix[rng.choice(n, size=min(n, sample_size), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = sample[assign == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+            norms[norms == 0.0] = 1.0
+            centroids /= norms
+
+        assign = np.empty(n, dtype=np.int64)
+        for start in range(0, n, 8192):
+            block = matrix[start : start + 8192]
+            assign[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        list_rows = np.argsort(assign, kind="stable")
+        counts = np.bincount(assign, minlength=nlist)
+        list_offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        return cls(store, centroids, list_offsets, list_rows, nprobe=nprobe)
+
+    def save(self, directory: Path | str) -> Path:
+        path = Path(directory) / IVF_FILE
+        np.savez(
+            path,
+            centroids=self.centroids,
+            list_offsets=self.list_offsets,
+            list_rows=self.list_rows,
+            nprobe=np.array(self.nprobe),
+            n=np.array(len(self.store)),
+            fingerprint=np.array(self.store.fingerprint()),
+        )
+        return path
+
+    @classmethod
+    def load(cls, store: JobEmbeddingStore, directory: Path | str) -> "IVFIndex":
+        data = np.load(Path(directory) / IVF_FILE)
+        if int(data["n"]) != len(store) or str(data["fingerprint"]) != store.fingerprint():
+            raise ValueError("IVF index is stale: it was built for a different embedding store")
+        nprobe = int(os.environ.get("ANN_IVF_NPROBE", int(data["nprobe"])))
+        return cls(store, data["centroids"], data["list_offsets"], data["list_rows"], nprobe=nprobe)
+
+    def top_k(self, profile_vector: np.ndarray, k: int) -> List[ScoredJob]:
+        vector = _unit(profile_vector)
+        if k <= 0 or vector is None:
+            return []
+        nprobe = min(self.nprobe, len(self.centroids))
+        probe = np.argpartition(-(self.centroids @ vector), nprobe - 1)[:nprobe]
+        rows = np.concatenate(
+            [self.list_rows[self.list_offsets[c] : self.list_offsets[c + 1]] for c in probe]
+        )
+        if not len(rows):
+            return []
+        rows.sort()
+        scores = self.store.rows(rows) @ vector
+        best = _select_top(rows, scores, k)
+        return [(self.store.ids[rows[i]], float(scores[i])) for i in best]
+
+
+class HNSWIndex:
+    """Hierarchical navigable small-world graph (requires `pip install hnswlib`)."""
+
+    kind = "hnsw"
+
+    def __init__(self, store: JobEmbeddingStore, graph, ef: int = 64):
+        self.store = store
+        self.graph = graph
+        self.graph.set_ef(ef)
+
+    @classmethod
+    def build(
+        cls,
+        store: JobEmbeddingStore,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef: int = 64,
+    ) -> "HNSWIndex":
+        if hnswlib is None:
+            raise RuntimeError("hnswlib is not installed. Run: pip install hnswlib")
+        graph = hnswlib.Index(space="ip", dim=store.dim)
+        graph.init_index(max_elements=len(store), M=m, ef_construction=ef_construction)
+        matrix = store.rows(slice(None))
+        graph.add_items(matrix, np.arange(len(store)))
+        return cls(store, graph, ef=ef)
+
+    def save(self, directory: Path | str) -> Path:
+        directory = Path(directory)
+        self.graph.save_index(str(directory / HNSW_FILE))
+        (directory / HNSW_META_FILE).write_text(json.dumps({"n": len(self.store), "fingerprint": self.store.fingerprint()}), encoding="utf-8")
+        return directory / HNSW_FILE
+
+    @classmethod
+    def load(cls, store: JobEmbeddingStore, directory: Path | str) -> "HNSWIndex":
+        if hnswlib is None:
+            raise RuntimeError("hnswlib is not installed. Run: pip install hnswlib")
+        directory = Path(directory)
+        meta = json.loads((directory / HNSW_META_FILE).read_text(encoding="utf-8"))
+        if int(meta["n"]) != len(store) or meta.get("fingerprint") != store.fingerprint():
+            raise ValueError("HNSW index is stale: it was built for a different embedding store")
+        graph = hnswlib.Index(space="ip", dim=store.dim)
+        graph.load_index(str(directory / HNSW_FILE), max_elements=len(store))
+        return cls(store, graph, ef=int(os.environ.get("ANN_HNSW_EF", "64")))
+
+    def top_k(self, profile_vector: np.ndarray, k: int) -> List[ScoredJob]:
+        vector = _unit(profile_vector)
+        k = min(k, len(self.store))
+        if k <= 0 or vector is None:
+            return []
+        self.graph.set_ef(max(self.graph.ef, k))
+        labels, distances = self.graph.knn_query(vector, k=k)
+        # hnswlib reports inner-product distance as 1 - <a, b>.
+        return [
+            (self.store.ids[int(row)], float(1.0 - dist))
+            for row, dist in zip(labels[0], distances[0])
+        ]
+
+
+def load_index(store: JobEmbeddingStore, directory: Path | str, kind: str = "auto"):
+    """Returns the index to serve `store` with.
+
+    kind is "exact", "ivf", "hnsw" or "auto" (exact below EXACT_THRESHOLD jobs,
+    else a prebuilt HNSW/IVF structure, else exact with a warning).
+    """
+    directory = Path(directory)
+    if kind == "exact" or (kind == "auto" and len(store) < EXACT_THRESHOLD):
+        return ExactIndex(store)
+
+    candidates: Sequence[str] = [kind] if kind != "auto" else ["hnsw", "ivf"]
+    for candidate in candidates:
+        try:
+            if candidate == "hnsw" and hnswlib is not None and (directory / HNSW_FILE).exists():
+                return HNSWIndex.load(store, directory)
+            if candidate == "ivf" and (directory / IVF_FILE).exists():
+                return IVFIndex.load(store, directory)
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Could not load %s index from %s: %s", candidate, directory, exc)
+
+    logger.warning(
+        "No usable %s index in %s for %d jobs; falling back to exact scoring",
+        kind, directory, len(store),
+    )
+    return ExactIndex(store)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build an ANN index over persisted job embeddings.")
+    parser.add_argument("--embeddings", default="LLM/job_embeddings", help="Embedding store directory")
+    parser.add_argument("--kind", choices=["ivf", "hnsw"], default="ivf")
+    parser.add_argument("--nlist", type=int, default=None, help="IVF: number of clusters (default 4*sqrt(n))")
+    parser.add_argument("--nprobe", type=int, default=16, help="IVF: clusters scored per query")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    store = JobEmbeddingStore.load(args.embeddings)
+    if args.kind == "hnsw":
+        path = HNSWIndex.build(store).save(args.embeddings)
+    else:
+        path = IVFIndex.build(store, nlist=args.nlist, nprobe=args.nprobe).save(args.embeddings)
+    print(f"Wrote {args.kind} index for {len(store)} jobs to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,67 @@
+"""Batched SentenceTransformer encoding and profile x job scoring.
+
+Encoding texts one at a time pays tokenizer and forward-pass overhead per
+call. These helpers encode whole lists in fixed-size batches, encode each
+distinct text only once, and score every profile against every job with one
+matrix product.
+
+    scores = score_matrix(model, profile_texts, job_texts, batch_size=32)
+    scores[i, j]  # cosine similarity of profile_texts[i] and job_texts[j]
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+DEFAULT_BATCH_SIZE = 64
+
+
+def encode_texts(model, texts: Sequence[str], batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+    """Encode texts into an (n, dim) float32 matrix of L2-normalised rows.
+
+    Duplicate texts are encoded once. Empty or non-string texts get a zero
+    row, so they score 0.0 against everything.
+    """
+    texts = [text if isinstance(text, str) else "" for text in texts]
+    unique: Dict[str, int] = {}
+    for text in texts:
+        if text.strip() and text not in unique:
+            unique[text] = len(unique)
+
+    if not unique:
+        dim = int(model.get_sentence_embedding_dimension() or 0)
+        return np.zeros((len(texts), dim), dtype=np.float32)
+
+    encoded = model.encode(
+        list(unique),
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+    encoded = np.asarray(encoded, dtype=np.float32)
+
+    out = np.zeros((len(texts), encoded.shape[1]), dtype=np.float32)
+    rows: List[int] = []
+    sources: List[int] = []
+    for row, text in enumerate(texts):
+        source = unique.get(text)
+        if source is not None:
+            rows.append(row)
+            sources.append(source)
+    out[rows] = encoded[sources]
+    return out
+
+
+def score_matrix(
+    model,
+    profile_texts: Sequence[str],
+    job_texts: Sequence[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> np.ndarray:
+    """Cosine similarity of every profile against every job, shape (profiles, jobs)."""
+    profiles = encode_texts(model, profile_texts, batch_size=batch_size)
+    jobs = encode_texts(model, job_texts, batch_size=batch_size)
+    return profiles @ jobs.T
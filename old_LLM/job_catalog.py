@@ -0,0 +1,132 @@
+"""In-memory job catalog keyed by job ID.
+
+GET /api/recommendations only needs the display fields of ~20 jobs, so instead
+of parsing the postings CSV on every request the catalog is loaded once per
+process into one list per column plus an ID -> row dict:
+
+    catalog = get_catalog(jobs_path)
+    jobs = catalog.get_many([12, 7, 3])   # {job_id: {field: value}}, O(k)
+
+Before serving, the file's mtime and size are checked (one stat call). The CSV
+is only re-read when they changed and its sha256 differs from the loaded copy,
+so touching the file without editing it does not trigger a reparse.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+JOB_FIELDS = [
+    "Title",
+    "Company",
+    "Location",
+    "EmploymentType",
+    "DatePosted",
+    "Remote",
+    "RoleDescription",
+    "Experience",
+    "Link",
+]
+
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class JobCatalog:
+    """Columnar, ID-indexed view of the job postings CSV."""
+
+    def __init__(self, path: str, fields: Iterable[str] = JOB_FIELDS, id_column: str = "ID"):
+        self.path = path
+        self.fields = list(fields)
+        self.id_column = id_column
+        # (columns, rows) swapped as one reference so readers never see a half-reload.
+        self._data: Tuple[Dict[str, list], Dict[int, int]] = ({}, {})
+        self._stat: Optional[Tuple[float, int]] = None
+        self._sha256: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        self._refresh()
+        return len(self._data[1])
+
+    def _load(self, sha256: str) -> None:
+        header = pd.read_csv(self.path, nrows=0).columns
+        fields = [name for name in self.fields if name in header]
+        df = pd.read_csv(self.path, usecols=[self.id_column, *fields])
+        df = df.dropna(subset=[self.id_column])
+
+        # Later rows win on duplicate IDs, matching the old dict-comprehension behaviour.
+        rows = {int(job_id): row for row, job_id in enumerate(df[self.id_column].tolist())}
+        self._data = ({name: df[name].tolist() for name in fields}, rows)
+        self._sha256 = sha256
+        logger.info("Loaded job catalog %s: %d jobs", self.path, len(rows))
+
+    def _refresh(self) -> None:
+        st = os.stat(self.path)
+        stat = (st.st_mtime, st.st_size)
+        if stat == self._stat:
+            return
+        with self._lock:
+            if stat == self._stat:
+                return
+            sha256 = _file_sha256(self.path)
+            if sha256 != self._sha256:
+                self._load(sha256)
+            self._stat = stat
+
+    def get(self, job_id: int) -> Optional[dict]:
+        return self.get_many([job_id]).get(int(job_id))
+
+    def get_many(self, job_ids: Iterable[int]) -> Dict[int, dict]:
+        """Returns {job_id: {field: value}} for the IDs present in the catalog.
+
+        Fields missing from the CSV come back as "".
+        """
+        self._refresh()
+        columns, rows = self._data
+        found: Dict[int, dict] = {}
+        for job_id in job_ids:
+            row = rows.get(int(job_id))
+            if row is None:
+                continue
+            found[int(job_id)] = {
+                name: columns[name][row] if name in columns else ""
+                for name in self.fields
+            }
+        return found
+
+    @property
+    def version(self) -> Optional[str]:
+        """sha256 of the CSV the catalog currently serves."""
+        self._refresh()
+        return self._sha256
+
+    def ids(self) -> List[int]:
+        self._refresh()
+        return list(self._data[1])
+
+
+_catalogs: Dict[str, JobCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(path: str) -> JobCatalog:
+    """Returns the process-wide catalog for `path`."""
+    catalog = _catalogs.get(path)
+    if catalog is None:
+        with _catalogs_lock:
+            catalog = _catalogs.setdefault(path, JobCatalog(path))
+    return catalog
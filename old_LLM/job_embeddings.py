@@ -0,0 +1,338 @@
+"""Persisted job-description embeddings for recommendation scoring.
+
+Job descriptions never change between requests, so instead of re-encoding the
+whole catalog for every POST /api/recommendations they are encoded once by an
+offline build step and stored next to the model:
+
+    python -m old_LLM.job_embeddings --jobs zensearchData/job_postings.csv --out LLM/job_embeddings
+
+Output directory layout:
+    embeddings.npy            float32 matrix, one L2-normalised row per job
+    embeddings.f16.npy        optional float16 copy (--quantize float16)
+    embeddings.i8.npy         optional int8 copy (--quantize int8) ...
+    embeddings.i8.scales.npy  ... with one float32 scale per row
+    index.json                {"model", "dim", "ids", "hashes", "quantized"} — row i belongs to ids[i]
+
+At request time the matrix is memory-mapped read-only (so every gunicorn worker
+shares the same page cache) and a profile is ranked against every job with a
+single matrix-vector product.
+
+Workers pick the copy to serve with JOB_EMBEDDINGS_DTYPE (float32, float16 or
+int8). Quantized copies are scored block by block into one reused float32
+buffer, so the full matrix is never dequantized at once. The formats trade
+memory against latency differently:
+
+    int8     1/4 of the float32 memory and about as fast (often faster, since
+             less memory is read); top-k rankings differ slightly.
+    float16  1/2 of the float32 memory with near-identical scores, but roughly
+             4-5x slower to score: numpy has no fast float16 kernel, so every
+             request pays the float16 -> float32 conversion.
+
+Prefer int8 when memory matters. Scripts/embedding_quantization_report.py
+reports memory, ranking agreement and latency of each format against float32.
+
+Rebuilds are incremental: rows whose job ID and content hash are unchanged are
+copied from the previous build, existing rows keep their position and new jobs
+are appended at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .batch_scoring import DEFAULT_BATCH_SIZE, encode_texts
+from .model_registry import model_version
+
+logger = logging.getLogger(__name__)
+
+MATRIX_FILE = "embeddings.npy"
+INDEX_FILE = "index.json"
+QUANTIZED_FILES = {"float16": "embeddings.f16.npy", "int8": "embeddings.i8.npy"}
+INT8_SCALES_FILE = "embeddings.i8.scales.npy"
+STORE_DTYPES = ("float32", *QUANTIZED_FILES)
+# Rows converted to float32 at a time when scoring a quantized matrix (small
+# enough for the block to stay in cache between the conversion and the dot).
+SCORE_BLOCK_ROWS = 1024
+
+
+def content_hash(text: str) -> str:
+    """Stable hash of the text a job row was encoded from."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _job_text(raw) -> str:
+    if not isinstance(raw, str):
+        return ""
+    return raw
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+def quantize_int8(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization: row ~= q_row * scale_row."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    scales = np.abs(matrix).max(axis=1) / 127.0 if len(matrix) else np.zeros(0, dtype=np.float32)
+    safe = np.where(scales == 0.0, 1.0, scales)
+    quantized = np.clip(np.rint(matrix / safe[:, None]), -127, 127).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+def _write_atomic(path: Path, write) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+@dataclass
+class JobEmbeddingStore:
+    """Read-only view over a built embedding directory."""
+
+    ids: List[int]
+    hashes: List[str]
+    matrix: np.ndarray
+    model: str
+    scales: Optional[np.ndarray] = None
+    _rows: Optional[Dict[int, int]] = field(default=None, repr=False)
+    _fingerprints: Dict[int, str] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def load(
+        cls,
+        directory: Path | str,
+        mmap: bool = True,
+        dtype: Optional[str] = None,
+    ) -> "JobEmbeddingStore":
+        """Loads the store; dtype picks the float32 or a quantized copy.
+
+        dtype defaults to $JOB_EMBEDDINGS_DTYPE (float32). A quantized copy
+        that was never built falls back to float32 with a warning.
+        """
+        directory = Path(directory)
+        with (directory / INDEX_FILE).open("r", encoding="utf-8") as fh:
+            index = json.load(fh)
+
+        dtype = dtype or os.environ.get("JOB_EMBEDDINGS_DTYPE", "float32")
+        if dtype not in STORE_DTYPES:
+            raise ValueError(f"Unknown embedding dtype {dtype!r}; expected one of {STORE_DTYPES}")
+        if dtype != "float32" and dtype not in index.get("quantized", []):
+            logger.warning("No %s embeddings in %s; serving float32", dtype, directory)
+            dtype = "float32"
+
+        mmap_mode = "r" if mmap else None
+        matrix = np.load(directory / (QUANTIZED_FILES.get(dtype) or MATRIX_FILE), mmap_mode=mmap_mode)
+        scales = np.load(directory / INT8_SCALES_FILE, mmap_mode=mmap_mode) if dtype == "int8" else None
+        if matrix.shape[0] != len(index["ids"]):
+            raise ValueError(
+                f"{directory}: matrix has {matrix.shape[0]} rows but index lists {len(index['ids'])} jobs"
+            )
+        return cls(
+            ids=[int(job_id) for job_id in index["ids"]],
+            hashes=list(index["hashes"]),
+            matrix=matrix,
+            model=index.get("model", ""),
+            scales=scales,
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dim(self) -> int:
+        return int(self.matrix.shape[1]) if self.matrix.ndim == 2 else 0
+
+    def row_of(self, job_id: int) -> Optional[int]:
+        if self._rows is None:
+            self._rows = {job_id: row for row, job_id in enumerate(self.ids)}
+        return self._rows.get(int(job_id))
+
+    def fingerprint(self, rows: Optional[int] = None) -> str:
+        """Hash of the (id, content hash) pairs of the first `rows` jobs (default all).
+
+        Rebuilds only append, so if fingerprint(n) still equals a value recorded
+        when the store had n rows, rows n.. are exactly the jobs added since.
+        """
+        rows = len(self) if rows is None else min(rows, len(self))
+        cached = self._fingerprints.get(rows)
+        if cached is None:
+            digest = hashlib.sha256(self.model.encode("utf-8"))
+            for job_id, job_hash in zip(self.ids[:rows], self.hashes[:rows]):
+                digest.update(f"\n{job_id}:{job_hash}".encode("utf-8"))
+            cached = self._fingerprints[rows] = digest.hexdigest()
+        return cached
+
+    @property
+    def dtype(self) -> str:
+        return "int8" if self.scales is not None else str(self.matrix.dtype)
+
+    def rows(self, index) -> np.ndarray:
+        """float32 (dequantized) copy of matrix[index]."""
+        block = np.asarray(self.matrix[index], dtype=np.float32)
+        if self.scales is not None:
+            block = block * np.asarray(self.scales[index], dtype=np.float32)[..., None]
+        return block
+
+    def scores(self, profile_vector: np.ndarray, start: int = 0) -> np.ndarray:
+        """Cosine similarity of one profile embedding against job rows start.. (default all)."""
+        vector = np.asarray(profile_vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        count = max(len(self) - start, 0)
+        if norm == 0.0 or not count:
+            return np.zeros(count, dtype=np.float32)
+        vector = vector / norm
+        if self.matrix.dtype == np.float32:
+            return self.matrix[start:] @ vector
+
+        # Quantized: convert one block at a time into a reused buffer so only
+        # SCORE_BLOCK_ROWS rows are ever held as float32; int8 rows are
+        # rescaled after the dot product.
+        out = np.empty(count, dtype=np.float32)
+        block = np.empty((min(SCORE_BLOCK_ROWS, count), self.dim), dtype=np.float32)
+        for lo in range(start, len(self), SCORE_BLOCK_ROWS):
+            hi = min(lo + SCORE_BLOCK_ROWS, len(self))
+            rows = block[: hi - lo]
+            np.copyto(rows, self.matrix[lo:hi], casting="unsafe")
+            np.dot(rows, vector, out=out[lo - start : hi - start])
+        if self.scales is not None:
+            out *= self.scales[start:]
+        return out
+
+
+def build_job_embeddings(
+    jobs_path: Path | str,
+    output_dir: Path | str,
+    model,
+    model_name: str,
+    *,
+    text_column: str = "RoleDescription",
+    id_column: str = "ID",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    quantize: Sequence[str] = (),
+) -> JobEmbeddingStore:
+    """Encode every job in ``jobs_path`` and persist the matrix to ``output_dir``.
+
+    Only rows that are new or whose description changed since the last build
+    (same ``model_name``) are sent through the model. Pass a content-derived
+    name (model_registry.model_version) so retraining in place re-encodes. ``quantize`` lists extra
+    copies to write next to the float32 matrix ("float16", "int8").
+    """
+    unknown = set(quantize) - set(QUANTIZED_FILES)
+    if unknown:
+        raise ValueError(f"Unknown quantized formats: {sorted(unknown)}")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs_df = pd.read_csv(jobs_path, usecols=[id_column, text_column])
+    jobs_df = jobs_df.drop_duplicates(subset=id_column, keep="last")
+    texts_by_id: Dict[int, str] = {
+        int(job_id): _job_text(text)
+        for job_id, text in zip(jobs_df[id_column], jobs_df[text_column])
+    }
+
+    previous: Optional[JobEmbeddingStore] = None
+    if (output_dir / INDEX_FILE).exists() and (output_dir / MATRIX_FILE).exists():
+        try:
+            previous = JobEmbeddingStore.load(output_dir, mmap=True, dtype="float32")
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Ignoring unreadable embedding store in %s: %s", output_dir, exc)
+        if previous is not None and previous.model != model_name:
+            logger.info("Model changed (%s -> %s); re-encoding all jobs", previous.model, model_name)
+            previous = None
+
+    ids: List[int] = []
+    if previous is not None:
+        ids.extend(job_id for job_id in previous.ids if job_id in texts_by_id)
+    kept = set(ids)
+    ids.extend(job_id for job_id in texts_by_id if job_id not in kept)
+    hashes = [content_hash(texts_by_id[job_id]) for job_id in ids]
+
+    reuse: Dict[int, int] = {}
+    if previous is not None:
+        for row, job_id in enumerate(ids):
+            prev_row = previous.row_of(job_id)
+            if prev_row is not None and previous.hashes[prev_row] == hashes[row]:
+                reuse[row] = prev_row
+
+    to_encode = [row for row in range(len(ids)) if row not in reuse]
+    encoded = encode_texts(model, [texts_by_id[ids[row]] for row in to_encode], batch_size=batch_size)
+
+    if previous is not None and len(previous):
+        dim = previous.dim
+    else:
+        dim = encoded.shape[1] if encoded.ndim == 2 else 0
+    matrix = np.zeros((len(ids), dim), dtype=np.float32)
+    if reuse:
+        rows = np.fromiter(reuse.keys(), dtype=np.int64)
+        prev_rows = np.fromiter(reuse.values(), dtype=np.int64)
+        matrix[rows] = previous.matrix[prev_rows]
+    if to_encode:
+        matrix[np.asarray(to_encode, dtype=np.int64)] = encoded
+
+    logger.info(
+        "Job embeddings: %d jobs, %d reused, %d encoded -> %s",
+        len(ids), len(reuse), len(to_encode), output_dir,
+    )
+
+    # Release the previous mmap before replacing the file underneath it.
+    previous = None
+
+    _write_atomic(output_dir / MATRIX_FILE, lambda p: _save_npy(p, matrix))
+    if "float16" in quantize:
+        _write_atomic(output_dir / QUANTIZED_FILES["float16"], lambda p: _save_npy(p, matrix.astype(np.float16)))
+    if "int8" in quantize:
+        quantized, scales = quantize_int8(matrix)
+        _write_atomic(output_dir / QUANTIZED_FILES["int8"], lambda p: _save_npy(p, quantized))
+        _write_atomic(output_dir / INT8_SCALES_FILE, lambda p: _save_npy(p, scales))
+    index = {"model": model_name, "dim": dim, "ids": ids, "hashes": hashes, "quantized": sorted(quantize)}
+    _write_atomic(
+        output_dir / INDEX_FILE,
+        lambda p: p.write_text(json.dumps(index), encoding="utf-8"),
+    )
+    return JobEmbeddingStore.load(output_dir, dtype="float32")
+
+
+def _save_npy(path: Path, matrix: np.ndarray) -> None:
+    with path.open("wb") as fh:
+        np.save(fh, matrix)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Encode job descriptions into a persisted embedding matrix.")
+    parser.add_argument("--jobs", default="zensearchData/job_postings.csv", help="Job postings CSV")
+    parser.add_argument("--out", default="LLM/job_embeddings", help="Output directory")
+    parser.add_argument("--model", default="LLM/fine_tuned_resume_model", help="SentenceTransformer model path")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--quantize", nargs="*", default=[], choices=sorted(QUANTIZED_FILES),
+        help="Also write quantized copies workers can serve via JOB_EMBEDDINGS_DTYPE",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(args.model)
+    store = build_job_embeddings(
+        args.jobs, args.out, model, model_version(args.model), batch_size=args.batch_size, quantize=args.quantize
+    )
+    size_mb = store.matrix.nbytes / math.pow(1024, 2)
+    print(f"Wrote {len(store)} job embeddings ({store.dim} dims, {size_mb:.1f} MB) to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,7 +3,8 @@ import pandas as pd
 from resume_parser import parse_resume
 # from spacy_score import dynamic_skill_features
 # from spacy_soft_skills import soft_skills_score
-from sentence_transformers import SentenceTransformer, util
+from sentence_transformers import SentenceTransformer
+from batch_scoring import DEFAULT_BATCH_SIZE, score_matrix
 
 # Load your fine-tuned model
 model_path = "LLM/fine_tuned_resume_model"
@@ -13,20 +14,24 @@ output_file = "Filtered_Data/untrained_data.csv"
 os.makedirs("Filtered_Data", exist_ok=True)
 
 
-def evaluate_and_save(resume_path, job_file):
-    # Parse resume
-    resume_text = parse_resume(resume_path)
-
-    # Read job description
+def _read_job_text(job_file):
     with open(job_file, "r", encoding="utf-8") as f:
-        job_text = f.read().replace("\n", " ")
+        return f.read().replace("\n", " ")
+
 
-    # Compute embeddings
-    resume_emb = model.encode(resume_text, convert_to_tensor=True)
-    job_emb = model.encode(job_text, convert_to_tensor=True)
+def evaluate_many(resume_paths, job_files, batch_size=DEFAULT_BATCH_SIZE):
+    """Scores every resume against every job file in batched encoder passes.
 
-    # Compute cosine similarity score
-    ml_score = float(util.cos_sim(resume_emb, job_emb).item())
+    Returns a (len(resume_paths), len(job_files)) numpy array of cosine scores.
+    """
+    resume_texts = [parse_resume(path) for path in resume_paths]
+    job_texts = [_read_job_text(path) for path in job_files]
+    return score_matrix(model, resume_texts, job_texts, batch_size=batch_size)
+
+
+def evaluate_and_save(resume_path, job_file):
+    # Parse resume, read job description and compute the cosine similarity score
+    ml_score = float(evaluate_many([resume_path], [job_file])[0, 0])
     print(f"Similarity Score From Model: {ml_score:.4f}")
 
     # soft_skills = soft_skills_score(resume_text)
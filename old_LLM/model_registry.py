@@ -0,0 +1,150 @@
+"""Process-wide registry for the SentenceTransformer encoders.
+
+Loading the fine-tuned model takes several seconds, so it must not happen at
+import time or inside a request. `get_model()` loads each model path lazily,
+exactly once per process, and every later call returns the same instance.
+
+Under gunicorn the master can load the model before forking (see
+gunicorn.conf.py, which calls `warm_up()` from the `on_starting` hook).
+Workers then inherit the already-loaded weights: tensor storage is never
+written after `eval()`, so those pages stay shared copy-on-write between the
+master and every worker instead of each worker holding its own copy.
+`gc.freeze()` moves the objects created by the load out of the collector's
+generations so the cyclic GC in the workers does not touch (and copy) them.
+
+Load timings are kept per model and exposed through `model_stats()`.
+
+`model_version()` identifies a model by a sha256 of its files' bytes, not by
+its path or timestamps, so caches keyed on it (job embeddings, recommendation
+fingerprints) are invalidated when a model is retrained in place but survive
+a fresh checkout, copy or deploy of the same weights. The digest is computed
+once per process and only recomputed when a file's size or mtime changes.
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_PATH = os.environ.get("RESUME_MODEL_PATH", "LLM/fine_tuned_resume_model")
+
+_models: Dict[str, object] = {}
+_stats: Dict[str, dict] = {}
+_versions: Dict[str, str] = {}
+_digests: Dict[str, Tuple[tuple, str]] = {}
+_lock = threading.Lock()
+
+
+def _files_version(model_path: str) -> str:
+    root = Path(model_path)
+    if not root.is_dir():
+        return model_path  # hub model names, test doubles
+    files = sorted(p for p in root.rglob("*") if p.is_file())
+    # Cheap change detector; the version itself only depends on the bytes.
+    signature = tuple(
+        (path.relative_to(root).as_posix(), path.stat().st_size, path.stat().st_mtime_ns) for path in files
+    )
+    cached = _digests.get(model_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(f"{path.relative_to(root).as_posix()}\0".encode("utf-8"))
+        with path.open("rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(b"\n")
+    version = f"sha256:{digest.hexdigest()[:16]}"
+    _digests[model_path] = (signature, version)
+    return version
+
+
+def model_version(model_path: Optional[str] = None) -> str:
+    """A digest of the model directory's file names and contents (or the name
+    itself for hub models).
+
+    Once a model is loaded its version is pinned to the files it was loaded
+    from, so it keeps describing the weights this process actually serves.
+    """
+    model_path = model_path or DEFAULT_MODEL_PATH
+    version = _versions.get(model_path)
+    return version if version is not None else _files_version(model_path)
+
+
+def _load(model_path: str):
+    from sentence_transformers import SentenceTransformer
+
+    _versions[model_path] = _files_version(model_path)
+    start = time.perf_counter()
+    model = SentenceTransformer(model_path)
+    model.eval()
+    elapsed = time.perf_counter() - start
+    _stats[model_path] = {
+        "load_seconds": round(elapsed, 3),
+        "loaded_at": time.time(),
+        "loaded_by_pid": os.getpid(),
+    }
+    logger.info("Loaded encoder %s in %.2fs (pid %d)", model_path, elapsed, os.getpid())
+    return model
+
+
+def get_model(model_path: Optional[str] = None):
+    """Returns the shared encoder for `model_path`, loading it on first use."""
+    model_path = model_path or DEFAULT_MODEL_PATH
+    model = _models.get(model_path)
+    if model is not None:
+        return model
+    with _lock:
+        model = _models.get(model_path)
+        if model is None:
+            model = _load(model_path)
+            _models[model_path] = model
+    return model
+
+
+def is_loaded(model_path: Optional[str] = None) -> bool:
+    return (model_path or DEFAULT_MODEL_PATH) in _models
+
+
+def warm_up(model_paths: Optional[Iterable[str]] = None, freeze: bool = True) -> None:
+    """Loads models ahead of time, e.g. in the gunicorn master before fork.
+
+    Only loads weights; it does not run an encode, so no torch thread pools
+    are started in the parent process (those do not survive fork safely).
+    """
+    for model_path in model_paths or [DEFAULT_MODEL_PATH]:
+        get_model(model_path)
+    if freeze:
+        gc.freeze()
+
+
+def model_stats() -> Dict[str, dict]:
+    """Load metrics per model path, plus whether this process inherited it via fork."""
+    pid = os.getpid()
+    return {
+        path: {**stats, "inherited": stats["loaded_by_pid"] != pid}
+        for path, stats in _stats.items()
+    }
+
+
+def register(model_path: str, model) -> None:
+    """Installs an already-built model under `model_path` (benchmarks, tests)."""
+    with _lock:
+        _models[model_path] = model
+
+
+def reset() -> None:
+    """Drops every loaded model (tests only)."""
+    with _lock:
+        _models.clear()
+        _versions.clear()
+        _digests.clear()
+        _stats.clear()
@@ -1,15 +1,40 @@
-from sentence_transformers import SentenceTransformer, util
+import numpy as np
 import pandas as pd
+import hashlib
 import json
+import logging
+import os
 import re
+from dataclasses import replace
+
+from .ann_index import load_index
+from .batch_scoring import DEFAULT_BATCH_SIZE, score_matrix
+from .job_catalog import get_catalog
+from .job_embeddings import JobEmbeddingStore
+from .model_registry import DEFAULT_MODEL_PATH, get_model, model_version
+
+logger = logging.getLogger(__name__)
 
 MAX_TOTAL_LEN = 20000        # Max chars for final model text
 MAX_JOB_TEXT_LEN = 4000
 
 
 jobs_path = "zensearchData/job_postings.csv"
-model_path = "LLM/fine_tuned_resume_model"
-model = SentenceTransformer(model_path)
+model_path = DEFAULT_MODEL_PATH
+embeddings_dir = os.environ.get("JOB_EMBEDDINGS_DIR", "LLM/job_embeddings")
+
+ann_kind = os.environ.get("ANN_INDEX_KIND", "auto")
+
+# Hybrid ranking: lexical recall over parsed JDs, then embedding + compare_profiles re-rank
+ranker = os.environ.get("RECOMMENDATIONS_RANKER", "embedding")  # or "hybrid"
+jd_parsed_path = os.environ.get("JD_PARSED_PATH", "datasets/v1/jd_parsed.jsonl")
+hybrid_recall_limit = int(os.environ.get("HYBRID_RECALL_LIMIT", "500"))
+hybrid_embedding_weight = float(os.environ.get("HYBRID_EMBEDDING_WEIGHT", "0.7"))
+
+_job_store = None
+_job_store_rejected = False
+_job_index = None
+_skill_index = None
 
 def sanitize_job_text(raw: str) -> str:
     """Sanitizes job description text before sending to the ML model."""
@@ -74,21 +99,88 @@ def parse_profile_pipeline(profile_pipeline_str):
 def profile_to_model(profile_text, job_text):
     """Computes the ML similarity score between profile and job texts."""
     try:
-        profile_emb = model.encode(profile_text, convert_to_tensor=True)
-        job_emb = model.encode(job_text, convert_to_tensor=True)
-
-        # Compute cosine similarity score
-        ml_score = float(util.cos_sim(profile_emb, job_emb).item())
-
-        return ml_score
+        return float(score_matrix(get_model(model_path), [profile_text], [job_text])[0, 0])
     except Exception as e:
         # Log minimal info, not the full texts
         print(f"[profile_to_model] Error during encoding/scoring: {e}")
         return 0.0  # or some neutral default that might need to be changed
 
 
+def profiles_to_model(profile_texts, job_texts, batch_size=DEFAULT_BATCH_SIZE):
+    """Scores many profiles against many jobs in one pass.
+
+    Returns a (len(profile_texts), len(job_texts)) numpy array of cosine
+    similarities. Texts are encoded in batches of batch_size and each distinct
+    text is encoded once, so the model overhead is paid per batch rather than
+    per (profile, job) pair.
+    """
+    return score_matrix(get_model(model_path), profile_texts, job_texts, batch_size=batch_size)
+
+
+def load_job_store():
+    """Returns the precomputed job embedding store, or None if it hasn't been built.
+
+    Built by `python -m old_LLM.job_embeddings`. The store is loaded once per
+    process and memory-mapped, so workers share the matrix via the page cache.
+    """
+    global _job_store, _job_store_rejected
+    if _job_store is not None or _job_store_rejected:
+        return _job_store
+    try:
+        store = JobEmbeddingStore.load(embeddings_dir)
+    except FileNotFoundError:
+        return None
+    if store.model != model_version(model_path):
+        # Remembered for the life of the process: every recommendation now
+        # re-encodes the whole catalog until the store is rebuilt.
+        logger.error(
+            "Job embeddings in %s were built with model %s, not %s; ignoring them and encoding "
+            "every job per request. Rebuild with python -m old_LLM.job_embeddings",
+            embeddings_dir, store.model, model_version(model_path),
+        )
+        _job_store_rejected = True
+        return None
+    _job_store = store
+    return _job_store
+
+
+def load_job_index():
+    """Returns the top-k index over the job store (see ann_index.load_index), or None."""
+    global _job_index
+    if _job_index is not None:
+        return _job_index
+    store = load_job_store()
+    if store is None:
+        return None
+    _job_index = load_index(store, embeddings_dir, kind=ann_kind)
+    return _job_index
+
+
+def encode_profile(profile_text):
+    """Encodes one prepared profile text into a normalized float32 vector."""
+    return get_model(model_path).encode(profile_text, convert_to_numpy=True, normalize_embeddings=True)
+
+
+def _sorted_mlscores_uncached(profile_text):
+    jobs_df = pd.read_csv(jobs_path)
+    job_texts = jobs_df['RoleDescription'].tolist()
+    job_scores = profiles_to_model([profile_text], job_texts)[0]
+    scores = [
+        (job_id, float(score), job_text)
+        for job_id, score, job_text in zip(jobs_df['ID'].tolist(), job_scores, job_texts)
+    ]
+
+    # Sort scores in descending order
+    return sorted(scores, key=lambda x: x[1], reverse=True)
+
+
 def sorted_mlscores(profile_text):
-    """Returns a list of (job_id, score, job_text) tuples sorted by score desc."""
+    """Returns a list of (job_id, score, job_text) tuples sorted by score desc.
+
+    When the job embedding store is available only the profile is encoded and
+    every job is scored with one matrix-vector product; job_text is None in
+    that case since the descriptions are not kept in memory.
+    """
     # print(profile_json)
     # profile_text = parse_profile_pipeline(profile_json)
     profile_text = prepare_profile_text(profile_text)
@@ -96,17 +188,186 @@ def sorted_mlscores(profile_text):
     # If we end up with nothing useful, short-circuit
     if not profile_text:
         return []
-    
-    jobs_df = pd.read_csv(jobs_path)
-    scores = []
 
-    for _, row in jobs_df.iterrows():
-        job_text = row['RoleDescription']
-        score = profile_to_model(profile_text, job_text)
-        scores.append((row['ID'], score, job_text))
+    store = load_job_store()
+    if store is None:
+        return _sorted_mlscores_uncached(profile_text)
 
-    # Sort scores in descending order
-    sorted_scores = sorted(scores, key=lambda x: x[1], reverse=True)
+    scores = store.scores(encode_profile(profile_text))
+    order = np.argsort(-scores, kind="stable")
+    return [(store.ids[i], float(scores[i]), None) for i in order]
+
+
+def top_mlscores(profile_text, k):
+    """Returns the k best (job_id, score) pairs for a profile, best first.
+
+    Served from the ANN index when the job store is built, so only the top k
+    are selected instead of sorting a score for every job.
+    """
+    profile_text = prepare_profile_text(profile_text)
+    if not profile_text:
+        return []
+
+    index = load_job_index()
+    if index is None:
+        return [(job_id, score) for job_id, score, _ in _sorted_mlscores_uncached(profile_text)[:k]]
+
+    return index.top_k(encode_profile(profile_text), k)
+
+
+def profile_fingerprint(profile_text, candidate_profile=None):
+    """Hash of the prepared profile text and the model version that scores it.
+
+    The version is content-derived (model_registry.model_version), so a deploy
+    of the same weights keeps every stored fingerprint valid. With the hybrid ranker the structured candidate profile is scored too, so
+    it is part of the fingerprint.
+    """
+    profile_text = prepare_profile_text(profile_text)
+    key = f"{model_version(model_path)}\n{profile_text}"
+    if ranker == "hybrid":
+        key += "\nhybrid:" + json.dumps(candidate_profile or {}, sort_keys=True, default=str)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def catalog_state():
+    """Returns (size, fingerprint) of the job catalog recommendations are scored against."""
+    store = load_job_store()
+    if store is not None:
+        return len(store), store.fingerprint()
+    catalog = get_catalog(jobs_path)
+    return len(catalog), catalog.version
+
+
+def refresh_top_mlscores(profile_text, k, previous=None, candidate_profile=None):
+    """Brings a stored top-k up to date instead of always rescoring the catalog.
+
+    previous is the state saved with the last recommendations (or None):
+    {"profile_fingerprint", "catalog_size", "catalog_fingerprint", "scores"}
+    where scores is the stored [(job_id, score), ...].
+
+    Returns (scores, state, status):
+      "unchanged"  same profile and catalog, the stored scores are returned as is
+      "delta"      same profile, jobs were only appended to the embedding store;
+                   just the new rows are scored and merged into the stored top-k
+      "full"       anything else, the whole catalog is rescored
+    state is the dict (without "scores") to save next to the new scores.
+
+    With RECOMMENDATIONS_RANKER=hybrid, candidate_profile (skills, education,
+    ...) feeds hybrid_top_mlscores and catalog growth triggers a full rescore.
+    """
+    hybrid = ranker == "hybrid"
+
+    def full():
+        if hybrid:
+            return hybrid_top_mlscores(profile_text, candidate_profile or {}, k)
+        return top_mlscores(profile_text, k)
+
+    size, catalog_fp = catalog_state()
+    state = {
+        "profile_fingerprint": profile_fingerprint(profile_text, candidate_profile),
+        "catalog_size": size,
+        "catalog_fingerprint": catalog_fp,
+    }
+    if not prepare_profile_text(profile_text):
+        return [], state, "full"
+    if not previous or previous.get("profile_fingerprint") != state["profile_fingerprint"]:
+        return full(), state, "full"
+
+    if previous.get("catalog_fingerprint") == catalog_fp:
+        return list(previous["scores"])[:k], state, "unchanged"
+
+    store = load_job_store()
+    prev_size = previous.get("catalog_size")
+    if (
+        hybrid
+        or store is None
+        or prev_size is None
+        or prev_size > len(store)
+        or store.fingerprint(prev_size) != previous.get("catalog_fingerprint")
+    ):
+        return full(), state, "full"
+
+    scores = store.scores(encode_profile(prepare_profile_text(profile_text)), start=prev_size)
+    order = np.argsort(-scores, kind="stable")[:k]
+    delta = [(store.ids[prev_size + i], float(scores[i])) for i in order]
+    merged = sorted(list(previous["scores"]) + delta, key=lambda item: item[1], reverse=True)
+    return merged[:k], state, "delta"
+
+
+def load_skill_index():
+    """Returns the lexical recall index over parsed JDs, or None if they haven't been parsed.
+
+    Built from jd_input_pipeline output (JD_PARSED_PATH), once per process.
+    """
+    global _skill_index
+    if _skill_index is not None:
+        return _skill_index
+    if not os.path.exists(jd_parsed_path):
+        return None
+    from job_descr_LLM.matching.recall import SkillIndex
+
+    _skill_index = SkillIndex.from_jsonl(jd_parsed_path)
+    return _skill_index
+
+
+def hybrid_top_mlscores(profile_text, candidate_profile, k, recall_limit=None, embedding_weight=None):
+    """Two-stage ranking: lexical recall, then embedding + structured re-rank.
+
+    1. The skill/title inverted index selects up to recall_limit jobs sharing
+       terms with candidate_profile (keys: skills, titles, education, ...).
+    2. Only those are scored: cosine against the job embedding and
+       compare_profiles against the parsed JD, fused as
+       embedding_weight * cosine + (1 - embedding_weight) * structured.
+
+    Years of experience and certifications are only weighed when
+    candidate_profile has them; otherwise every JD stating a requirement would
+    score 0 there and every JD without one 1, favouring vague postings.
+
+    Falls back to top_mlscores when the JD index or embedding store is
+    missing, or when recall finds nothing. Returns [(job_id, score)], best first.
+    """
+    recall_limit = recall_limit or hybrid_recall_limit
+    embedding_weight = hybrid_embedding_weight if embedding_weight is None else embedding_weight
+
+    prepared = prepare_profile_text(profile_text)
+    if not prepared:
+        return []
+
+    skill_index = load_skill_index()
+    store = load_job_store()
+    if skill_index is None or store is None:
+        return top_mlscores(profile_text, k)
+
+    recalled = skill_index.candidates(
+        candidate_profile.get("skills", []) or [],
+        candidate_profile.get("titles", []) or [],
+        limit=recall_limit,
+    )
+    job_ids = []
+    rows = []
+    for job_id, _ in recalled:
+        row = store.row_of(job_id)
+        if row is not None:
+            job_ids.append(job_id)
+            rows.append(row)
+    if not rows:
+        return top_mlscores(profile_text, k)
+
+    from job_descr_LLM.matching.compare import MatchWeights, compare_profiles
+
+    weights = MatchWeights()
+    if "years_experience" not in candidate_profile:
+        weights = replace(weights, years_experience=0.0)
+    if "certifications" not in candidate_profile:
+        weights = replace(weights, certifications=0.0)
 
-    return sorted_scores
+    vector = encode_profile(prepared)
+    vector = vector / (np.linalg.norm(vector) or 1.0)
+    cosine = store.rows(np.asarray(rows, dtype=np.int64)) @ vector
 
+    fused = []
+    for job_id, emb_score in zip(job_ids, cosine):
+        structured = compare_profiles(skill_index.records[job_id], candidate_profile, weights=weights)["score"]
+        fused.append((job_id, float(embedding_weight * emb_score + (1.0 - embedding_weight) * structured)))
+    fused.sort(key=lambda item: item[1], reverse=True)
+    return fused[:k]
@@ -0,0 +1,102 @@
+"""
+Process-wide S3 (Cloudflare R2) client for the web app.
+
+Building a boto3 client loads the service model and resolves the endpoint and
+credentials (tens of milliseconds), and a fresh client starts with no open
+connections, so every request paid for setup plus a new TLS handshake. One
+client is now created per process and reused: boto3 clients are thread-safe,
+and the connection pool is sized for the threads that share it.
+
+The client is created lazily and per process: under gunicorn each forked
+worker builds its own, since pooled sockets must not be shared across fork.
+
+`client_stats()` reports how often the client was built versus reused and the
+setup time that reuse saved (reuses x mean build time).
+
+Env:
+- S3_ENDPOINT_URL, S3_ACCESS_KEY_ID, S3_SECRET_ACCESS_KEY, S3_REGION (default "auto")
+- S3_MAX_POOL_CONNECTIONS: pooled connections per process (default 20)
+- S3_CONNECT_TIMEOUT / S3_READ_TIMEOUT: seconds (default 5 / 30)
+"""
+
+import logging
+import os
+import threading
+import time
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+_client = None
+_client_key = None
+_lock = threading.Lock()
+_stats = {"created": 0, "reused": 0, "create_seconds": 0.0}
+
+
+def _settings():
+    return (
+        os.getpid(),
+        os.environ["S3_ENDPOINT_URL"],
+        os.environ["S3_ACCESS_KEY_ID"],
+        os.environ["S3_SECRET_ACCESS_KEY"],
+        os.environ.get("S3_REGION", "auto"),
+    )
+
+
+def _create_client(endpoint_url, access_key, secret_key, region):
+    # A session per client: the default session is not safe to share across threads.
+    session = boto3.session.Session()
+    return session.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+        config=Config(
+            max_pool_connections=int(os.environ.get("S3_MAX_POOL_CONNECTIONS", "20")),
+            connect_timeout=float(os.environ.get("S3_CONNECT_TIMEOUT", "5")),
+            read_timeout=float(os.environ.get("S3_READ_TIMEOUT", "30")),
+            tcp_keepalive=True,
+            retries={"max_attempts": 3, "mode": "standard"},
+        ),
+    )
+
+
+def get_s3_client():
+    """The process's shared S3 client (Cloudflare R2 is S3-compatible)."""
+    global _client, _client_key
+    key = _settings()
+    if _client is None or _client_key != key:
+        with _lock:
+            if _client is None or _client_key != key:
+                start = time.perf_counter()
+                _client = _create_client(*key[1:])
+                elapsed = time.perf_counter() - start
+                _client_key = key
+                _stats["created"] += 1
+                _stats["create_seconds"] += elapsed
+                logger.info("Created S3 client in %.1f ms (pid %d)", elapsed * 1000, key[0])
+                return _client
+    _stats["reused"] += 1
+    return _client
+
+
+def client_stats() -> dict:
+    created = _stats["created"]
+    mean_ms = _stats["create_seconds"] * 1000 / created if created else 0.0
+    return {
+        "created": created,
+        "reused": _stats["reused"],
+        "mean_create_ms": round(mean_ms, 2),
+        "saved_ms": round(_stats["reused"] * mean_ms, 1),
+    }
+
+
+def reset_client():
+    """Drops the shared client (tests, credential rotation)."""
+    global _client, _client_key
+    with _lock:
+        _client = None
+        _client_key = None
@@ -6,6 +6,9 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///test.db")
 os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
 os.environ.setdefault("JWT_COOKIE_SECURE", "false")
 os.environ.setdefault("JWT_COOKIE_SAMESITE", "Lax")
+os.environ.setdefault("EMAIL_TRANSPORT", "stub")
+os.environ.setdefault("AUDIT_BUFFERED", "0")
+os.environ.setdefault("BACKGROUND_SWEEP_SECONDS", "0")
 
 @pytest.fixture()
 def client():
@@ -27,3 +30,27 @@ def client():
         os.remove("test.db")
     except FileNotFoundError:
         pass
+
+
+@pytest.fixture()
+def login(client):
+    """Creates a confirmed user and logs `client` in as them.
+
+    Returns a function login(email=..., role=...) -> (user_id, CSRF headers).
+    """
+    from flask_jwt_extended import create_access_token, get_csrf_token
+
+    from app import app
+    from model import User, db
+
+    def _login(email="seeker@example.com", role="job-seeker"):
+        with app.app_context():
+            user = User(email=email, password="x", name="Seeker", role=role, email_confirmed=True)
+            db.session.add(user)
+            db.session.commit()
+            token = create_access_token(identity=email)
+            user_id, csrf = user.id, get_csrf_token(token)
+        client.set_cookie("access_token_cookie", token)
+        return user_id, {"X-CSRF-TOKEN": csrf}
+
+    return _login
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from old_LLM.ann_index import ExactIndex, IVFIndex
+from old_LLM.job_embeddings import JobEmbeddingStore
+
+
+def _store(n=500, dim=16, seed=0, model="test"):
+    rng = np.random.default_rng(seed)
+    matrix = rng.normal(size=(n, dim)).astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return JobEmbeddingStore(ids=list(range(1000, 1000 + n)), hashes=[""] * n, matrix=matrix, model=model)
+
+
+def test_exact_top_k_matches_full_sort():
+    store = _store()
+    query = np.random.default_rng(1).normal(size=16)
+    scores = store.scores(query)
+    expected = [store.ids[i] for i in np.argsort(-scores, kind="stable")[:10]]
+
+    result = ExactIndex(store).top_k(query, 10)
+    assert [job_id for job_id, _ in result] == expected
+    assert result[0][1] >= result[-1][1]
+
+
+def test_ivf_probing_every_list_is_exact(tmp_path):
+    store = _store()
+    ivf = IVFIndex.build(store, nlist=8)
+    ivf.save(tmp_path)
+    loaded = IVFIndex.load(store, tmp_path)
+    loaded.nprobe = 8
+
+    query = np.random.default_rng(2).normal(size=16)
+    assert loaded.top_k(query, 15) == ExactIndex(store).top_k(query, 15)
+
+
+def test_ivf_load_rejects_a_same_size_store_with_other_contents(tmp_path):
+    IVFIndex.build(_store(), nlist=8).save(tmp_path)
+
+    with pytest.raises(ValueError, match="stale"):
+        IVFIndex.load(_store(model="other"), tmp_path)
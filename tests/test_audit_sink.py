@@ -0,0 +1,84 @@
+import pytest
+
+import audit_sink
+
+
+@pytest.fixture()
+def audit_buffer(client, monkeypatch, tmp_path):
+    from app import app
+
+    monkeypatch.setenv("AUDIT_BUFFERED", "1")
+    monkeypatch.setenv("AUDIT_SPOOL_DIR", str(tmp_path))
+    buffer = audit_sink.AuditBuffer(app, flush_events=1000, flush_ms=60_000)
+    monkeypatch.setattr(audit_sink, "_buffer", buffer)
+    yield buffer
+    buffer.close()
+
+
+def _audit_rows():
+    from app import app
+    from model import AuditLog
+
+    with app.app_context():
+        return AuditLog.query.order_by(AuditLog.id).all()
+
+
+def test_profile_reads_are_buffered_and_flushed_in_bulk(client, login, audit_buffer):
+    login()
+    for _ in range(3):
+        assert client.get("/api/profile").status_code == 200
+
+    assert _audit_rows() == []
+    assert audit_buffer.pending() == 3
+
+    assert audit_buffer.flush() == 3
+    rows = _audit_rows()
+    assert [(row.action, row.resource) for row in rows] == [("read", "profile")] * 3
+    assert all(row.created_at is not None and row.event_metadata["target_user_id"] for row in rows)
+
+
+def test_failed_flush_spools_and_replays(client, login, audit_buffer, monkeypatch, tmp_path):
+    import os
+
+    from app import app
+
+    spool = tmp_path / f"{os.getpid()}.jsonl"
+
+    login()
+    client.get("/api/profile")
+
+    class Unavailable:
+        def app_context(self):
+            raise RuntimeError("database is down")
+
+    monkeypatch.setattr(audit_buffer, "app", Unavailable())
+    assert audit_buffer.flush() == 0
+    assert spool.exists()
+    assert _audit_rows() == []
+
+    monkeypatch.setattr(audit_buffer, "app", app)
+    client.get("/api/profile")
+    assert audit_buffer.flush() == 2
+    assert not list(tmp_path.iterdir())
+    assert len(_audit_rows()) == 2
+
+
+def test_spools_of_live_processes_are_left_alone_and_bad_rows_quarantined(client, audit_buffer, tmp_path):
+    import datetime
+    import os
+
+    now = datetime.datetime(2026, 1, 1)
+    good = {"actor_user_id": None, "action": "read", "resource": "profile", "ip_address": None,
+            "user_agent": "", "metadata": {}, "created_at": now}
+    bad = {**good, "action": None}  # action is NOT NULL
+    dead_pid = 2**22 + 1  # above pid_max, never a live process
+    audit_sink._append_spool(tmp_path / f"{dead_pid}.jsonl", [good, bad])
+    audit_sink._append_spool(tmp_path / f"{os.getppid()}.jsonl", [good])  # a live worker's spool
+
+    assert audit_buffer.flush() == 1
+    assert audit_buffer.rejected == 1
+    assert [row.action for row in _audit_rows()] == ["read"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"{os.getppid()}.jsonl", f"rejected-{os.getpid()}.jsonl",
+    ]
+    assert audit_buffer.flush() == 0  # nothing is replayed twice
@@ -0,0 +1,41 @@
+import numpy as np
+
+from old_LLM.batch_scoring import encode_texts, score_matrix
+
+
+class CountingEncoder:
+    dim = 4
+
+    def __init__(self):
+        self.calls = []
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False):
+        self.calls.append((list(texts), batch_size))
+        rows = []
+        for text in texts:
+            vec = np.zeros(self.dim, dtype=np.float32)
+            vec[len(text) % self.dim] = 1.0
+            rows.append(vec)
+        return np.stack(rows)
+
+
+def test_score_matrix_shape_and_values():
+    encoder = CountingEncoder()
+    scores = score_matrix(encoder, ["ab", "abc"], ["xy", "xyz", "w"], batch_size=8)
+
+    assert scores.shape == (2, 3)
+    np.testing.assert_allclose(scores, [[1, 0, 0], [0, 1, 0]])
+    assert [batch for _, batch in encoder.calls] == [8, 8]
+
+
+def test_encode_texts_dedupes_and_zeroes_empty():
+    encoder = CountingEncoder()
+    out = encode_texts(encoder, ["same", None, "same", "  "])
+
+    assert encoder.calls == [(["same"], 64)]
+    assert out.shape == (4, 4)
+    np.testing.assert_array_equal(out[0], out[2])
+    assert not out[1].any() and not out[3].any()
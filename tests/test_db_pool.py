@@ -0,0 +1,51 @@
+import pytest
+
+import db_pool
+
+
+def test_engine_options_size_the_pool_for_servers_only(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "7")
+    options = db_pool.engine_options("postgresql://user:pw@db/solverah")
+    assert options["pool_pre_ping"] is True
+    assert options["pool_size"] == 7 and options["max_overflow"] == 10
+    assert db_pool.engine_options("sqlite:///test.db") == {"pool_pre_ping": True}
+
+
+def test_pooled_cursor_commits_rolls_back_and_reuses_connections(client):
+    from app import app, pooled_db_cursor
+    from model import IntakeSubmission, db
+
+    insert = (
+        "INSERT INTO intake_submissions (id, first_name, last_name, email, state, resume_key, "
+        "resume_mime, resume_size_bytes, status) VALUES (?, 'A', 'B', 'a@example.com', 'MA', 'k', "
+        "'application/pdf', 10, 'uploaded')"
+    )
+    with app.app_context():
+        before = db_pool.pool_stats(db.engine)
+        for submission_id in ("one", "two"):
+            with pooled_db_cursor() as cur:
+                cur.execute(insert, (submission_id,))
+        with pytest.raises(RuntimeError):
+            with pooled_db_cursor() as cur:
+                cur.execute(insert, ("three",))
+                raise RuntimeError("boom")
+
+        assert sorted(row.id for row in IntakeSubmission.query.all()) == ["one", "two"]
+        after = db_pool.pool_stats(db.engine)
+
+    assert after["raw_checkouts"] - before["raw_checkouts"] == 3
+    assert after["reused"] > before["reused"]
+
+
+def test_db_metrics_endpoint_is_internal_only(client, login, monkeypatch):
+    import app as app_module
+
+    login()
+    assert client.get("/api/metrics/db").status_code == 404  # disabled by default
+
+    monkeypatch.setattr(app_module, "METRICS_ENABLED", True)
+    assert client.get("/api/metrics/db").status_code == 404  # not an allowed account
+
+    monkeypatch.setattr(app_module, "METRICS_ALLOWED_EMAILS", {"seeker@example.com"})
+    payload = client.get("/api/metrics/db").get_json()
+    assert {"opened", "checkouts", "reused", "status"} <= set(payload["pool"])
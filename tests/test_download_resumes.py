@@ -0,0 +1,86 @@
+import hashlib
+import threading
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from job_descr_LLM.user_input_pipeline import download_resumes
+from job_descr_LLM.user_input_pipeline.download_resumes import ResumeDownloader
+
+OBJECTS = {f"profile/{i}/resume.pdf": f"%PDF resume {i}".encode() for i in range(1, 6)}
+
+
+class FakeClient:
+    def __init__(self, flaky=()):
+        self.flaky = dict.fromkeys(flaky, 1)
+        self.downloads = []
+        self.lock = threading.Lock()
+
+    def head_object(self, Bucket, Key):
+        if Key not in OBJECTS:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        body = OBJECTS[Key]
+        return {"ContentLength": len(body), "ETag": f'"{hashlib.md5(body).hexdigest()}"'}
+
+    def download_file(self, Bucket, Key, Filename):
+        with self.lock:
+            if self.flaky.get(Key):
+                self.flaky[Key] -= 1
+                raise EndpointConnectionError(endpoint_url="https://r2.example")
+            if Key not in OBJECTS:
+                raise ClientError({"Error": {"Code": "404"}}, "GetObject")
+            self.downloads.append(Key)
+        with open(Filename, "wb") as fh:
+            fh.write(OBJECTS[Key])
+
+
+def _intake(tmp_path, keys):
+    rows = ["id,resume_key,resume_mime"] + [f"{i},{key},application/pdf" for i, key in enumerate(keys, 1)]
+    path = tmp_path / "intake.csv"
+    path.write_text("\n".join(rows) + "\n")
+    return path
+
+
+@pytest.fixture
+def downloader(monkeypatch):
+    monkeypatch.setattr(download_resumes.time, "sleep", lambda seconds: None)
+    return ResumeDownloader("bucket", "https://r2.example", "key", "secret", workers=4)
+
+
+def test_concurrent_download_retries_and_skips_current_files(tmp_path, downloader, monkeypatch):
+    client = FakeClient(flaky=["profile/2/resume.pdf"])
+    monkeypatch.setattr(ResumeDownloader, "_client", lambda self: client)
+    intake = _intake(tmp_path, list(OBJECTS) + ["profile/9/missing.pdf"])
+    output_dir = tmp_path / "resumes"
+
+    report = downloader.download(intake, output_dir)
+    assert (report.downloaded, report.skipped) == (5, 0)
+    assert [key for key, _ in report.failed] == ["profile/9/missing.pdf"]
+    assert report.bytes == sum(len(body) for body in OBJECTS.values())
+    assert (output_dir / "2.pdf").read_bytes() == OBJECTS["profile/2/resume.pdf"]
+    assert not list(output_dir.glob("*.part"))
+
+    (output_dir / "3.pdf").write_bytes(b"%PDF resume X")  # same size, different content
+    client.downloads.clear()
+    report = downloader.download(intake, output_dir)
+    assert (report.downloaded, report.skipped) == (1, 4)
+    assert client.downloads == ["profile/3/resume.pdf"]
+    assert (output_dir / "3.pdf").read_bytes() == OBJECTS["profile/3/resume.pdf"]
+
+
+def test_download_from_env_raises_on_failures_unless_allowed(tmp_path, monkeypatch):
+    for name in ("R2_BUCKET", "R2_ENDPOINT_URL", "R2_ACCESS_KEY_ID", "R2_SECRET_ACCESS_KEY"):
+        monkeypatch.setenv(name, "x")
+    monkeypatch.delenv("R2_ALLOW_FAILED_DOWNLOADS", raising=False)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(download_resumes.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(ResumeDownloader, "_client", lambda self: FakeClient())
+    (tmp_path / "datasets" / "v1").mkdir(parents=True)
+    _intake(tmp_path / "datasets" / "v1", ["profile/1/resume.pdf", "profile/9/missing.pdf"])
+
+    with pytest.raises(download_resumes.DownloadFailed, match="profile/9/missing.pdf") as excinfo:
+        download_resumes.download_from_env()
+    assert excinfo.value.report.downloaded == 1
+
+    report = download_resumes.download_from_env(allow_failures=True)
+    assert len(report.failed) == 1
@@ -0,0 +1,120 @@
+import datetime
+
+import pytest
+
+
+@pytest.fixture()
+def outbox(monkeypatch):
+    import email_utils
+
+    sent = []
+    monkeypatch.setenv("BACKGROUND_INLINE", "1")
+    monkeypatch.setattr(email_utils, "EMAIL_TRANSPORT", "test")
+    monkeypatch.setitem(email_utils.TRANSPORTS, "test", sent.append)
+    return sent
+
+
+def _message(subject="Hello"):
+    return {"to": ["someone@example.com"], "subject": subject, "html": "<p>hi</p>"}
+
+
+def test_register_queues_and_delivers_verification_email(client, outbox):
+    from app import app
+    from model import OutboundEmail
+
+    response = client.post(
+        "/api/register",
+        json={"email": "new@example.com", "password": "Str0ng!Passw0rd", "name": "New User"},
+    )
+
+    assert response.status_code == 201
+    assert [message["to"] for message in outbox] == [["new@example.com"]]
+    with app.app_context():
+        [email] = OutboundEmail.query.all()
+        assert email.status == "sent" and email.attempts == 1
+
+
+def test_transient_failure_is_retried_with_backoff(client, outbox, monkeypatch):
+    import email_queue
+    import email_utils
+    from app import app
+    from model import OutboundEmail, db
+
+    failures = [RuntimeError("Resend 503")]
+
+    def flaky(message):
+        if failures:
+            raise failures.pop()
+        outbox.append(message)
+
+    monkeypatch.setitem(email_utils.TRANSPORTS, "test", flaky)
+    retries = []
+    monkeypatch.setattr(email_queue, "_schedule_retry", lambda app, email_id, delay: retries.append(delay))
+
+    response = client.post(
+        "/api/early-access-request",
+        json={"firstName": "A", "lastName": "B", "email": "a@example.com"},
+    )
+
+    assert response.status_code == 200
+    assert retries == [30.0] and outbox == []
+    with app.app_context():
+        email = OutboundEmail.query.one()
+        assert (email.status, email.attempts, email.last_error) == ("queued", 1, "Resend 503")
+        assert email_queue.drain_due(app) == 0  # not due yet
+
+        email.next_attempt_at = datetime.datetime(2000, 1, 1)
+        db.session.commit()
+        assert email_queue.drain_due(app) == 1
+        email = OutboundEmail.query.one()
+        assert (email.status, email.attempts) == ("sent", 2)
+    assert outbox[0]["subject"] == "New Early Access Modal Submission"
+
+
+def test_gives_up_after_max_attempts_and_on_config_errors(client, monkeypatch):
+    import email_queue
+    import email_utils
+    from app import app
+    from model import OutboundEmail
+
+    def down(message):
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(email_utils, "EMAIL_TRANSPORT", "down")
+    monkeypatch.setitem(email_utils.TRANSPORTS, "down", down)
+    monkeypatch.setenv("EMAIL_MAX_ATTEMPTS", "1")
+    monkeypatch.setattr(email_queue.background, "submit", lambda *args: None)
+
+    with app.app_context():
+        email = email_queue.enqueue_email(app, _message())
+        email_queue.deliver_email(app, email.id)
+        assert OutboundEmail.query.one().status == "failed"
+
+        monkeypatch.setenv("EMAIL_MAX_ATTEMPTS", "5")
+        monkeypatch.setattr(email_utils, "EMAIL_TRANSPORT", "resend")
+        monkeypatch.setattr(email_utils, "RESEND_API_KEY", None)
+        email = email_queue.enqueue_email(app, _message("Config"))
+        email_queue.deliver_email(app, email.id)
+        email = OutboundEmail.query.filter_by(subject="Config").one()
+        assert (email.status, email.attempts, email.last_error) == ("failed", 1, "RESEND_API_KEY is not set")
+
+
+def test_sweep_sends_lost_emails_and_purges_old_ones(client, outbox, monkeypatch):
+    import email_queue
+    from app import _sweep_outbound_emails, app
+    from model import OutboundEmail, db
+
+    monkeypatch.setattr(email_queue.background, "submit", lambda *args: None)  # delivery lost
+    with app.app_context():
+        email_queue.enqueue_email(app, _message("Lost"))
+        old = email_queue.enqueue_email(app, _message("Old"))
+        old.status, old.created_at = "sent", datetime.datetime(2000, 1, 1)
+        db.session.commit()
+
+        _sweep_outbound_emails()
+
+        assert [message["subject"] for message in outbox] == ["Lost"]
+        assert [(email.subject, email.status) for email in OutboundEmail.query.all()] == [("Lost", "sent")]
+
+    result = app.test_cli_runner().invoke(args=["drain-emails"])
+    assert result.output == "Tried 0 queued emails\n"
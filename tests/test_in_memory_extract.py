@@ -0,0 +1,46 @@
+from io import BytesIO
+from pathlib import Path
+
+from docx import Document
+
+from job_descr_LLM.parsers.docx_extract import parse_docx
+from job_descr_LLM.parsers.in_memory import DOCX_MIME, PDF_MIME, parse_document_bytes
+from job_descr_LLM.parsers.pdf_extract import extractor_order, parse_pdf
+
+RESUME = Path(__file__).resolve().parents[1] / "datasets" / "v1" / "resumes" / "9995.pdf"
+
+
+def test_pdf_bytes_match_path():
+    from_path = parse_pdf(RESUME)
+    from_bytes = parse_document_bytes(RESUME.read_bytes(), mime=PDF_MIME)
+    assert from_bytes.text and from_bytes.text == from_path.text
+    assert from_bytes.parser == from_path.parser
+    assert parse_pdf(BytesIO(RESUME.read_bytes()), strategy="fast-first").text == parse_pdf(RESUME, strategy="fast-first").text
+    assert extractor_order(BytesIO(RESUME.read_bytes()), "adaptive") == extractor_order(RESUME, "adaptive")
+
+
+def test_docx_bytes_match_path(tmp_path):
+    doc = Document()
+    for text in ["Jane Doe", "", "Skills", "Python, SQL"]:
+        doc.add_paragraph(text)
+    path = tmp_path / "resume.docx"
+    doc.save(path)
+
+    from_bytes = parse_document_bytes(path.read_bytes(), filename="resume.docx")
+    assert from_bytes.error is None
+    assert from_bytes.text == parse_docx(path).text
+    assert parse_document_bytes(path.read_bytes(), mime=DOCX_MIME).text == from_bytes.text
+
+
+def test_unknown_type():
+    doc = parse_document_bytes(b"hello", mime="text/plain", filename="resume.txt")
+    assert doc.parser == "unknown" and doc.text == ""
+
+
+def test_pdf_extraction_without_pypdf(monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, "pypdf", None)  # import pypdf -> ImportError
+    doc = parse_document_bytes(RESUME.read_bytes(), mime=PDF_MIME)
+    assert doc.text and doc.parser == "pdfminer"
+    assert extractor_order(RESUME, "adaptive") == ["pdfminer", "pypdf"]
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+from docx import Document
+
+from job_descr_LLM.user_input_pipeline import extract_text
+from job_descr_LLM.user_input_pipeline.build_model_inputs import build_model_inputs
+from job_descr_LLM.user_input_pipeline.clean_text import clean_raw_resumes
+from job_descr_LLM.user_input_pipeline.extract_text import ExtractOptions, extract_resumes
+from job_descr_LLM.user_input_pipeline.incremental import MANIFEST_FILE
+
+OUTPUTS = ("resumes_raw.jsonl", "resumes_clean.jsonl", "model_inputs.jsonl")
+
+
+@pytest.fixture(autouse=True)
+def _no_parse_cache(monkeypatch):
+    monkeypatch.setenv("RESUME_PARSE_CACHE", "0")
+    monkeypatch.setenv("EXTRACT_TIMEOUT_SECONDS", "0")
+
+
+def _write_resume(root, submission_id, skill):
+    doc = Document()
+    for text in [f"Person {submission_id}", "Skills", f"Python, {skill}"]:
+        doc.add_paragraph(text)
+    doc.save(root / "resumes" / f"{submission_id}.docx")
+
+
+def _write_intake(root, ids):
+    lines = ["id,resume_key,state"] + [f"{i},{i}.docx,MA" for i in ids]
+    (root / "intake.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _build(root, full=False):
+    return [
+        extract_resumes(ExtractOptions(dataset_root=root), full=full),
+        clean_raw_resumes(root, full=full),
+        build_model_inputs(root, "vtest", workers=1, full=full),
+    ]
+
+
+def _rows(path):
+    rows = [json.loads(line) for line in path.open(encoding="utf-8")]
+    for row in rows:
+        row.pop("extracted_at", None)
+        row.pop("parser_timings", None)
+    return rows
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    (tmp_path / "resumes").mkdir()
+    for i in (1, 2, 3):
+        _write_resume(tmp_path, i, f"Tool{i}")
+    _write_intake(tmp_path, (1, 2, 3))
+    assert [result.processed for result in _build(tmp_path)] == [3, 3, 3]
+    return tmp_path
+
+
+def test_rerun_processes_nothing(dataset, monkeypatch):
+    before = {name: (dataset / name).read_bytes() for name in OUTPUTS}
+    monkeypatch.setattr(extract_text, "extract_documents", lambda *args, **kwargs: pytest.fail("re-extracted"))
+
+    assert [result.processed for result in _build(dataset)] == [0, 0, 0]
+    assert {name: (dataset / name).read_bytes() for name in OUTPUTS} == before
+    manifest = json.loads((dataset / MANIFEST_FILE).read_text())
+    assert set(manifest["stages"]["build"]) == {"1", "2", "3"}
+
+
+def test_new_submission_is_appended(dataset, tmp_path_factory):
+    _write_resume(dataset, 4, "Tool4")
+    _write_intake(dataset, (1, 2, 3, 4))
+    results = _build(dataset)
+    assert [(r.processed, r.appended) for r in results] == [(1, True)] * 3
+
+    fresh = tmp_path_factory.mktemp("fresh")
+    (fresh / "resumes").mkdir()
+    for i in (1, 2, 3, 4):
+        _write_resume(fresh, i, f"Tool{i}")
+    _write_intake(fresh, (1, 2, 3, 4))
+    _build(fresh, full=True)
+    for name in OUTPUTS:
+        assert _rows(dataset / name) == _rows(fresh / name)
+
+
+def test_modified_and_removed_submissions_are_patched(dataset):
+    _write_resume(dataset, 2, "Kubernetes")
+    _write_intake(dataset, (1, 2))
+    results = _build(dataset)
+    assert [(r.processed, r.removed, r.appended) for r in results] == [(1, 1, False)] * 3
+
+    rows = _rows(dataset / "model_inputs.jsonl")
+    assert [row["id"] for row in rows] == [1, 2]
+    assert "Kubernetes" in rows[1]["text"]
@@ -0,0 +1,45 @@
+import os
+
+import pandas as pd
+
+from old_LLM.job_catalog import JobCatalog
+
+
+def _write_jobs(path, rows):
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+def test_get_many_returns_requested_jobs(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    _write_jobs(jobs_csv, [
+        {"ID": 1, "Title": "Engineer", "Company": "Acme"},
+        {"ID": 2, "Title": "Nurse", "Company": "Clinic"},
+    ])
+    catalog = JobCatalog(str(jobs_csv))
+
+    jobs = catalog.get_many([2, 99])
+
+    assert list(jobs) == [2]
+    assert jobs[2]["Title"] == "Nurse"
+    assert jobs[2]["Link"] == ""
+
+
+def test_reloads_only_when_content_changes(tmp_path, monkeypatch):
+    jobs_csv = tmp_path / "jobs.csv"
+    _write_jobs(jobs_csv, [{"ID": 1, "Title": "Engineer"}])
+    catalog = JobCatalog(str(jobs_csv))
+    loads = []
+    original_load = catalog._load
+    monkeypatch.setattr(catalog, "_load", lambda sha: (loads.append(sha), original_load(sha)))
+
+    catalog.get_many([1])
+    catalog.get_many([1])
+    st = os.stat(jobs_csv)
+    os.utime(jobs_csv, (st.st_atime, st.st_mtime + 10))
+    catalog.get_many([1])
+    assert len(loads) == 1
+
+    _write_jobs(jobs_csv, [{"ID": 1, "Title": "Senior Engineer"}])
+    os.utime(jobs_csv, (st.st_atime, st.st_mtime + 20))
+    assert catalog.get(1)["Title"] == "Senior Engineer"
+    assert len(loads) == 2
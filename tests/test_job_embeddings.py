@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+from old_LLM.job_embeddings import JobEmbeddingStore, build_job_embeddings
+
+
+class FakeEncoder:
+    """Deterministic stand-in for SentenceTransformer.encode."""
+
+    dim = 8
+
+    def __init__(self):
+        self.encoded = []
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False):
+        self.encoded.extend(texts)
+        rows = []
+        for text in texts:
+            rng = np.random.default_rng(abs(hash(text)) % (2**32))
+            vec = rng.normal(size=self.dim).astype(np.float32)
+            rows.append(vec / np.linalg.norm(vec))
+        return np.stack(rows)
+
+
+def _write_jobs(path, jobs):
+    pd.DataFrame(
+        [{"ID": job_id, "Title": f"Job {job_id}", "RoleDescription": text} for job_id, text in jobs]
+    ).to_csv(path, index=False)
+
+
+def test_build_and_score_matches_cosine(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    _write_jobs(jobs_csv, [(1, "python developer"), (2, "nurse"), (3, None)])
+    encoder = FakeEncoder()
+
+    store = build_job_embeddings(jobs_csv, tmp_path / "emb", encoder, "fake-model")
+    assert store.ids == [1, 2, 3]
+    assert isinstance(JobEmbeddingStore.load(tmp_path / "emb").matrix, np.memmap)
+
+    profile = encoder.encode(["python backend"])[0]
+    scores = store.scores(profile)
+    expected = encoder.encode(["python developer", "nurse"]) @ profile
+    np.testing.assert_allclose(scores[:2], expected, rtol=1e-6)
+    assert scores[2] == 0.0
+
+
+def test_rebuild_only_encodes_changed_and_new_jobs(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    _write_jobs(jobs_csv, [(1, "python developer"), (2, "nurse")])
+    build_job_embeddings(jobs_csv, tmp_path / "emb", FakeEncoder(), "fake-model")
+
+    _write_jobs(jobs_csv, [(2, "registered nurse"), (1, "python developer"), (4, "accountant")])
+    encoder = FakeEncoder()
+    store = build_job_embeddings(jobs_csv, tmp_path / "emb", encoder, "fake-model")
+
+    assert sorted(encoder.encoded) == ["accountant", "registered nurse"]
+    assert store.ids == [1, 2, 4]
+    assert store.row_of(4) == 2
+
+
+def test_quantized_copies_score_close_to_float32(tmp_path):
+    jobs_csv = tmp_path / "jobs.csv"
+    _write_jobs(jobs_csv, [(i, f"job description {i}") for i in range(50)])
+    encoder = FakeEncoder()
+    baseline = build_job_embeddings(jobs_csv, tmp_path / "emb", encoder, "fake-model", quantize=["int8", "float16"])
+
+    profile = encoder.encode(["profile"])[0]
+    expected = baseline.scores(profile)
+    for dtype, tolerance in (("float16", 1e-3), ("int8", 2e-2)):
+        store = JobEmbeddingStore.load(tmp_path / "emb", dtype=dtype)
+        assert store.dtype == dtype
+        np.testing.assert_allclose(store.scores(profile), expected, atol=tolerance)
+        np.testing.assert_allclose(store.scores(profile, start=40), expected[40:], atol=tolerance)
@@ -0,0 +1,58 @@
+import os
+import shutil
+import sys
+import types
+
+from old_LLM import model_registry
+
+
+class _FakeModel:
+    def __init__(self, path):
+        self.path = path
+
+    def eval(self):
+        return self
+
+
+def test_get_model_loads_once_and_records_stats(monkeypatch):
+    loads = []
+
+    def fake_transformer(path):
+        loads.append(path)
+        return _FakeModel(path)
+
+    monkeypatch.setitem(sys.modules, "sentence_transformers", types.SimpleNamespace(SentenceTransformer=fake_transformer))
+    model_registry.reset()
+    try:
+        first = model_registry.get_model("some/model")
+        second = model_registry.get_model("some/model")
+
+        assert first is second
+        assert loads == ["some/model"]
+        stats = model_registry.model_stats()["some/model"]
+        assert stats["load_seconds"] >= 0
+        assert stats["inherited"] is False
+    finally:
+        model_registry.reset()
+
+
+def test_model_version_changes_when_model_is_retrained_in_place(tmp_path):
+    model_dir = tmp_path / "model"
+    model_dir.mkdir()
+    (model_dir / "config.json").write_text("{}", encoding="utf-8")
+    (model_dir / "model.safetensors").write_bytes(b"v1")
+    model_registry.reset()
+
+    first = model_registry.model_version(str(model_dir))
+    assert first.startswith("sha256:")
+    assert model_registry.model_version(str(model_dir)) == first
+
+    # A copy (fresh checkout, deploy) has new paths and mtimes but the same weights.
+    copy_dir = tmp_path / "deployed"
+    shutil.copytree(model_dir, copy_dir)
+    os.utime(copy_dir / "model.safetensors", ns=(1, 1))
+    assert model_registry.model_version(str(copy_dir)) == first
+
+    (model_dir / "model.safetensors").write_bytes(b"v2-retrained")
+    assert model_registry.model_version(str(model_dir)) != first
+    assert model_registry.model_version("not/a/dir") == "not/a/dir"
@@ -0,0 +1,85 @@
+import os
+import time
+
+from job_descr_LLM.parsers.parallel import AdaptiveChain, extract_document, extract_documents
+
+
+def slow_text(path):
+    time.sleep(60)
+    return "never"
+
+
+def crash_text(path):
+    os._exit(1)
+
+
+def fast_text(path):
+    return path.read_text()
+
+
+def empty_text(path):
+    raise ValueError("returned no text")
+
+
+CHAINS = {
+    ".slow": ("TXT", [("slow", slow_text), ("fast", fast_text)]),
+    ".crash": ("TXT", [("crash", crash_text), ("fast", fast_text)]),
+    ".txt": ("TXT", [("fast", fast_text)]),
+    ".empty": ("TXT", [("empty", empty_text), ("empty2", empty_text)]),
+}
+
+
+def _files(tmp_path):
+    paths = []
+    for i, suffix in enumerate([".txt", ".slow", ".txt", ".crash", ".empty", ".bin", ".txt"]):
+        path = tmp_path / f"{i}{suffix}"
+        path.write_text(f"resume {i}")
+        paths.append(path)
+    return paths
+
+
+def test_timeouts_and_crashes_fall_back_in_order(tmp_path):
+    paths = _files(tmp_path)
+    start = time.monotonic()
+    docs = list(extract_documents(paths, workers=2, timeout=1.5, chains=CHAINS))
+    assert time.monotonic() - start < 30
+
+    assert [doc.text for doc in docs] == ["resume 0", "resume 1", "resume 2", "resume 3", "", "", "resume 6"]
+    assert [doc.parser for doc in docs] == ["fast", "fast", "fast", "fast", "empty2", "unknown", "fast"]
+    assert docs[1].timings["slow"] == 1.5 and "fast" in docs[1].timings
+    assert list(docs[3].timings) == ["crash", "fast"]
+    assert docs[4].error == "TXT extraction returned no text (empty, empty2): returned no text"
+    assert docs[5].error == "No suitable parser"
+
+
+def test_in_process_mode_matches(tmp_path):
+    paths = [path for path in _files(tmp_path) if path.suffix not in {".slow", ".crash"}]
+    pooled = list(extract_documents(paths, workers=2, timeout=10, chains=CHAINS))
+    inline = [extract_document(path, CHAINS) for path in paths]
+    assert [(d.text, d.parser, d.error) for d in pooled] == [(d.text, d.parser, d.error) for d in inline]
+    assert list(extract_documents(paths, timeout=0, chains=CHAINS))[0].timings.keys() == {"fast"}
+
+
+def hanging_order(path):
+    time.sleep(60)
+    return []
+
+
+def child_only_order(path):
+    # Resolving in the parent would run with the test's pid.
+    return [("fast", fast_text)] if os.getpid() != int(path.read_text().split()[-1]) else []
+
+
+def test_chain_is_resolved_in_a_worker_under_the_timeout(tmp_path):
+    chains = {
+        ".hang": ("TXT", AdaptiveChain(hanging_order, [("fast", fast_text)])),
+        ".adaptive": ("TXT", AdaptiveChain(child_only_order, [])),
+    }
+    paths = [tmp_path / "0.hang", tmp_path / "1.adaptive"]
+    for path in paths:
+        path.write_text(f"parent {os.getpid()}")
+
+    start = time.monotonic()
+    docs = list(extract_documents(paths, workers=2, timeout=1.5, chains=chains))
+    assert time.monotonic() - start < 30
+    assert [(doc.text, doc.parser) for doc in docs] == [(f"parent {os.getpid()}", "fast")] * 2
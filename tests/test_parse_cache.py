@@ -0,0 +1,61 @@
+import json
+
+from job_descr_LLM.user_input_pipeline import parse_cache
+from job_descr_LLM.user_input_pipeline.parse_cache import ParseCache
+from job_descr_LLM.user_input_pipeline.resume_parser import cached_parse_resume, parse_resume
+
+RESUME = "Jane Doe\nExperience\nEngineer\nAcme Corp - Boston, MA\nJan 2019 - Present\nSkills\nPython, SQL"
+
+
+def test_hit_returns_same_parse(tmp_path):
+    cache = ParseCache(tmp_path / "cache.sqlite", version="v1")
+    calls = []
+
+    def counting_parse(text):
+        calls.append(text)
+        return parse_resume(text)
+
+    first = cache.parse(RESUME, counting_parse)
+    second = cache.parse(RESUME, counting_parse)
+    assert first == second == json.loads(json.dumps(parse_resume(RESUME)))
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["entries"] == 1
+
+
+def test_other_parser_version_is_invalidated(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    ParseCache(path, version="old").put(RESUME, {"skills": ["stale"]})
+    assert ParseCache(path, version="old").get(RESUME) == {"skills": ["stale"]}
+
+    fresh = ParseCache(path, version="new")
+    assert fresh.get(RESUME) is None
+    assert fresh.stats()["entries"] == 0
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(parse_cache, "EVICT_CHECK_EVERY", 1)
+    clock = iter(range(1000))
+    monkeypatch.setattr(parse_cache.time, "time", lambda: float(next(clock)))
+    cache = ParseCache(tmp_path / "cache.sqlite", max_bytes=100, version="v1")
+
+    cache.put("a", {"x": "1" * 30})
+    cache.put("b", {"x": "2" * 30})
+    assert cache.get("a") is not None  # "a" is now more recent than "b"
+    cache.put("c", {"x": "3" * 30})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_env_controls_process_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("RESUME_PARSE_CACHE", raising=False)
+    assert parse_cache.get_cache() is None  # opt-in
+    monkeypatch.setenv("RESUME_PARSE_CACHE", "0")
+    assert parse_cache.get_cache() is None
+    assert cached_parse_resume(RESUME) == parse_resume(RESUME)
+
+    monkeypatch.setenv("RESUME_PARSE_CACHE", str(tmp_path / "env.sqlite"))
+    cached_parse_resume(RESUME)
+    cache = parse_cache.get_cache()
+    assert cache.version == parse_cache.parser_version()
+    assert cache.get(RESUME) == json.loads(json.dumps(parse_resume(RESUME)))
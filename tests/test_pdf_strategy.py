@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+
+from job_descr_LLM.parsers import pdf_extract
+from job_descr_LLM.parsers.parallel import extract_documents
+from job_descr_LLM.parsers.pdf_extract import extractor_order, parse_pdf
+
+RESUME = Path(__file__).resolve().parents[1] / "datasets" / "v1" / "resumes" / "9995.pdf"
+
+
+def test_strategy_orders():
+    assert extractor_order(RESUME, "quality-first") == ["pdfminer", "pypdf"]
+    assert extractor_order(RESUME, "fast-first") == ["pypdf", "pdfminer"]
+    assert extractor_order(RESUME, "adaptive") == ["pdfminer", "pypdf"]
+    with pytest.raises(ValueError):
+        extractor_order(RESUME, "fastest")
+
+
+def test_adaptive_goes_fast_for_long_documents(monkeypatch):
+    monkeypatch.setattr(pdf_extract, "ADAPTIVE_MAX_PAGES", 0)
+    assert extractor_order(RESUME, "adaptive") == ["pypdf", "pdfminer"]
+    monkeypatch.setattr(pdf_extract, "ADAPTIVE_MAX_PAGES", 3)
+    monkeypatch.setattr(pdf_extract, "ADAPTIVE_MAX_BYTES", 10)
+    assert extractor_order(RESUME, "adaptive") == ["pypdf", "pdfminer"]
+
+
+def test_parse_pdf_and_pool_follow_strategy(monkeypatch):
+    assert parse_pdf(RESUME).parser == "pdfminer"
+    assert parse_pdf(RESUME, strategy="fast-first").parser == "pypdf"
+
+    monkeypatch.setattr(pdf_extract, "DEFAULT_STRATEGY", "fast-first")
+    [doc] = extract_documents([RESUME], timeout=0)
+    assert doc.parser == "pypdf" and list(doc.timings) == ["pypdf"]
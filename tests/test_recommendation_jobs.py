@@ -0,0 +1,91 @@
+import json
+
+
+def test_async_post_queues_job_and_get_reports_status(client, login, monkeypatch):
+    import app as app_module
+
+    monkeypatch.setenv("BACKGROUND_INLINE", "1")
+    monkeypatch.setattr(app_module, "ML_ENABLED", True)
+    monkeypatch.setattr(app_module, "RECOMMENDATIONS_ASYNC", True)
+    scored = []
+    monkeypatch.setattr(
+        app_module, "_score_recommendations",
+        lambda user_id, profile_text: scored.append((user_id, profile_text)) or [],
+    )
+    _, headers = login()
+
+    pipeline = json.dumps([{"section": "Skills", "content": "python"}])
+    response = client.post("/api/recommendations", json={"profilePipeline": pipeline}, headers=headers)
+
+    assert response.status_code == 202
+    job_id = response.get_json()["jobId"]
+    assert scored and scored[0][1] == "Skills:\npython"
+
+    status = client.get(f"/api/recommendations/jobs/{job_id}").get_json()
+    assert status == {"status": "done", "jobId": job_id}
+
+    listing = client.get("/api/recommendations").get_json()
+    assert listing["status"] == "done"
+    assert listing["recommendations"] == []
+
+
+def test_failed_job_is_reported(client, login, monkeypatch):
+    import app as app_module
+
+    monkeypatch.setenv("BACKGROUND_INLINE", "1")
+    monkeypatch.setattr(app_module, "ML_ENABLED", True)
+
+    def boom(user_id, profile_text):
+        raise RuntimeError("model exploded")
+
+    monkeypatch.setattr(app_module, "_score_recommendations", boom)
+    _, headers = login()
+
+    response = client.post(
+        "/api/recommendations",
+        json={"profilePipeline": json.dumps("raw text"), "async": True},
+        headers=headers,
+    )
+    job_id = response.get_json()["jobId"]
+
+    assert client.get(f"/api/recommendations/jobs/{job_id}").get_json()["status"] == "failed"
+
+
+def test_stale_running_job_is_requeued_and_claimed_once(client, login, monkeypatch):
+    import datetime
+
+    import app as app_module
+    from model import RecommendationJob, User, db
+
+    monkeypatch.setenv("BACKGROUND_INLINE", "1")
+    scored = []
+    monkeypatch.setattr(
+        app_module, "_score_recommendations",
+        lambda user_id, profile_text: scored.append(profile_text) or [],
+    )
+    login()
+
+    with app_module.app.app_context():
+        user = User.query.filter_by(email="seeker@example.com").first()
+        long_ago = app_module._utcnow() - datetime.timedelta(hours=2)
+        db.session.add(RecommendationJob(
+            id="lost", user_id=user.id, status="running", profile_text="old", started_at=long_ago,
+        ))
+        db.session.commit()
+
+        assert app_module._requeue_stale_recommendation_jobs() == 1
+        app_module._run_recommendation_job("lost")  # a late duplicate submission
+
+        assert scored == ["old"]
+        assert db.session.get(RecommendationJob, "lost").status == "done"
+
+
+def test_candidate_profile_carries_parsed_years_and_certifications():
+    from app import _candidate_profile, _resume_profile_fields
+
+    fields = _resume_profile_fields({"years_experience": 4, "certifications": ["AWS SAA"], "skills": ["python"]})
+    candidate = _candidate_profile(fields)
+    assert candidate["years_experience"] == 4.0
+    assert candidate["certifications"] == ["AWS SAA"]
+
+    assert "years_experience" not in _candidate_profile({"skills": ["python"]})
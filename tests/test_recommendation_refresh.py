@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+
+from old_LLM import profile2model
+from old_LLM.job_embeddings import JobEmbeddingStore
+
+
+def _store(rows):
+    matrix = np.eye(4, dtype=np.float32)[:rows]
+    return JobEmbeddingStore(
+        ids=list(range(100, 100 + rows)),
+        hashes=[f"h{i}" for i in range(rows)],
+        matrix=matrix,
+        model=profile2model.model_path,
+    )
+
+
+def _patch(monkeypatch, store, full_calls):
+    monkeypatch.setattr(profile2model, "load_job_store", lambda: store)
+    monkeypatch.setattr(profile2model, "encode_profile", lambda text: np.ones(4, dtype=np.float32) * [1, 2, 3, 4])
+    monkeypatch.setattr(
+        profile2model, "top_mlscores",
+        lambda text, k: full_calls.append(text) or [(100, 0.1)],
+    )
+
+
+def test_unchanged_profile_and_catalog_skips_scoring(monkeypatch):
+    full_calls = []
+    _patch(monkeypatch, _store(3), full_calls)
+
+    scores, state, status = profile2model.refresh_top_mlscores("Skills: python", 2)
+    assert status == "full" and len(full_calls) == 1
+
+    previous = {**state, "scores": scores}
+    again, _, status = profile2model.refresh_top_mlscores("Skills: python", 2, previous)
+    assert status == "unchanged"
+    assert again == scores
+    assert len(full_calls) == 1
+
+
+def test_appended_jobs_are_scored_as_delta(monkeypatch):
+    full_calls = []
+    _patch(monkeypatch, _store(2), full_calls)
+    _, state, _ = profile2model.refresh_top_mlscores("Skills: python", 2)
+    previous = {**state, "scores": [(100, 0.5), (101, 0.2)]}
+
+    _patch(monkeypatch, _store(4), full_calls)
+    scores, new_state, status = profile2model.refresh_top_mlscores("Skills: python", 2, previous)
+
+    assert status == "delta"
+    assert [job_id for job_id, _ in scores] == [103, 102]
+    assert new_state["catalog_size"] == 4
+    assert len(full_calls) == 1
+
+
+def test_changed_profile_rescores(monkeypatch):
+    full_calls = []
+    _patch(monkeypatch, _store(2), full_calls)
+    _, state, _ = profile2model.refresh_top_mlscores("Skills: python", 2)
+
+    _, _, status = profile2model.refresh_top_mlscores("Skills: java", 2, {**state, "scores": []})
+    assert status == "full"
+    assert len(full_calls) == 2
+
+
+def test_hybrid_reranks_only_recalled_jobs(monkeypatch):
+    from job_descr_LLM.matching.recall import SkillIndex
+
+    def jd(job_id, skills):
+        return {"id": job_id, "skills": skills, "experience": [], "certifications": []}
+
+    index = SkillIndex.build([jd(100, ["Python"]), jd(101, ["Python", "SQL"]), jd(103, ["Nursing"])])
+    full_calls = []
+    _patch(monkeypatch, _store(4), full_calls)
+    monkeypatch.setattr(profile2model, "load_skill_index", lambda: index)
+
+    scores = profile2model.hybrid_top_mlscores(
+        "Skills: python", {"skills": ["python", "sql"]}, 5, embedding_weight=0.5
+    )
+
+    assert [job_id for job_id, _ in scores] == [101, 100]
+    assert not full_calls
+
+
+def test_hybrid_ignores_years_requirements_when_profile_has_no_years(monkeypatch):
+    from job_descr_LLM.matching.recall import SkillIndex
+
+    jds = [
+        {"id": 100, "skills": ["Python"], "experience": [], "certifications": [], "years_experience": 5},
+        {"id": 101, "skills": ["Python"], "experience": [], "certifications": []},
+    ]
+    _patch(monkeypatch, _store(2), [])
+    monkeypatch.setattr(profile2model, "load_skill_index", lambda: SkillIndex.build(jds))
+    cosine = np.array([1.0, 2.0]) / np.linalg.norm([1, 2, 3, 4])
+
+    unknown = dict(profile2model.hybrid_top_mlscores("Skills: python", {"skills": ["python"]}, 5, embedding_weight=0.5))
+    # Only the embedding separates the two jobs.
+    assert unknown[101] - unknown[100] == pytest.approx(0.5 * (cosine[1] - cosine[0]))
+
+    junior = dict(profile2model.hybrid_top_mlscores(
+        "Skills: python", {"skills": ["python"], "years_experience": 1.0}, 5, embedding_weight=0.5
+    ))
+    assert junior[101] - junior[100] > unknown[101] - unknown[100]
+
+
+def test_fingerprint_changes_when_model_is_retrained(monkeypatch):
+    monkeypatch.setattr(profile2model, "model_version", lambda path: "model@v1")
+    before = profile2model.profile_fingerprint("Skills: python")
+    monkeypatch.setattr(profile2model, "model_version", lambda path: "model@v2")
+    assert profile2model.profile_fingerprint("Skills: python") != before
+
+
+def test_store_built_for_another_model_is_rejected_once(monkeypatch, caplog):
+    loads = []
+    monkeypatch.setattr(profile2model, "_job_store", None)
+    monkeypatch.setattr(profile2model, "_job_store_rejected", False)
+    monkeypatch.setattr(profile2model, "model_version", lambda path: "sha256:current")
+    monkeypatch.setattr(
+        profile2model.JobEmbeddingStore, "load", staticmethod(lambda directory: loads.append(directory) or _store(3))
+    )
+
+    assert profile2model.load_job_store() is None
+    assert profile2model.load_job_store() is None
+    assert len(loads) == 1
+    assert any(record.levelname == "ERROR" for record in caplog.records)
+
+
+def test_fingerprint_survives_a_redeploy_of_the_same_weights(monkeypatch, tmp_path):
+    import shutil
+
+    from old_LLM import model_registry
+
+    release = tmp_path / "release-1" / "model"
+    release.mkdir(parents=True)
+    (release / "model.safetensors").write_bytes(b"weights")
+    monkeypatch.setattr(profile2model, "model_path", str(release))
+    before = profile2model.profile_fingerprint("Skills: python")
+
+    redeployed = tmp_path / "release-2" / "model"
+    shutil.copytree(release, redeployed)
+    monkeypatch.setattr(profile2model, "model_path", str(redeployed))
+    assert profile2model.profile_fingerprint("Skills: python") == before
+
+    (redeployed / "model.safetensors").write_bytes(b"retrained")
+    assert profile2model.profile_fingerprint("Skills: python") != before
+    model_registry.reset()
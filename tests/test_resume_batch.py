@@ -0,0 +1,31 @@
+import json
+
+from job_descr_LLM.user_input_pipeline.build_model_inputs import build_model_inputs
+from job_descr_LLM.user_input_pipeline.resume_parser import evaluate_on_jsonl, parse_resume, parse_resumes_batch
+
+TEXTS = [
+    f"Jane Doe {i}\nExperience\nEngineer\nAcme Corp - Boston, MA\nJan 20{10 + i % 10} - Present\n"
+    f"Skills\nPython, SQL, {'React' if i % 2 else 'Excel'}\nEducation\nBS Computer Science, State University"
+    for i in range(25)
+]
+
+
+def test_batch_preserves_order_across_workers():
+    expected = [parse_resume(text) for text in TEXTS]
+    assert list(parse_resumes_batch(TEXTS, workers=1)) == expected
+    assert list(parse_resumes_batch(iter(TEXTS), workers=3, chunksize=4)) == expected
+    assert list(parse_resumes_batch([], workers=3)) == []
+
+
+def test_entry_points_use_batch(tmp_path):
+    with (tmp_path / "resumes_clean.jsonl").open("w", encoding="utf-8") as fh:
+        for i, text in enumerate(TEXTS):
+            fh.write(json.dumps({"id": i, "text": text, "state": "MA", "resume_key": f"r{i}"}) + "\n")
+
+    build_model_inputs(tmp_path, "vtest", workers=2)
+    rows = [json.loads(line) for line in (tmp_path / "model_inputs.jsonl").open(encoding="utf-8")]
+    assert [row["id"] for row in rows] == list(range(len(TEXTS)))
+    assert rows[3]["skills"] == parse_resume(TEXTS[3])["skills"]
+
+    serial = evaluate_on_jsonl(tmp_path / "resumes_clean.jsonl", sample_size=10, workers=1)
+    assert evaluate_on_jsonl(tmp_path / "resumes_clean.jsonl", sample_size=10, workers=2) == serial
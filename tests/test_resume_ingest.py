@@ -0,0 +1,115 @@
+PARSED = {
+    "experience": [{"company": "Acme", "title": "Engineer", "duration": "2020-2023", "impact_bullets": ["Shipped"]}],
+    "education": "BS Computer Science",
+    "skills": ["python", "sql"],
+}
+
+
+def _finalize(client, headers, user_id):
+    return client.post(
+        "/api/profile/resume/finalize",
+        json={"object_key": f"profile/{user_id}/abc/resume.pdf", "mime": "application/pdf", "size": 100},
+        headers=headers,
+    )
+
+
+def _profile(client):
+    return client.get("/api/profile").get_json()["profileData"]
+
+
+def test_finalize_queues_ingest_and_profile_gains_parsed_fields(client, login, monkeypatch):
+    import app as app_module
+
+    monkeypatch.setenv("BACKGROUND_INLINE", "1")
+    monkeypatch.setattr(app_module, "RESUME_INGEST_ASYNC", True)
+    parsed_keys = []
+    monkeypatch.setattr(
+        app_module, "_parse_stored_resume", lambda key, mime: parsed_keys.append(key) or PARSED
+    )
+    user_id, headers = login()
+
+    response = _finalize(client, headers, user_id)
+
+    assert response.status_code == 202
+    assert response.get_json()["jobId"]
+    assert parsed_keys == [f"profile/{user_id}/abc/resume.pdf"]
+    profile = _profile(client)
+    assert profile["parseStatus"] == "done"
+    assert profile["skills"] == ["python", "sql"]
+    assert profile["experience"][0]["company"] == "Acme"
+    assert profile["education"][0]["degree"] == "BS Computer Science"
+    assert profile["_parsedResumeSnapshot"]["skills"] == ["python", "sql"]
+
+
+def test_failed_ingest_marks_profile_and_keeps_fields(client, login, monkeypatch):
+    import app as app_module
+    from model import ResumeIngestJob
+
+    monkeypatch.setenv("BACKGROUND_INLINE", "1")
+    monkeypatch.setattr(app_module, "RESUME_INGEST_ASYNC", True)
+
+    def boom(key, mime):
+        raise ValueError("No text extracted from resume")
+
+    monkeypatch.setattr(app_module, "_parse_stored_resume", boom)
+    user_id, headers = login()
+    client.post("/api/profile", json={"profileData": {"skills": ["go"]}}, headers=headers)
+
+    response = _finalize(client, headers, user_id)
+
+    profile = _profile(client)
+    assert profile["parseStatus"] == "failed"
+    assert profile["skills"] == ["go"]
+    with app_module.app.app_context():
+        job = app_module.db.session.get(ResumeIngestJob, response.get_json()["jobId"])
+        assert job.status == "failed" and "No text" in job.error
+
+
+def test_ingest_for_replaced_resume_leaves_profile_alone(client, login, monkeypatch):
+    import app as app_module
+    from model import User
+
+    monkeypatch.setattr(app_module, "_parse_stored_resume", lambda key, mime: PARSED)
+    monkeypatch.setattr(app_module.background, "submit", lambda *args: None)
+    user_id, _ = login()
+
+    with app_module.app.app_context():
+        user = app_module.db.session.get(User, user_id)
+        user.profile_data = {"resumeKey": "profile/1/old/resume.pdf"}
+        job = app_module._enqueue_resume_ingest(user, "profile/1/old/resume.pdf", "application/pdf")
+        user.profile_data = {**user.profile_data, "resumeKey": "profile/1/new/resume.pdf"}
+        app_module.db.session.commit()
+        app_module._run_resume_ingest_job(job.id)
+        profile = app_module.db.session.get(User, user_id).profile_data
+
+    assert "skills" not in profile
+    assert profile["parseStatus"] == "pending"
+
+
+def test_lost_ingest_job_is_requeued_by_the_sweep(client, login, monkeypatch):
+    import datetime
+
+    import app as app_module
+    from model import ResumeIngestJob, User
+
+    monkeypatch.setattr(app_module, "_parse_stored_resume", lambda key, mime: PARSED)
+    submitted = []
+    monkeypatch.setattr(app_module.background, "submit", lambda app, fn, job_id: submitted.append(job_id))
+    user_id, _ = login()
+
+    with app_module.app.app_context():
+        user = app_module.db.session.get(User, user_id)
+        user.profile_data = {"resumeKey": "profile/1/abc/resume.pdf"}
+        job = app_module._enqueue_resume_ingest(user, "profile/1/abc/resume.pdf", "application/pdf")
+        assert app_module._requeue_stale_resume_ingest_jobs() == 0  # not stale yet
+
+        # The worker died mid-parse.
+        job.status = "running"
+        job.started_at = app_module._utcnow() - datetime.timedelta(hours=1)
+        app_module.db.session.commit()
+        assert app_module._requeue_stale_resume_ingest_jobs() == 1
+        app_module._run_resume_ingest_job(submitted[-1])
+        app_module._run_resume_ingest_job(job.id)  # duplicate delivery is a no-op
+
+        assert app_module.db.session.get(ResumeIngestJob, job.id).status == "done"
+        assert app_module.db.session.get(User, user_id).profile_data["parseStatus"] == "done"
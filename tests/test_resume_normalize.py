@@ -0,0 +1,24 @@
+import random
+
+from job_descr_LLM.user_input_pipeline.resume_parser import INLINE_HEADINGS, _normalize_text
+from Scripts.normalize_benchmark import normalize_text_reference
+
+PIECES = [
+    *INLINE_HEADINGS,
+    *(heading.lower() for heading in INLINE_HEADINGS),
+    "PROFESSIONAL\nSUMMARY", "Skills \n summary", "WORK\n\nHISTORY", "hıstory", "ſummary",
+    "Python", "co-\nmputer", "-\n", "x", " ", "  ", "\t", "\r\n", "\n", "\n\n", "\f",
+    "•", "●", "–", "—", "·", "?", "Š", "Œ", "", ":", "&",
+]
+
+
+def test_matches_original_normalizer_on_random_documents():
+    rng = random.Random(1234)
+    for _ in range(3000):
+        text = "".join(rng.choice(PIECES) + rng.choice(["", " ", "\n"]) for _ in range(rng.randint(1, 30)))
+        assert _normalize_text(text) == normalize_text_reference(text), repr(text)
+
+
+def test_chained_inline_headings():
+    text = "SUMMARY SKILLS Python\nEDUCATION SUMMARY BS"
+    assert _normalize_text(text) == normalize_text_reference(text) == "SUMMARY\nSKILLS\nPython\nEDUCATION\nSUMMARY BS"
@@ -0,0 +1,60 @@
+import random
+
+from job_descr_LLM.user_input_pipeline.resume_parser import (
+    HEADING_CERTS,
+    HEADING_EDU,
+    HEADING_EXPERIENCE,
+    HEADING_PROJECTS,
+    HEADING_SKILLS,
+    HEADING_VOLUNTEER,
+    MASTER_HEADING,
+    _find_section_span,
+    _is_clean_heading_line,
+    _section_index,
+)
+
+SECTION_HEADINGS = [HEADING_SKILLS, HEADING_EXPERIENCE, HEADING_EDU, HEADING_PROJECTS, HEADING_CERTS, HEADING_VOLUNTEER]
+
+LINES = [
+    "Professional Summary", "SUMMARY", "Skills Summary", "Technical Skills:", "Clinical Skills", "skills",
+    "Technologies", "Tools |", "Relevant Skills", "Professional Experience", "WORK EXPERIENCE", "Relevant Experience",
+    "Experience -", "Work History", "Education", "Project", "Projects", "Licensure & Certifications", "Licensure",
+    "Licenses & Certifications", "Certification", "Publications", "Volunteer Experience", "Additional Information",
+    "Experience with Python", "Tools & Technologies", "Education: BS", "SOFTWARE ENGINEER", "Python, SQL", "",
+    "Acme Corp - Boston, MA", "Jan 2020 - Present",
+]
+
+
+def _scan_span(lines, heading_re):
+    """Two full scans per section, as parse_resume did before the index."""
+    for i, line in enumerate(lines):
+        if _is_clean_heading_line(line, heading_re):
+            for j in range(i + 1, len(lines)):
+                if _is_clean_heading_line(lines[j], MASTER_HEADING):
+                    return i + 1, j
+            return i + 1, len(lines)
+    return None
+
+
+def test_section_index_matches_full_scans():
+    rng = random.Random(7)
+    for _ in range(2000):
+        lines = [rng.choice(LINES) for _ in range(rng.randint(0, 25))]
+        sections = _section_index(lines)
+        for heading_re in SECTION_HEADINGS:
+            assert _find_section_span(lines, heading_re, sections) == _scan_span(lines, heading_re), lines
+
+
+def test_section_headings_are_master_headings():
+    for line in LINES:
+        for heading_re in SECTION_HEADINGS:
+            for variant in (line, line.upper(), line.lower(), f"  {line}: "):
+                if _is_clean_heading_line(variant, heading_re):
+                    assert _is_clean_heading_line(variant, MASTER_HEADING), variant
+
+
+def test_section_index_spans():
+    lines = ["Jane Doe", "Experience", "Engineer", "Skills:", "Python", "Education"]
+    assert _section_index(lines) == {1: (2, 3), 3: (4, 5), 5: (6, 6)}
+    assert _find_section_span(lines, HEADING_SKILLS) == (4, 5)
+    assert _find_section_span(lines, HEADING_PROJECTS) is None
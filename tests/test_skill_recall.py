@@ -0,0 +1,31 @@
+from job_descr_LLM.matching.recall import SkillIndex
+
+
+def _jd(job_id, skills, title=""):
+    return {
+        "id": job_id,
+        "text": "",
+        "years_experience": 0,
+        "education": "",
+        "skills": skills,
+        "skills_by_category": {},
+        "experience": [{"title": title, "company": "", "duration": "", "impact_bullets": []}] if title else [],
+        "projects": [],
+        "certifications": [],
+        "clearances_or_work_auth": "",
+    }
+
+
+def test_candidates_ranked_by_idf_weighted_overlap():
+    index = SkillIndex.build([
+        _jd(1, ["Python", "SQL"], "Data Engineer"),
+        _jd(2, ["Python"], "Backend Engineer"),
+        _jd(3, ["Nursing"], "Registered Nurse"),
+        _jd(4, ["python ", "Kubernetes", "sql"]),
+    ])
+
+    ranked = index.candidates(["python", "SQL"], titles=["Data Analyst"])
+
+    assert [job_id for job_id, _ in ranked] == [1, 4, 2]
+    assert 3 not in {job_id for job_id, _ in ranked}
+    assert index.candidates(["python", "sql"], limit=1)[0][0] == 1
@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+import storage
+
+
+@pytest.fixture(autouse=True)
+def s3_env(monkeypatch):
+    monkeypatch.setenv("S3_ENDPOINT_URL", "https://example.r2.cloudflarestorage.com")
+    monkeypatch.setenv("S3_ACCESS_KEY_ID", "key")
+    monkeypatch.setenv("S3_SECRET_ACCESS_KEY", "secret")
+    storage.reset_client()
+    yield
+    storage.reset_client()
+
+
+def test_client_is_reused_across_calls_and_threads():
+    first = storage.get_s3_client()
+    seen = []
+    threads = [threading.Thread(target=lambda: seen.append(storage.get_s3_client())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(client is first for client in seen)
+    assert first.meta.config.max_pool_connections == 20
+    stats = storage.client_stats()
+    assert stats["reused"] >= 8 and stats["saved_ms"] >= 0
+
+
+def test_client_is_rebuilt_after_fork_or_new_credentials(monkeypatch):
+    first = storage.get_s3_client()
+
+    monkeypatch.setattr(storage.os, "getpid", lambda: -1)
+    forked = storage.get_s3_client()
+    assert forked is not first
+
+    monkeypatch.setenv("S3_ACCESS_KEY_ID", "rotated")
+    assert storage.get_s3_client() is not forked
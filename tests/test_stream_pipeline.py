@@ -0,0 +1,83 @@
+import json
+
+import pytest
+from docx import Document
+
+from job_descr_LLM.user_input_pipeline import stream_pipeline
+from job_descr_LLM.user_input_pipeline.build_model_inputs import build_model_inputs
+from job_descr_LLM.user_input_pipeline.clean_text import clean_raw_resumes
+from job_descr_LLM.user_input_pipeline.extract_text import ExtractOptions, extract_resumes
+from job_descr_LLM.user_input_pipeline.stream_pipeline import CHECKPOINT_FILE, run_pipeline
+
+
+def _dataset(root, count=6):
+    (root / "resumes").mkdir(parents=True)
+    lines = ["id,resume_key,state"]
+    for i in range(count):
+        doc = Document()
+        for text in [f"Person {i}", "Experience", "Engineer", "Acme Corp - Boston, MA", "Jan 2019 - Present",
+                     "Skills", f"Python, SQL, Tool{i}"]:
+            doc.add_paragraph(text)
+        doc.save(root / "resumes" / f"{100 + i}.docx")
+        lines.append(f"{100 + i},{100 + i}.docx,MA")
+    (root / "intake.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return root
+
+
+def _rows(path):
+    rows = [json.loads(line) for line in path.open(encoding="utf-8")]
+    for row in rows:
+        row.pop("extracted_at", None)
+        row.pop("parser_timings", None)
+    return rows
+
+
+@pytest.fixture(autouse=True)
+def _no_parse_cache(monkeypatch):
+    monkeypatch.setenv("RESUME_PARSE_CACHE", "0")
+    monkeypatch.setenv("EXTRACT_TIMEOUT_SECONDS", "0")
+
+
+def test_single_pass_matches_staged_scripts(tmp_path):
+    staged = _dataset(tmp_path / "staged")
+    extract_resumes(ExtractOptions(dataset_root=staged))
+    clean_raw_resumes(staged)
+    build_model_inputs(staged, "vtest", workers=1)
+
+    streamed = _dataset(tmp_path / "streamed")
+    assert run_pipeline(streamed, "vtest", workers=1) == 6
+    for name in ("resumes_raw.jsonl", "resumes_clean.jsonl", "model_inputs.jsonl"):
+        assert _rows(streamed / name) == _rows(staged / name)
+    assert not (streamed / CHECKPOINT_FILE).exists()
+
+    only_final = _dataset(tmp_path / "only_final")
+    run_pipeline(only_final, "vtest", persist=(), workers=1)
+    assert not (only_final / "resumes_raw.jsonl").exists()
+    assert _rows(only_final / "model_inputs.jsonl") == _rows(staged / "model_inputs.jsonl")
+
+
+def test_resume_after_failure(tmp_path, monkeypatch):
+    expected_root = _dataset(tmp_path / "expected")
+    run_pipeline(expected_root, "vtest", workers=1)
+
+    root = _dataset(tmp_path / "flaky")
+    real_clean = stream_pipeline.clean_record
+    calls = []
+
+    def flaky_clean(record):
+        calls.append(record["id"])
+        if len(calls) == 5:
+            raise RuntimeError("boom")
+        return real_clean(record)
+
+    monkeypatch.setattr(stream_pipeline, "clean_record", flaky_clean)
+    with pytest.raises(RuntimeError):
+        run_pipeline(root, "vtest", workers=1, commit_every=2)
+    checkpoint = json.loads((root / CHECKPOINT_FILE).read_text())
+    assert checkpoint["records"] == 4
+
+    monkeypatch.setattr(stream_pipeline, "clean_record", real_clean)
+    assert run_pipeline(root, "vtest", workers=1, resume=True) == 6
+    for name in ("resumes_raw.jsonl", "resumes_clean.jsonl", "model_inputs.jsonl"):
+        assert _rows(root / name) == _rows(expected_root / name)
+    assert not (root / CHECKPOINT_FILE).exists()
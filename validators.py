@@ -13,6 +13,8 @@ ALLOWED_PROFILE_FIELDS = {
     "experience",
     "education",
     "skills",
+    "yearsExperience",
+    "certifications",
     "performanceReviews",
     "psychometricResults",
     "quizResults",